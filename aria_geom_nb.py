@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+aria_geom_nb.py — Compiled no-fly-zone geometry for ARIA's safety path.
+
+The voice loop checks candidate tool moves and part bounding boxes against
+every active fixture's no-fly zone on each design turn. This module packs
+those zones into one structure-of-arrays table and runs the overlap tests as
+tight loops compiled by numba, so the per-turn cost is native code rather
+than a Python loop over dicts.
+
+Table layout (float64, shape (5, n) — one contiguous row per column):
+  row 0  X_MIN    row 1  X_MAX
+  row 2  Z_MIN    row 3  Z_MAX
+  row 4  HEIGHT
+
+numba is optional. Without it the same kernels run as vectorised NumPy
+expressions — slower to call, identical results.
+
+Call warmup() once at worker start so the compile (or on-disk cache load)
+happens outside the first spoken turn.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Optional: numba for the overlap kernels; NumPy expressions otherwise
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+X_MIN, X_MAX, Z_MIN, Z_MAX, HEIGHT = range(5)
+
+_COLUMNS = ("x_min", "x_max", "z_min", "z_max", "height")
+
+
+def nfz_table(zones: list[dict]) -> np.ndarray:
+    """Pack ShopConfig no-fly-zone dicts into a (5, n) SoA table."""
+    table = np.empty((len(_COLUMNS), len(zones)), dtype=np.float64)
+    for j, zone in enumerate(zones):
+        for i, col in enumerate(_COLUMNS):
+            table[i, j] = zone[col]
+    return table
+
+
+# ── Kernels ───────────────────────────────────────────────────────────────────
+#
+# Returns the index of the first matching zone, or -1. Comparisons are kept
+# exactly as the dict-based check they replace (strict overlap on both axes)
+# so results never drift between the two paths.
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _first_box_overlap(table, x_min, x_max, z_min, z_max):
+        for j in range(table.shape[1]):
+            if (x_min < table[X_MAX, j] and x_max > table[X_MIN, j] and
+                    z_min < table[Z_MAX, j] and z_max > table[Z_MIN, j]):
+                return j
+        return -1
+
+else:
+
+    def _first_box_overlap(table, x_min, x_max, z_min, z_max):
+        hits = np.flatnonzero(
+            (x_min < table[X_MAX]) & (x_max > table[X_MIN]) &
+            (z_min < table[Z_MAX]) & (z_max > table[Z_MIN])
+        )
+        return int(hits[0]) if hits.size else -1
+
+
+def first_box_overlap(
+    table: np.ndarray, x_min: float, x_max: float, z_min: float, z_max: float,
+) -> int:
+    """Index of the first zone whose XZ footprint overlaps the given box, or -1."""
+    return int(_first_box_overlap(table, float(x_min), float(x_max), float(z_min), float(z_max)))
+
+
+def warmup() -> None:
+    """Compile (or load from cache) the kernel with representative types."""
+    table = nfz_table([{"x_min": 0.0, "x_max": 1.0, "z_min": 0.0, "z_max": 1.0, "height": 1.0}])
+    first_box_overlap(table, 0.0, 1.0, 0.0, 1.0)
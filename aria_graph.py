@@ -44,6 +44,7 @@ from typing import List, Literal, Optional, TypedDict
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
+from aria_geom_nb import X_MAX, Z_MAX, first_box_overlap
 from aria_voice_agent import SafetyAgent, MIN_WALL, _CHRIS_NAME, _SHOP_NAME
 from shop_config import ShopConfig, shop_cfg as _default_shop_cfg
 
@@ -199,16 +200,16 @@ def _apply_revision(dims: dict, issue: str, shop: ShopConfig) -> tuple[dict, str
     note    = ""
 
     if ("no-fly zone" in issue or "overlaps" in issue) and "X" in issue:
-        zones = shop.get_active_no_fly_zones()
+        zones, table = shop.no_fly_table()
         if zones:
-            safe_x = max(z["x_max"] for z in zones) + 1.0
+            safe_x = float(table[X_MAX].max()) + 1.0
             revised["move_x"] = safe_x
             note = f"Shifted X to {safe_x:.0f}mm — first clear point past {zones[0]['label']}."
 
     elif ("no-fly zone" in issue or "overlaps" in issue) and "Z" in issue:
-        zones = shop.get_active_no_fly_zones()
+        zones, table = shop.no_fly_table()
         if zones:
-            safe_z = max(z["z_max"] for z in zones) + 1.0
+            safe_z = float(table[Z_MAX].max()) + 1.0
             revised["move_z"] = safe_z
             note = f"Shifted Z to {safe_z:.0f}mm — clears fixture no-fly zone."
 
@@ -362,18 +363,20 @@ def _stl_bbox(stl_path: str) -> Optional[dict]:
         return None
 
 
-def _bbox_vs_nfz(bbox: dict, zones: list[dict]) -> Optional[str]:
-    for zone in zones:
-        if (bbox["x_min"] < zone["x_max"] and bbox["x_max"] > zone["x_min"] and
-                bbox["z_min"] < zone["z_max"] and bbox["z_max"] > zone["z_min"]):
-            return (
-                f"Part geometry (X{bbox['x_min']:.0f}–{bbox['x_max']:.0f}mm, "
-                f"Z{bbox['z_min']:.0f}–{bbox['z_max']:.0f}mm) overlaps "
-                f"{zone['label']}'s no-fly zone "
-                f"(X{zone['x_min']:.0f}–{zone['x_max']:.0f}mm). "
-                f"Collision will occur."
-            )
-    return None
+def _bbox_vs_nfz(bbox: dict, zones: list[dict], table) -> Optional[str]:
+    i = first_box_overlap(
+        table, bbox["x_min"], bbox["x_max"], bbox["z_min"], bbox["z_max"],
+    )
+    if i < 0:
+        return None
+    zone = zones[i]
+    return (
+        f"Part geometry (X{bbox['x_min']:.0f}–{bbox['x_max']:.0f}mm, "
+        f"Z{bbox['z_min']:.0f}–{bbox['z_max']:.0f}mm) overlaps "
+        f"{zone['label']}'s no-fly zone "
+        f"(X{zone['x_min']:.0f}–{zone['x_max']:.0f}mm). "
+        f"Collision will occur."
+    )
 
 
 def _safety_transcript(dims: dict, iteration: int) -> str:
@@ -566,7 +569,7 @@ def safety_inspector_node(state: ForgeState) -> dict:
     ctx    = state["forge_ctx"]
     dims   = state.get("current_dimensions") or {}
     iter_n = state.get("iteration", 0)
-    zones  = shop.get_active_no_fly_zones()
+    zones, table = shop.no_fly_table()
 
     collision_report: Optional[str] = None
     safety_category  = "SAFE"
@@ -586,7 +589,7 @@ def safety_inspector_node(state: ForgeState) -> dict:
                 "z_min": bbox["z_min"] + offset_z,
                 "z_max": bbox["z_max"] + offset_z,
             }
-            hit = _bbox_vs_nfz(sbbox, zones)
+            hit = _bbox_vs_nfz(sbbox, zones, table)
             if hit:
                 collision_report = hit
                 safety_category  = "COLLISION"
@@ -30,6 +30,10 @@ import os
 import re
 from typing import Optional, TYPE_CHECKING
 
+import numpy as np
+
+from aria_geom_nb import X_MAX, X_MIN, Z_MAX, Z_MIN, nfz_table
+
 if TYPE_CHECKING:
     from shop_config import ShopConfig
 
@@ -142,6 +146,7 @@ _FALLBACK_NO_FLY_ZONES = [
         "height":  78.0,
     },
 ]
+_FALLBACK_NFZ_TABLE = nfz_table(_FALLBACK_NO_FLY_ZONES)
 
 # Minimum machinable wall thickness by material (mm)
 MIN_WALL = {
@@ -221,6 +226,12 @@ class SafetyAgent:
             return self._shop.get_active_no_fly_zones()
         return _FALLBACK_NO_FLY_ZONES
 
+    def _no_fly_table(self) -> tuple[list[dict], np.ndarray]:
+        """(zones, packed SoA table) from ShopConfig, or the fallback pair."""
+        if self._shop:
+            return self._shop.no_fly_table()
+        return _FALLBACK_NO_FLY_ZONES, _FALLBACK_NFZ_TABLE
+
     def check(self, transcript: str) -> dict:
         """
         Run all safety checks in priority order.
@@ -244,7 +255,7 @@ class SafetyAgent:
             return {"interrupt": False}
 
         issues = []
-        zones  = self.no_fly_zones   # live from ShopConfig or fallback
+        zones, table = self._no_fly_table()   # live from ShopConfig or fallback
 
         # ── Envelope over-travel ──────────────────────────────────────────────
         for m in _MM_VALUE.finditer(text):
@@ -278,20 +289,27 @@ class SafetyAgent:
         x_coords = [float(v) for v in re.findall(r'[Xx]\s*(\d+\.?\d*)', text)]
         z_coords = [float(v) for v in re.findall(r'[Zz]\s*(\d+\.?\d*)', text)]
 
-        for zone in zones:
-            for xv in x_coords:
-                if zone["x_min"] <= xv <= zone["x_max"]:
-                    issues.append(
-                        f"X{xv:.0f}mm is inside {zone['label']}'s no-fly zone "
-                        f"(X{zone['x_min']:.0f}–{zone['x_max']:.0f}mm). "
-                        f"Tool will collide with the fixture."
-                    )
-            for zv in z_coords:
-                if zone["z_min"] <= zv <= zone["z_max"]:
-                    issues.append(
-                        f"Z{zv:.0f}mm is inside {zone['label']}'s no-fly zone "
-                        f"(Z{zone['z_min']:.0f}–{zone['z_max']:.0f}mm). Collision risk."
-                    )
+        # One vectorised compare per axis: rows = coordinates, cols = zones.
+        xs     = np.asarray(x_coords, dtype=np.float64)[:, None]
+        zs     = np.asarray(z_coords, dtype=np.float64)[:, None]
+        x_hits = (xs >= table[X_MIN]) & (xs <= table[X_MAX])
+        z_hits = (zs >= table[Z_MIN]) & (zs <= table[Z_MAX])
+
+        for j in np.flatnonzero(x_hits.any(axis=0) | z_hits.any(axis=0)):
+            zone = zones[j]
+            for i in np.flatnonzero(x_hits[:, j]):
+                xv = x_coords[i]
+                issues.append(
+                    f"X{xv:.0f}mm is inside {zone['label']}'s no-fly zone "
+                    f"(X{zone['x_min']:.0f}–{zone['x_max']:.0f}mm). "
+                    f"Tool will collide with the fixture."
+                )
+            for i in np.flatnonzero(z_hits[:, j]):
+                zv = z_coords[i]
+                issues.append(
+                    f"Z{zv:.0f}mm is inside {zone['label']}'s no-fly zone "
+                    f"(Z{zone['z_min']:.0f}–{zone['z_max']:.0f}mm). Collision risk."
+                )
 
         # ── Fixture name mention → dimension cross-reference ──────────────────
         # If Chris names a fixture and mentions dimensions in the same sentence,
@@ -36,10 +36,38 @@ import json
 import logging
 import math
 import time
+from bisect import bisect_left, bisect_right
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+# Optional: orjson for the state/config (de)serialisation; stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+try:
+    import orjson as _orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+if _ORJSON_AVAILABLE:
+    _jloads = _orjson.loads
+
+    def _jdumps(obj, indent: bool = False) -> bytes:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+else:
+    _jloads = json.loads
+
+    def _jdumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+# Optional: numba compiles the EWMA decay kernel; pure Python otherwise
+try:
+    import numba as _numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 
 BIOFEEDBACK_DIR  = Path.home() / "project_docs" / "biofeedback"
@@ -54,13 +82,18 @@ _CONFIG_PATH = Path(__file__).parent / "eliza-config.json"
 
 logger = logging.getLogger(__name__)
 
+
+def _time() -> float:
+    """Wall clock for the scoring path.  Tests may rebind biofeedback._time."""
+    return time.time()
+
 # ─── Config reader ────────────────────────────────────────────────────────────
 
 def _load_config() -> dict:
     """Read the biofeedback block from eliza-config.json.  Thread-safe: each
     call re-reads the file so a live config change takes effect on the next event."""
     try:
-        raw = json.loads(_CONFIG_PATH.read_text())
+        raw = _jloads(_CONFIG_PATH.read_bytes())
         return raw.get("biofeedback", {})
     except (OSError, json.JSONDecodeError):
         return {}
@@ -133,6 +166,37 @@ def _stream_xadd(event_type: str, base_weight: float, now_ts: float) -> None:
         pass   # stream write is best-effort; never crash the scoring path
 
 
+def _stream_xadd_many(entries: list[tuple[str, float, float]]) -> None:
+    """
+    Pipelined variant of _stream_xadd for (event_type, base_weight, now_ts) entries.
+
+    All XADDs go out in a single MULTI/EXEC round-trip.  Entries whose explicit
+    ID collides are retried with an auto-ID.  Best-effort — never raises.
+    """
+    r = _get_redis()
+    if r is None or not entries:
+        return
+    try:
+        pipe = r.pipeline()
+        fields_list = []
+        for event_type, base_weight, now_ts in entries:
+            ms  = int(now_ts * 1000)
+            seq = int(time.time_ns() % 1_000_000)
+            fields = {
+                "type":      event_type,
+                "timestamp": datetime.fromtimestamp(now_ts, tz=timezone.utc).isoformat(),
+                "weight":    str(base_weight),
+            }
+            fields_list.append(fields)
+            pipe.xadd(_STREAM_KEY, fields, id=f"{ms}-{seq}")
+        results = pipe.execute(raise_on_error=False)
+        for fields, res in zip(fields_list, results):
+            if isinstance(res, Exception):
+                r.xadd(_STREAM_KEY, fields)   # fallback: let Redis pick the ID
+    except Exception:
+        pass
+
+
 def get_recent_event_count(
     event_type: str,
     hours: int = 24,
@@ -151,7 +215,7 @@ def get_recent_event_count(
     r = _get_redis()
     if r is None:
         return 0
-    now    = _now_ts if _now_ts is not None else time.time()
+    now    = _now_ts if _now_ts is not None else _time()
     min_ms = int((now - hours * 3600) * 1000)
     max_ms = int(now * 1000)
     try:
@@ -161,11 +225,34 @@ def get_recent_event_count(
         return 0
 
 
+def _stream_times_by_type(min_ts: float, max_ts: float) -> dict[str, list[int]]:
+    """
+    Millisecond stream-ID times per event type between min_ts and max_ts, from
+    one XRANGE.  Lists are ascending (stream order), ready for bisect.  Empty
+    when Redis is unavailable — the same degraded answer as
+    get_recent_event_count().
+    """
+    r = _get_redis()
+    if r is None:
+        return {}
+    times: dict[str, list[int]] = {}
+    try:
+        entries = r.xrange(
+            _STREAM_KEY, min=f"{int(min_ts * 1000)}-0", max=f"{int(max_ts * 1000)}-9999999",
+        )
+    except Exception:
+        return {}
+    for entry_id, fields in entries:
+        times.setdefault(fields.get("type"), []).append(int(entry_id.split("-", 1)[0]))
+    return times
+
+
 def get_adaptive_weight(
     base_weight: float,
     event_type: str,
     _now_ts: Optional[float] = None,
     _log: bool = True,
+    _count: Optional[int] = None,
 ) -> tuple[float, str]:
     """
     Return (effective_weight, boost_note) for the given base weight.
@@ -182,13 +269,17 @@ def get_adaptive_weight(
     Returns (base_weight, "") when adaptive is disabled or Redis is down.
 
     _log=False suppresses the INFO log (used by status queries to avoid noise).
+    _count replaces the stream lookup with a window count the caller already
+    has (record_events_bulk counts from one XRANGE plus its unsent events).
     """
     cfg = _get_adaptive_config()
     if not cfg:
         return base_weight, ""
 
     decay_hours = cfg.get("boost_decay_hours", 48)
-    count = get_recent_event_count(event_type, hours=decay_hours, _now_ts=_now_ts)
+    count = _count if _count is not None else get_recent_event_count(
+        event_type, hours=decay_hours, _now_ts=_now_ts,
+    )
 
     if base_weight < 0:
         threshold = cfg.get("constraint_repeat_threshold", 3)
@@ -284,7 +375,7 @@ def _ensure_dir() -> None:
 def _load_ewma() -> dict:
     if EWMA_STATE_PATH.exists():
         try:
-            return json.loads(EWMA_STATE_PATH.read_text())
+            return _jloads(EWMA_STATE_PATH.read_bytes())
         except (json.JSONDecodeError, OSError):
             pass
     return {
@@ -298,17 +389,27 @@ def _load_ewma() -> dict:
 
 def _save_ewma(state: dict) -> None:
     _ensure_dir()
-    EWMA_STATE_PATH.write_text(json.dumps(state, indent=2))
+    EWMA_STATE_PATH.write_bytes(_jdumps(state, indent=True))
 
 
 # ─── EWMA core ────────────────────────────────────────────────────────────────
 
+def _decay_kernel(score: float, elapsed: float, lam: float) -> float:
+    """score × exp(−λ × elapsed).  JIT-compiled by numba when it is installed."""
+    return score * math.exp(-lam * elapsed)
+
+
+if _NUMBA_AVAILABLE:
+    _decay_kernel = _numba.njit(cache=True)(_decay_kernel)
+    _decay_kernel(0.0, 0.0, DECAY_LAMBDA)   # compile (or load from cache) at import
+
+
 def _decay(score: float, last_ts: Optional[float], now_ts: float) -> float:
     """Apply exponential decay for the time elapsed since the last event."""
     if last_ts is None:
         return score
     elapsed = max(0.0, now_ts - last_ts)
-    return score * math.exp(-DECAY_LAMBDA * elapsed)
+    return _decay_kernel(score, elapsed, DECAY_LAMBDA)
 
 
 # ─── Legacy (count-based) fallback ───────────────────────────────────────────
@@ -384,7 +485,7 @@ def _audit_remember(
 def record_event(
     event_type: str,
     agent: str = "UNKNOWN",
-    _now_ts: Optional[float] = None,   # injectable for tests; None → time.time()
+    _now_ts: Optional[float] = None,   # injectable for tests; None → _time()
 ) -> float:
     """
     Record a biofeedback event and return the new score.
@@ -421,7 +522,7 @@ def record_event(
     if base_weight == 0.0:
         return get_score()
 
-    now_ts = _now_ts if _now_ts is not None else time.time()
+    now_ts = _now_ts if _now_ts is not None else _time()
 
     # ── Adaptive weight (query stream BEFORE this event is added) ─────────────
     effective_weight, boost_note = get_adaptive_weight(base_weight, event_type, _now_ts=_now_ts)
@@ -467,6 +568,107 @@ def record_event(
     return new_score
 
 
+def record_events_bulk(
+    events: list[tuple[str, str, Optional[float]]],
+) -> list[float]:
+    """
+    Record a batch of (event_type, agent, ts) events and return the score after each.
+
+    Equivalent to calling record_event() once per event in timestamp order,
+    but the EWMA state file is loaded and written once and the stream XADDs
+    are sent as one pipeline.  Adaptive weights count earlier events of the
+    same batch as if they were already in the stream; the stream itself is
+    read with one XRANGE covering the whole batch's window rather than one
+    per event.  Boost alerts (_maybe_send_boost_alert) still cost a Redis
+    call per boosted event.
+
+    A ts of None means _time().  Unknown event types are skipped, so the
+    returned list has one score per recorded event, in chronological order.
+    """
+    _ensure_dir()
+    wall_ts = _time()
+    batch = sorted(
+        (
+            (ts if ts is not None else wall_ts, event_type, agent)
+            for event_type, agent, ts in events
+            if EVENT_WEIGHTS.get(event_type, 0.0) != 0.0
+        ),
+        key=lambda e: e[0],
+    )
+    if not batch:
+        return []
+
+    cfg         = _get_adaptive_config()
+    window_sec  = cfg.get("boost_decay_hours", 48) * 3600 if cfg else 0.0
+    # Without Redis the stream count is always 0, so in-batch events are too
+    count_batch = bool(cfg) and _get_redis() is not None
+    # One XRANGE spans every event's window; each event bisects its own slice
+    stream_times = (
+        _stream_times_by_type(batch[0][0] - window_sec, batch[-1][0])
+        if count_batch else {}
+    )
+    # event_type → timestamps of this batch's earlier events still in the
+    # window.  The batch is sorted, so expired entries leave from the left.
+    in_window: dict[str, deque[float]] = {}
+    use_ewma    = _use_ewma()
+    state       = _load_ewma()
+    stream_rows: list[tuple[str, float, float]] = []
+    audits:      list[tuple] = []
+    scores:      list[float] = []
+
+    for now_ts, event_type, agent in batch:
+        base_weight = EVENT_WEIGHTS[event_type]
+        count = None
+        if count_batch:
+            pending = in_window.setdefault(event_type, deque())
+            while pending and pending[0] < now_ts - window_sec:
+                pending.popleft()
+            times = stream_times.get(event_type, ())
+            count = len(pending) + (
+                bisect_right(times, int(now_ts * 1000))
+                - bisect_left(times, int((now_ts - window_sec) * 1000))
+            )
+            pending.append(now_ts)
+        effective_weight, boost_note = get_adaptive_weight(
+            base_weight, event_type, _now_ts=now_ts, _count=count,
+        )
+        if boost_note:
+            _maybe_send_boost_alert(event_type, base_weight, effective_weight)
+        stream_rows.append((event_type, base_weight, now_ts))
+
+        if base_weight > 0:
+            state["positive_count"] = state.get("positive_count", 0) + 1
+        else:
+            state["negative_count"] = state.get("negative_count", 0) + 1
+        state["event_count"] = state.get("event_count", 0) + 1
+
+        if not use_ewma:
+            scores.append(_legacy_score(state))
+            continue
+
+        pre_decay_score = state["score"]
+        last_ts         = state.get("last_event_ts")
+        elapsed_sec     = max(0.0, now_ts - last_ts) if last_ts is not None else 0.0
+        decayed         = _decay(pre_decay_score, last_ts, now_ts)
+        new_score       = max(SCORE_FLOOR, decayed + effective_weight)
+
+        state["score"]         = new_score
+        state["last_event_ts"] = now_ts
+        scores.append(new_score)
+        audits.append((
+            agent, event_type,
+            pre_decay_score, decayed,
+            base_weight, effective_weight,
+            new_score, elapsed_sec, boost_note,
+        ))
+
+    _stream_xadd_many(stream_rows)
+    _save_ewma(state)
+    for audit in audits:
+        _audit_remember(*audit)
+    return scores
+
+
 def get_score() -> float:
     """
     Current score with decay applied up to now (no new event recorded).
@@ -479,7 +681,7 @@ def get_score() -> float:
         return _legacy_score(state)
     if state.get("last_event_ts") is None:
         return state.get("score", 0.0)
-    decayed = _decay(state["score"], state["last_event_ts"], time.time())
+    decayed = _decay(state["score"], state["last_event_ts"], _time())
     return max(SCORE_FLOOR, decayed)
 
 
@@ -506,9 +708,9 @@ def get_biofeedback_status(_now_ts: Optional[float] = None) -> dict:
     Scale mode is computed inline (mirrors scaler.py thresholds from config)
     to avoid the circular import that would arise from importing scaler here.
     Adaptive weight queries use _log=False to suppress per-type log noise.
-    _now_ts is injectable for deterministic tests; None → time.time().
+    _now_ts is injectable for deterministic tests; None → _time().
     """
-    _ts = _now_ts if _now_ts is not None else time.time()
+    _ts = _now_ts if _now_ts is not None else _time()
 
     # Compute current score respecting the optional mock timestamp
     if _now_ts is not None and _use_ewma():
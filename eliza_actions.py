@@ -32,6 +32,8 @@ fortress_errors.log format (one JSON object per line):
 from __future__ import annotations
 
 import json
+import mmap
+import os
 import sys
 import traceback
 from abc import ABC, abstractmethod
@@ -48,6 +50,14 @@ from eliza_db import get_db
 from eliza_memory import AgentState, get_agent_state
 from notifications import send_telegram_alert
 
+# Optional: orjson parses the JSONL breadcrumbs; stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+try:
+    import orjson as _orjson
+    _jloads = _orjson.loads
+except ImportError:
+    _jloads = json.loads
+
 # ─── Fortress Error Log ────────────────────────────────────────────────────────
 
 FORTRESS_LOG_PATH = Path.home() / "project_docs" / "fortress_errors.log"
@@ -110,26 +120,55 @@ def log_action_error(
     )
 
 
-def tail_fortress_log(lines: int = 20) -> list[dict]:
+def tail_jsonl_mmap(path: Path, n: int) -> list[dict]:
     """
-    Read the last N entries from fortress_errors.log.
-    Returns a list of parsed dicts (empty list if file absent).
-    Used by the Monitor Agent for pattern detection.
+    Parse the last n lines of a JSONL file, newest first.
+
+    Maps the file and scans backwards from EOF for n newlines, so the cost
+    depends on the size of the tail, not of the file.  Blank and unparseable
+    lines count towards n but are skipped.  n <= 0 reads the whole file.
     """
-    if not FORTRESS_LOG_PATH.exists():
-        return []
-    raw_lines = FORTRESS_LOG_PATH.read_text().splitlines()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size - 1 if mm[size - 1] == 0x0A else size   # ignore final \n
+            start = 0
+            if n > 0:
+                start = end
+                for _ in range(n):
+                    nl = mm.rfind(b"\n", 0, start)
+                    if nl < 0:
+                        start = 0
+                        break
+                    start = nl
+                else:
+                    start += 1
+            tail = mm[start:end]
+
     result = []
-    for line in reversed(raw_lines[-lines:]):
+    for line in reversed(tail.split(b"\n")):
         line = line.strip()
         if line:
             try:
-                result.append(json.loads(line))
+                result.append(_jloads(line))
             except json.JSONDecodeError:
                 pass
     return result
 
 
+def tail_fortress_log(lines: int = 20) -> list[dict]:
+    """
+    Read the last N entries from fortress_errors.log.
+    Returns a list of parsed dicts (empty list if file absent).
+    Used by the Monitor Agent for pattern detection.
+    """
+    if not FORTRESS_LOG_PATH.exists():
+        return []
+    return tail_jsonl_mmap(FORTRESS_LOG_PATH, lines)
+
+
 def count_fortress_errors(
     action_name: Optional[str] = None,
     error_code: Optional[int] = None,
@@ -22,13 +22,19 @@ imports eliza_memory.
 from __future__ import annotations
 
 import json
+import logging
 import sqlite3
+import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 # ─── Abstract Interface ───────────────────────────────────────────────────────
 
@@ -81,6 +87,31 @@ class AbstractDatabaseInterface(ABC):
         """Insert or update an order record (COALESCE semantics on None fields)."""
         ...
 
+    def update_order_status(
+        self,
+        order_id: str,
+        status: str,
+        raw_data: Optional[dict] = None,
+    ) -> bool:
+        """
+        Set the status (and optionally raw_data) of an order that already
+        exists.  Returns False, writing nothing, when there is no such order.
+        Defaults to get_order() + upsert_order(); backends with a cheaper
+        in-place update (SQLiteBackend, RedisBackend) override it.
+        """
+        if self.get_order(order_id) is None:
+            return False
+        self.upsert_order(order_id, status, raw_data=raw_data)
+        return True
+
+    def upsert_and_get_order(self, order_id: str, status: str, **fields) -> Optional[dict]:
+        """
+        upsert_order() followed by get_order().  Backends that can fold the
+        write and the read-back into one round-trip (RedisBackend) override it.
+        """
+        self.upsert_order(order_id, status, **fields)
+        return self.get_order(order_id)
+
     @abstractmethod
     def get_order(self, order_id: str) -> Optional[dict]:
         """Fetch a single order. Returns None if not found."""
@@ -140,6 +171,20 @@ class AbstractDatabaseInterface(ABC):
         whether a real message is sent.
         """
 
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into one commit:
+
+            with db.transaction():
+                db.remember(...)
+                db.upsert_order(...)
+
+        Default just runs the block — backends without transactions (or whose
+        writes are already cheap) inherit this.  SQLiteBackend overrides it.
+        """
+        yield
+
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
     @abstractmethod
@@ -186,6 +231,19 @@ class AbstractDatabaseInterface(ABC):
 
 # ─── SQLite Backend ───────────────────────────────────────────────────────────
 
+class _NoCommit:
+    """`with` wrapper for a connection owned by SQLiteBackend.transaction()."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._c = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._c
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
 _DEFAULT_DB_PATH = Path.home() / ".config" / "howell-forge-eliza.db"
 
 
@@ -196,23 +254,139 @@ class SQLiteBackend(AbstractDatabaseInterface):
     To point at a different database file:
         backend = SQLiteBackend(db_path=Path("/path/to/other.db"))
         set_backend(backend)
+
+    db_path may also be a "file:" URI, e.g. a shared in-memory database that
+    every connection in the process sees:
+        SQLiteBackend(db_path=Path("file:scratch?mode=memory&cache=shared"))
     """
 
     def __init__(self, db_path: Path = _DEFAULT_DB_PATH):
         self._db_path = db_path
+        # Per-thread connection, opened on first use and kept for the life of
+        # the backend: .conn/.gen → cached connection, .tx → open transaction.
+        # _gen is bumped by close() so threads drop their stale handles.
+        # _open_conns records each connection's owner thread so that close()
+        # can reach them all and a dead thread's connection is not kept alive.
+        self._local = threading.local()
+        self._gen = 0
+        self._open_conns: list[tuple[threading.Thread, sqlite3.Connection]] = []
+        self._open_lock = threading.Lock()
         self._init_db()
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
-    def _conn(self) -> sqlite3.Connection:
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(self._db_path))
+    # Per-connection tuning.  journal_mode=WAL is persistent in the file and is
+    # set once in _init_db(); the rest must be re-applied on every connect.
+    # synchronous=NORMAL is durable under WAL except on power loss, where the
+    # last commits before the checkpoint may roll back.
+    _PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",     # 64 MiB page cache
+        "PRAGMA busy_timeout=3000",
+    )
+
+    def _is_uri(self) -> bool:
+        return str(self._db_path).startswith("file:")
+
+    def _is_memory(self) -> bool:
+        path = str(self._db_path)
+        return path == ":memory:" or (self._is_uri() and "mode=memory" in path)
+
+    def _conn(self):
+        """
+        Connection for one `with self._conn() as conn:` block — this thread's
+        cached connection.  Inside transaction() it is wrapped so the block's
+        exit does not commit.
+        """
+        tx = getattr(self._local, "tx", None)
+        if tx is not None:
+            return _NoCommit(tx)
+        return self._thread_conn()
+
+    def _thread_conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.gen != self._gen:
+            conn = self._connect()
+            self._local.conn, self._local.gen = conn, self._gen
+            with self._open_lock:
+                dead = [c for t, c in self._open_conns if not t.is_alive()]
+                self._open_conns = [
+                    (t, c) for t, c in self._open_conns if t.is_alive()
+                ]
+                self._open_conns.append((threading.current_thread(), conn))
+            self._close_all(dead)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        if not (self._is_memory() or self._is_uri()):
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: no implicit BEGIN before DML.  Each statement
+        # autocommits unless begin()/transaction() opened one explicitly, so
+        # commit boundaries are exactly where the code says they are.
+        # check_same_thread=False: each connection is still used by one thread
+        # only (self._local), but close() may run on another thread.
+        conn = sqlite3.connect(
+            str(self._db_path), isolation_level=None,
+            uri=self._is_uri(), check_same_thread=False,
+        )
         conn.row_factory = sqlite3.Row
+        if not self._is_memory():
+            for pragma in self._PRAGMAS:
+                conn.execute(pragma)
         return conn
 
     @staticmethod
     def _now() -> str:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+        # Same text as datetime.now(timezone.utc).strftime(...), without the
+        # datetime object.  Stays a string: queries compare created_at textually.
+        return time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+
+    def begin(self) -> None:
+        """
+        Open a write transaction on this thread.  BEGIN IMMEDIATE takes the
+        write lock up front, so a later write in the block cannot fail on a
+        read→write lock upgrade.  Every call on this thread joins it until
+        commit() or rollback().
+        """
+        if getattr(self._local, "tx", None) is not None:
+            raise RuntimeError("SQLiteBackend: transaction already open on this thread")
+        conn = self._thread_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.tx = conn
+
+    def commit(self) -> None:
+        """Commit and release the transaction opened by begin().  No-op if none."""
+        self._end_tx(commit=True)
+
+    def rollback(self) -> None:
+        """Discard the transaction opened by begin().  No-op if none."""
+        self._end_tx(commit=False)
+
+    def _end_tx(self, commit: bool) -> None:
+        conn = getattr(self._local, "tx", None)
+        if conn is None:
+            return
+        self._local.tx = None
+        conn.commit() if commit else conn.rollback()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run every write in the block on one connection and commit once at the
+        end (one fsync instead of one per call).  Rolls back if the block
+        raises.  Nested calls join the outer transaction.
+        """
+        if getattr(self._local, "tx", None) is not None:
+            yield
+            return
+        self.begin()
+        try:
+            yield
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
 
     # Seed data: features present at project start
     _SEED_FEATURES: list[tuple[str, str, str]] = [
@@ -227,6 +401,8 @@ class SQLiteBackend(AbstractDatabaseInterface):
 
     def _init_db(self) -> None:
         with self._conn() as conn:
+            if not self._is_memory():
+                conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS memories (
                     id          TEXT PRIMARY KEY,
@@ -276,7 +452,9 @@ class SQLiteBackend(AbstractDatabaseInterface):
                     last_updated  TEXT NOT NULL
                 );
             """)
-            # Seed feature states on first init (INSERT OR IGNORE = idempotent)
+            # Seed feature states on first init (INSERT OR IGNORE = idempotent),
+            # one commit for the lot
+            conn.execute("BEGIN")
             for name, status, desc in self._SEED_FEATURES:
                 conn.execute(
                     "INSERT OR IGNORE INTO feature_states "
@@ -369,6 +547,24 @@ class SQLiteBackend(AbstractDatabaseInterface):
                      payment_uri, kaito_tx_id, now, now, raw_json),
                 )
 
+    def update_order_status(
+        self,
+        order_id: str,
+        status: str,
+        raw_data: Optional[dict] = None,
+    ) -> bool:
+        raw_json = json.dumps(raw_data) if raw_data is not None else None
+        with self._conn() as conn:
+            cur = conn.execute(
+                """UPDATE orders SET
+                    status     = ?,
+                    updated_at = ?,
+                    raw_data   = COALESCE(?, raw_data)
+                WHERE order_id = ?""",
+                (status, self._now(), raw_json, order_id),
+            )
+        return cur.rowcount > 0
+
     def get_order(self, order_id: str) -> Optional[dict]:
         with self._conn() as conn:
             row = conn.execute(
@@ -506,14 +702,21 @@ class SQLiteBackend(AbstractDatabaseInterface):
 
     def close(self) -> None:
         """
-        No-op for SQLiteBackend: _conn() opens a fresh connection per call and
-        closes it via the context manager, so there is no persistent connection
-        to release.  Implemented here to satisfy the abstract interface so that
-        set_backend() can call close() unconditionally on any backend type.
-
-        If you subclass SQLiteBackend with a connection pool, override this.
+        Close every per-thread connection this backend has opened.  Idempotent;
+        a thread that uses the backend afterwards simply opens a fresh one.
         """
-        pass
+        with self._open_lock:
+            self._gen += 1
+            conns, self._open_conns = self._open_conns, []
+        self._close_all([c for _, c in conns])
+
+    @staticmethod
+    def _close_all(conns: list[sqlite3.Connection]) -> None:
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error as exc:
+                logger.warning("SQLiteBackend: closing connection failed: %s", exc)
 
 
 # ─── Backend Registry ─────────────────────────────────────────────────────────
@@ -84,6 +84,20 @@ def recall(
     return get_db().recall(agent, type_, limit)
 
 
+def transaction():
+    """
+    Group several writes into one commit on the active backend:
+
+        with eliza_memory.transaction():
+            eliza_memory.upsert_order(...)
+            eliza_memory.remember(...)
+
+    SQLite issues BEGIN IMMEDIATE … COMMIT (rolled back if the block raises);
+    backends without transactions just run the block.
+    """
+    return get_db().transaction()
+
+
 # ─── Order State API ──────────────────────────────────────────────────────────
 
 def upsert_order(
@@ -113,6 +127,26 @@ def upsert_order(
     state.last_updated = now
 
 
+def update_order_status(
+    order_id: str,
+    status: str,
+    raw_data: Optional[dict] = None,
+) -> bool:
+    """
+    Flip the status of an order that already exists (one UPDATE on SQLite).
+    raw_data replaces the stored value only when given.
+    Mirrors status into in-process AgentState.  Returns False, changing
+    nothing, when there is no such order.
+    """
+    if not get_db().update_order_status(order_id, status, raw_data=raw_data):
+        return False
+    now = _now()
+    state = get_agent_state()
+    state.active_orders[order_id] = {"status": status, "updated_at": now}
+    state.last_updated = now
+    return True
+
+
 def get_order(order_id: str) -> Optional[dict]:
     """Fetch a single order. Returns None if not found."""
     return get_db().get_order(order_id)
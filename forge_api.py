@@ -17,6 +17,11 @@ WebSocket:
                                   every 2 seconds to all connected clients
   WS   /ws/chat                   streaming ARIA chat via Claude Code CLI
 
+Redis:
+  PUB  forge_context_updates      snapshot on change (≥ every 10s) for the
+                                  voice worker's push-cached Forge Context,
+                                  only while the channel has subscribers
+
 ARIA personality is injected into every chat message via the forge context.
 
 Run:
@@ -26,7 +31,9 @@ Run:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
+import logging
 import subprocess
 import time
 from datetime import datetime, timezone
@@ -45,6 +52,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 
+logger = logging.getLogger("aria.forge_api")
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 # FORGE_ORDERS_DIR can be overridden via env so the same image works both
 # locally (~/Hardware_Factory/forge_orders) and inside Docker
@@ -75,6 +84,7 @@ CLAUDE_CLI = Path.home() / ".local" / "bin" / "claude"
 
 _context_clients: set[WebSocket] = set()
 _chat_clients:    set[WebSocket] = set()
+_event_queues:    set[asyncio.Queue] = set()   # one per /ws/events client
 
 
 # ARIA personality is fully defined in aria_voice_agent.py
@@ -208,6 +218,68 @@ async def ws_context(websocket: WebSocket):
         _context_clients.discard(websocket)
 
 
+# ─── Redis: context push for the voice worker ────────────────────────────────
+#
+# voice_worker.py keeps its Forge Context hot from this channel instead of
+# GETting /context on every spoken turn. A snapshot is published whenever
+# anything but the timestamp changes, and at least every KEEPALIVE seconds so
+# the worker can tell a quiet shop from a dead publisher.  Snapshots (which
+# include the wallet RPC calls) are only taken while someone is subscribed.
+
+_CONTEXT_CHANNEL        = "forge_context_updates"
+_CONTEXT_PUSH_INTERVAL  = 2.0    # seconds between snapshot polls
+_CONTEXT_PUSH_KEEPALIVE = 10.0   # republish unchanged snapshots this often
+
+_context_publisher_task: asyncio.Task | None = None
+
+
+async def _publish_context_updates():
+    import redis as _r
+    rc = _r.Redis(host="localhost", port=6379, db=0, socket_timeout=1)
+    last_body, last_sent = None, 0.0
+    failing = False
+    while True:
+        try:
+            [(_, subscribers)] = await asyncio.to_thread(rc.pubsub_numsub, _CONTEXT_CHANNEL)
+            if not subscribers:
+                # Nobody listening: skip the snapshot, and make sure the next
+                # subscriber gets one on the first poll after it arrives.
+                last_body = None
+            else:
+                snapshot = await asyncio.to_thread(_context_provider.snapshot)
+                body     = {k: v for k, v in snapshot.items() if k != "timestamp"}
+                now      = time.monotonic()
+                if body != last_body or now - last_sent >= _CONTEXT_PUSH_KEEPALIVE:
+                    payload = json.dumps(snapshot, default=str)
+                    await asyncio.to_thread(rc.publish, _CONTEXT_CHANNEL, payload)
+                    last_body, last_sent = body, now
+            if failing:
+                logger.info("context publisher recovered")
+                failing = False
+        except Exception as exc:
+            # Warn once per outage rather than every poll.
+            if not failing:
+                logger.warning("context publisher failing: %s", exc)
+                failing = True
+        await asyncio.sleep(_CONTEXT_PUSH_INTERVAL)
+
+
+@app.on_event("startup")
+async def _start_context_publisher():
+    global _context_publisher_task
+    _context_publisher_task = asyncio.create_task(_publish_context_updates())
+
+
+@app.on_event("shutdown")
+async def _stop_context_publisher():
+    global _context_publisher_task
+    if _context_publisher_task is not None:
+        _context_publisher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _context_publisher_task
+        _context_publisher_task = None
+
+
 # ─── WebSocket: ARIA streaming chat ──────────────────────────────────────────
 
 async def _stream_claude(prompt: str) -> AsyncGenerator[str, None]:
@@ -336,6 +408,9 @@ async def ws_events(websocket: WebSocket):
       { "type": "CAMERA_MOVE",   "payload": { "position": [...], "target": [...] } }
       { "type": "TOGGLE_GROUP",  "payload": { "group": "workholding", "visible": false } }
 
+    With DASHBOARD_UDP_PORT set, those two event types arrive via the UDP
+    bridge instead and are merged into the same stream.
+
     Published by:
       • voice_worker.py tools (set_dashboard_view, toggle_fixture_visibility)
       • Any future Python agent that calls _redis_publish()
@@ -356,6 +431,7 @@ async def ws_events(websocket: WebSocket):
 
     queue: asyncio.Queue = asyncio.Queue()
     loop = asyncio.get_event_loop()
+    _event_queues.add(queue)   # also fed by the UDP bridge
 
     def _reader():
         """Blocking reader thread — puts messages into the asyncio queue."""
@@ -379,10 +455,43 @@ async def ws_events(websocket: WebSocket):
     except WebSocketDisconnect:
         pass
     finally:
+        _event_queues.discard(queue)
         ps.unsubscribe(channel)
         ps.close()
 
 
+# ─── UDP: viewport-event fast path ───────────────────────────────────────────
+#
+# When DASHBOARD_UDP_PORT is set, voice_worker.py sends CAMERA_MOVE and
+# TOGGLE_GROUP as datagrams to this listener instead of over Redis pub/sub
+# (Redis only gets an audit copy on mission_control_audit). A dropped camera
+# move is harmless; one stuck behind a TCP retransmit is visible lag.
+
+DASHBOARD_UDP_BIND = os.getenv("DASHBOARD_UDP_BIND", "127.0.0.1")
+DASHBOARD_UDP_PORT = int(os.getenv("DASHBOARD_UDP_PORT", "0"))
+
+
+class _DashboardUDPBridge(asyncio.DatagramProtocol):
+    """Forwards each datagram to every connected /ws/events client."""
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            text = data.decode()
+        except UnicodeDecodeError:
+            return
+        for queue in _event_queues:
+            queue.put_nowait(text)
+
+
+@app.on_event("startup")
+async def _start_dashboard_udp_bridge():
+    if DASHBOARD_UDP_PORT:
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(
+            _DashboardUDPBridge, local_addr=(DASHBOARD_UDP_BIND, DASHBOARD_UDP_PORT),
+        )
+
+
 # ─── WebSocket: real-time safety check ───────────────────────────────────────
 
 @app.websocket("/ws/safety")
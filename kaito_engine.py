@@ -21,6 +21,7 @@ deterministic simulated responses so development and testing never touch live
 blockchain APIs.
 """
 
+import functools
 import hashlib
 import json
 import math
@@ -386,19 +387,33 @@ def check_payment_status(kaito_tx_id: str) -> dict:
     return result
 
 
+@functools.lru_cache(maxsize=128)
+def _dev_status_fields(kaito_tx_id: str) -> tuple[str, int, Optional[str]]:
+    """(status, confirmations, block_hash) for a dev tx_id — pure, so memoised."""
+    last_char = kaito_tx_id[-1].lower() if kaito_tx_id else "1"
+    confirmed = last_char in "02468ace"
+    return (
+        "Confirmed" if confirmed else "Pending",
+        6 if confirmed else 0,
+        ("0xdevblock_" + kaito_tx_id[-8:]) if confirmed else None,
+    )
+
+
 def _dev_check_status(kaito_tx_id: str) -> dict:
     """
     Simulated blockchain status check.
     Deterministic: tx_ids whose last hex char is in {0,2,4,6,8,a,c,e}
     are "Confirmed"; the rest are "Pending".
+
+    Only the deterministic fields are cached; each call still gets a fresh
+    dict (callers add keys to it) with a current checked_at.
     """
-    last_char = kaito_tx_id[-1].lower() if kaito_tx_id else "1"
-    confirmed = last_char in "02468ace"
+    status, confirmations, block_hash = _dev_status_fields(kaito_tx_id)
     return {
         "kaito_tx_id": kaito_tx_id,
-        "status": "Confirmed" if confirmed else "Pending",
-        "confirmations": 6 if confirmed else 0,
-        "block_hash": ("0xdevblock_" + kaito_tx_id[-8:]) if confirmed else None,
+        "status": status,
+        "confirmations": confirmations,
+        "block_hash": block_hash,
         "checked_at": _now(),
         "dev_mode": True,
     }
@@ -21,6 +21,16 @@ from typing import Optional
 from notifications import send_telegram_alert
 import biofeedback
 
+# Optional: orjson for config / burst-log (de)serialisation; stdlib json otherwise
+try:
+    import orjson as _orjson
+    _jloads = _orjson.loads
+    _jdumps = _orjson.dumps
+except ImportError:
+    _jloads = json.loads
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 LOG_PATH = Path.home() / "project_docs" / "howell-forge-website-log.md"
 BASE_URL = "https://howell-forge.com"
 HOST = "howell-forge.com"
@@ -43,14 +53,14 @@ OFF_BRAND_BLOCKLIST_PATH = Path.home() / "project_docs" / "howell-forge-off-bran
 
 def _load_config() -> dict:
     try:
-        return json.loads(CONFIG_PATH.read_text())
+        return _jloads(CONFIG_PATH.read_bytes())
     except (OSError, json.JSONDecodeError):
         return {}
 
 
 def _load_scale_state() -> dict:
     try:
-        return json.loads(SCALE_STATE_PATH.read_text())
+        return _jloads(SCALE_STATE_PATH.read_bytes())
     except (OSError, json.JSONDecodeError):
         return {"mode": "normal", "score": 0.0}
 
@@ -59,7 +69,7 @@ def _load_scale_state() -> dict:
 
 def _load_post_times() -> list[float]:
     try:
-        return json.loads(_BURST_LOG_PATH.read_text())
+        return _jloads(_BURST_LOG_PATH.read_bytes())
     except (OSError, json.JSONDecodeError, ValueError):
         return []
 
@@ -70,7 +80,7 @@ def _record_post_timestamp(_now_ts: Optional[float] = None) -> None:
     times = [t for t in _load_post_times() if now - t < _BURST_WINDOW_SEC]
     times.append(now)
     _BURST_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _BURST_LOG_PATH.write_text(json.dumps(times))
+    _BURST_LOG_PATH.write_bytes(_jdumps(times))
 
 
 def _detect_burst(_now_ts: Optional[float] = None) -> bool:
@@ -82,10 +92,13 @@ def _detect_burst(_now_ts: Optional[float] = None) -> bool:
 
 # ─── Herald Budget ────────────────────────────────────────────────────────────
 
-def check_herald_budget() -> dict:
+def check_herald_budget(state: Optional[dict] = None) -> dict:
     """
     Check whether Herald is allowed to post (and how many times today).
 
+    ``state`` is a scale-state dict (``{"mode": ..., "score": ...}``); when
+    omitted it is read from scale_state.json.
+
     Rules:
       - "throttle" mode (biofeedback score ≤ -2) → max 1 post/day (essentials)
       - Active Security Handshake proposals ("Healing") → max 1 post/day
@@ -99,7 +112,7 @@ def check_herald_budget() -> dict:
           "healing_active": bool
         }
     """
-    scale = _load_scale_state()
+    scale = state if state is not None else _load_scale_state()
     throttled = scale.get("mode") == "throttle"
 
     # Check if any security-fixes PRs are open (healing active)
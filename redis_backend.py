@@ -24,6 +24,12 @@ Key design:
   - Append-only security event log (list) + timeline sorted set for window queries
   - Feature states stored as hashes; membership tracked in "howell:features:all" set
   - Pub/sub: publish_order_event() for real-time CS agent notifications (bonus)
+  - Write methods accept pipe=<pipeline> so callers can batch several writes
+    into one round-trip:
+        with backend.client.pipeline(transaction=False) as p:
+            backend.remember(..., pipe=p)
+            backend.log_security_event(..., pipe=p)
+            p.execute()
 
 Dependencies:  pip install redis
 """
@@ -31,8 +37,10 @@ Dependencies:  pip install redis
 from __future__ import annotations
 
 import json
+import threading
+import time
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -43,6 +51,23 @@ try:
 except ImportError:
     _REDIS_AVAILABLE = False
 
+# Optional: orjson for security-event records and pub/sub payloads (3-5x
+# faster than stdlib json); redis-py accepts the bytes it returns directly.
+try:
+    import orjson as _orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+if _ORJSON_AVAILABLE:
+    _jloads = _orjson.loads
+    _jdumps = _orjson.dumps
+else:
+    _jloads = json.loads
+
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 from eliza_db import AbstractDatabaseInterface
 
 
@@ -64,6 +89,61 @@ from eliza_db import AbstractDatabaseInterface
 #  howell:features:all                 → set          of feature names
 
 
+# ─── Connection pools ─────────────────────────────────────────────────────────
+#
+# One pool per URL for the whole process, so a second RedisBackend (or the
+# reachability probe in test_persistence_swap) reuses warm connections instead
+# of opening new ones.  Pool options come from whoever asks for the URL first.
+# Each RedisBackend holds a reference; the pool is disconnected (and forgotten)
+# only when the last backend using it is closed.
+
+_POOLS: dict[str, "ConnectionPool"] = {}
+_POOL_REFS: dict[str, int] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _shared_pool(
+    url: str,
+    max_connections: int = 50,
+    socket_timeout: float = 5.0,
+) -> "ConnectionPool":
+    with _POOLS_LOCK:
+        pool = _POOLS.get(url)
+        if pool is None:
+            pool = _POOLS[url] = ConnectionPool.from_url(
+                url,
+                max_connections=max_connections,
+                socket_timeout=socket_timeout,
+                decode_responses=True,  # strings, not bytes
+            )
+        return pool
+
+
+def _acquire_pool(
+    url: str,
+    max_connections: int = 50,
+    socket_timeout: float = 5.0,
+) -> "ConnectionPool":
+    """_shared_pool() plus one reference, dropped by _release_pool()."""
+    pool = _shared_pool(url, max_connections, socket_timeout)
+    with _POOLS_LOCK:
+        _POOL_REFS[url] = _POOL_REFS.get(url, 0) + 1
+    return pool
+
+
+def _release_pool(url: str) -> None:
+    """Drop one reference; the last one out disconnects the pool."""
+    with _POOLS_LOCK:
+        refs = _POOL_REFS.get(url, 0) - 1
+        if refs > 0:
+            _POOL_REFS[url] = refs
+            return
+        _POOL_REFS.pop(url, None)
+        pool = _POOLS.pop(url, None)
+    if pool is not None:
+        pool.disconnect()
+
+
 class RedisBackend(AbstractDatabaseInterface):
     """
     Full Redis implementation of AbstractDatabaseInterface.
@@ -84,13 +164,10 @@ class RedisBackend(AbstractDatabaseInterface):
             raise ImportError(
                 "redis package not installed. Run: pip install redis"
             )
-        self.pool = ConnectionPool.from_url(
-            url,
-            max_connections=max_connections,
-            socket_timeout=socket_timeout,
-            decode_responses=True,  # strings, not bytes
-        )
+        self.pool = _acquire_pool(url, max_connections, socket_timeout)
+        self._pool_url: Optional[str] = url   # None once close() released it
         self.client = _redis.Redis(connection_pool=self.pool)
+        self._order_channel = self._k("order_events")
         self._seed_features_if_empty()
 
     # ─── Internal helpers ──────────────────────────────────────────────────
@@ -99,13 +176,25 @@ class RedisBackend(AbstractDatabaseInterface):
         """Build a namespaced Redis key."""
         return self.NAMESPACE + category + (":" + ":".join(str(p) for p in parts) if parts else "")
 
-    @staticmethod
-    def _now_iso() -> str:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    _TS_FMT = "%Y-%m-%d %H:%M:%S UTC"
+
+    @classmethod
+    def _now_iso(cls) -> str:
+        return time.strftime(cls._TS_FMT, time.gmtime())
 
     @staticmethod
     def _now_ts() -> float:
-        return datetime.now(timezone.utc).timestamp()
+        return time.time()
+
+    @classmethod
+    def _stamp(cls) -> tuple[str, float]:
+        """
+        (created_at string, sorted-set score) from a single clock read, so a
+        write's string and score always agree.  Uses time.gmtime rather than
+        building a datetime per write; the stored format is unchanged.
+        """
+        ts = time.time()
+        return time.strftime(cls._TS_FMT, time.gmtime(ts)), ts
 
     @staticmethod
     def _ts_from_str(ts_str: str) -> float:
@@ -142,10 +231,14 @@ class RedisBackend(AbstractDatabaseInterface):
         type_: str,
         content: str,
         metadata: Optional[dict] = None,
+        pipe=None,
     ) -> str:
+        """
+        Store a memory record.  Pass `pipe` to queue the writes on a caller's
+        pipeline (the caller executes it); otherwise they run immediately.
+        """
         mem_id = str(uuid.uuid4())
-        now    = self._now_iso()
-        ts     = self._now_ts()
+        now, ts = self._stamp()
         record = json.dumps({
             "id":         mem_id,
             "agent":      agent,
@@ -155,12 +248,13 @@ class RedisBackend(AbstractDatabaseInterface):
             "created_at": now,
         })
 
-        pipe = self.client.pipeline()
-        pipe.set(self._k("memory", mem_id), record)
-        pipe.zadd(self._k("memories:timeline"), {mem_id: ts})
-        pipe.sadd(self._k("memories:by_agent", agent), mem_id)
-        pipe.sadd(self._k("memories:by_type", type_), mem_id)
-        pipe.execute()
+        p = pipe if pipe is not None else self.client.pipeline()
+        p.set(self._k("memory", mem_id), record)
+        p.zadd(self._k("memories:timeline"), {mem_id: ts})
+        p.sadd(self._k("memories:by_agent", agent), mem_id)
+        p.sadd(self._k("memories:by_type", type_), mem_id)
+        if pipe is None:
+            p.execute()
 
         return mem_id
 
@@ -211,6 +305,11 @@ class RedisBackend(AbstractDatabaseInterface):
 
     # ─── Orders ────────────────────────────────────────────────────────────
 
+    _COALESCE_FIELDS = (
+        "order_id", "customer_id", "customer_email", "amount_usd",
+        "payment_uri", "kaito_tx_id", "raw_data",
+    )
+
     def upsert_order(
         self,
         order_id: str,
@@ -221,18 +320,28 @@ class RedisBackend(AbstractDatabaseInterface):
         payment_uri: Optional[str] = None,
         kaito_tx_id: Optional[str] = None,
         raw_data: Optional[dict] = None,
+        pipe=None,
     ) -> None:
         """
         COALESCE semantics: None values do not overwrite existing fields.
         Maintains secondary indexes:
           - howell:orders:by_email:{email}  (sorted set for date queries)
           - howell:orders:pending           (set of Pending order IDs)
+
+        With `pipe`, the existing-record read still goes straight to Redis
+        (COALESCE needs it) but the writes are queued on the caller's pipeline.
         """
         key = self._k("order", order_id)
-        now = self._now_iso()
-        ts  = self._now_ts()
-
-        existing_raw = self.client.hgetall(key)
+        now, ts = self._stamp()
+
+        # Only the COALESCE'd fields (plus order_id as an existence marker) are
+        # needed, so HMGET them rather than HGETALL the whole hash.
+        existing_raw = {
+            f: v for f, v in zip(
+                self._COALESCE_FIELDS,
+                self.client.hmget(key, self._COALESCE_FIELDS),
+            ) if v is not None
+        }
         email_lower = customer_email.lower() if customer_email else None
 
         def _coalesce(field: str, new_val):
@@ -254,23 +363,82 @@ class RedisBackend(AbstractDatabaseInterface):
         if not existing_raw:
             mapping["created_at"] = now
 
-        pipe = self.client.pipeline()
-        pipe.hset(key, mapping=mapping)
+        p = pipe if pipe is not None else self.client.pipeline()
+        p.hset(key, mapping=mapping)
 
         # Secondary index: email → order
         if mapping["customer_email"]:
-            pipe.zadd(
+            p.zadd(
                 self._k("orders:by_email", mapping["customer_email"]),
                 {order_id: ts},
             )
 
         # Pending set maintenance
         if status == "Pending":
-            pipe.sadd(self._k("orders:pending"), order_id)
+            p.sadd(self._k("orders:pending"), order_id)
         else:
-            pipe.srem(self._k("orders:pending"), order_id)
+            p.srem(self._k("orders:pending"), order_id)
 
-        pipe.execute()
+        if pipe is None:
+            p.execute()
+
+    def update_order_status(
+        self,
+        order_id: str,
+        status: str,
+        raw_data: Optional[dict] = None,
+        pipe=None,
+    ) -> bool:
+        """
+        In-place status flip for an existing order: no COALESCE read, just an
+        HSET of the changed fields plus Pending-set maintenance.  Returns
+        False, writing nothing, when the order does not exist — an HSET alone
+        would create a hash holding only status/updated_at.
+
+        Without `pipe` the EXISTS check and the writes run as one WATCHed
+        transaction.  With `pipe` the check goes straight to Redis (as
+        upsert_order's read does) and the writes are queued on the caller's
+        pipeline.
+        """
+        key = self._k("order", order_id)
+        mapping = {"status": status, "updated_at": self._now_iso()}
+        if raw_data is not None:
+            mapping["raw_data"] = json.dumps(raw_data)
+
+        def _queue(p) -> None:
+            p.hset(key, mapping=mapping)
+            if status == "Pending":
+                p.sadd(self._k("orders:pending"), order_id)
+            else:
+                p.srem(self._k("orders:pending"), order_id)
+
+        if pipe is not None:
+            if not self.client.exists(key):
+                return False
+            _queue(pipe)
+            return True
+
+        def _flip(p) -> bool:
+            if not p.exists(key):
+                return False
+            p.multi()
+            _queue(p)
+            return True
+
+        return self.client.transaction(_flip, key, value_from_callable=True)
+
+    def upsert_and_get_order(self, order_id: str, status: str, **fields) -> Optional[dict]:
+        """
+        upsert_order() then get_order(), with the writes and the read-back
+        HGETALL sent in one pipeline round-trip.
+        """
+        with self.client.pipeline() as p:
+            self.upsert_order(order_id, status, pipe=p, **fields)
+            p.hgetall(self._k("order", order_id))
+            data = p.execute()[-1]
+        if not data:
+            return None
+        return self._deserialise_order(data)
 
     def get_order(self, order_id: str) -> Optional[dict]:
         data = self.client.hgetall(self._k("order", order_id))
@@ -287,7 +455,8 @@ class RedisBackend(AbstractDatabaseInterface):
         if not order_ids:
             return []
 
-        pipe = self.client.pipeline()
+        # Read-only fan-out: one round-trip, no MULTI/EXEC wrapper needed
+        pipe = self.client.pipeline(transaction=False)
         for oid in order_ids:
             pipe.hgetall(self._k("order", oid))
         raw_list = pipe.execute()
@@ -300,7 +469,8 @@ class RedisBackend(AbstractDatabaseInterface):
         if not order_ids:
             return []
 
-        pipe = self.client.pipeline()
+        # Read-only fan-out: one round-trip, no MULTI/EXEC wrapper needed
+        pipe = self.client.pipeline(transaction=False)
         for oid in order_ids:
             pipe.hgetall(self._k("order", oid))
         raw_list = pipe.execute()
@@ -334,14 +504,18 @@ class RedisBackend(AbstractDatabaseInterface):
         feature_name: str,
         status: str,
         description: Optional[str] = None,
+        pipe=None,
     ) -> None:
         key = self._k("feature", feature_name)
         mapping: dict = {"status": status, "last_updated": self._now_iso(),
                          "feature_name": feature_name}
         if description is not None:
             mapping["description"] = description
-        self.client.hset(key, mapping=mapping)
-        self.client.sadd(self._k("features:all"), feature_name)
+        p = pipe if pipe is not None else self.client.pipeline()
+        p.hset(key, mapping=mapping)
+        p.sadd(self._k("features:all"), feature_name)
+        if pipe is None:
+            p.execute()
 
     def get_all_features(self) -> list[dict]:
         names = self.client.smembers(self._k("features:all"))
@@ -364,11 +538,11 @@ class RedisBackend(AbstractDatabaseInterface):
         endpoint: Optional[str] = None,
         status_code: Optional[int] = None,
         detail: Optional[str] = None,
+        pipe=None,
     ) -> str:
         event_id = str(uuid.uuid4())
-        now = self._now_iso()
-        ts  = self._now_ts()
-        record = json.dumps({
+        now, ts = self._stamp()
+        record = _jdumps({
             "id":           event_id,
             "agent":        agent,
             "event_type":   event_type,
@@ -378,10 +552,11 @@ class RedisBackend(AbstractDatabaseInterface):
             "created_at":   now,
         })
 
-        pipe = self.client.pipeline()
-        pipe.set(self._k("security_event", event_id), record)
-        pipe.zadd(self._k("security_events:timeline"), {event_id: ts})
-        pipe.execute()
+        p = pipe if pipe is not None else self.client.pipeline()
+        p.set(self._k("security_event", event_id), record)
+        p.zadd(self._k("security_events:timeline"), {event_id: ts})
+        if pipe is None:
+            p.execute()
 
         return event_id
 
@@ -390,9 +565,7 @@ class RedisBackend(AbstractDatabaseInterface):
         event_type: Optional[str] = None,
         since_minutes: int = 60,
     ) -> int:
-        since_ts = (
-            datetime.now(timezone.utc) - timedelta(minutes=since_minutes)
-        ).timestamp()
+        since_ts = time.time() - since_minutes * 60
 
         # All event IDs in the time window
         ids = self.client.zrangebyscore(
@@ -403,25 +576,21 @@ class RedisBackend(AbstractDatabaseInterface):
         if event_type is None:
             return len(ids)
 
-        # Filter by event_type
-        pipe = self.client.pipeline()
+        # Filter by event_type — each record decoded once
+        pipe = self.client.pipeline(transaction=False)
         for eid in ids:
             pipe.get(self._k("security_event", eid))
-        records = [
-            json.loads(r) for r in pipe.execute()
-            if r
-            and json.loads(r).get("event_type") == event_type
-        ]
-        return len(records)
+        return sum(
+            1 for r in pipe.execute()
+            if r and _jloads(r).get("event_type") == event_type
+        )
 
     def get_recent_security_events(
         self,
         since_minutes: int = 60,
         limit: int = 20,
     ) -> list[dict]:
-        since_ts = (
-            datetime.now(timezone.utc) - timedelta(minutes=since_minutes)
-        ).timestamp()
+        since_ts = time.time() - since_minutes * 60
 
         # Newest first: ZREVRANGEBYSCORE
         ids = self.client.zrevrangebyscore(
@@ -430,10 +599,10 @@ class RedisBackend(AbstractDatabaseInterface):
         if not ids:
             return []
 
-        pipe = self.client.pipeline()
+        pipe = self.client.pipeline(transaction=False)
         for eid in ids:
             pipe.get(self._k("security_event", eid))
-        return [json.loads(r) for r in pipe.execute() if r]
+        return [_jloads(r) for r in pipe.execute() if r]
 
     # ─── Pub/Sub (bonus — Grok) ────────────────────────────────────────────
 
@@ -453,8 +622,8 @@ class RedisBackend(AbstractDatabaseInterface):
                     payload = json.loads(msg["data"])
                     # payload = {"type": "paid", "order_id": ..., "data": {...}}
         """
-        channel = self._k("order_events")
-        payload = json.dumps({
+        channel = self._order_channel
+        payload = _jdumps({
             "type":      event_type,
             "order_id":  order_id,
             "data":      data,
@@ -465,12 +634,20 @@ class RedisBackend(AbstractDatabaseInterface):
     # ─── Lifecycle ─────────────────────────────────────────────────────────
 
     def close(self) -> None:
-        """Drain active connections back to the pool, then disconnect."""
+        """
+        Drain active connections back to the pool and release this backend's
+        reference to the shared per-URL pool.  The pool is disconnected only
+        when no other RedisBackend still holds it.  Idempotent; a closed
+        backend that is used again reconnects lazily on its old pool.
+        """
         try:
             self.client.close()
         except Exception:
             pass
+        url, self._pool_url = self._pool_url, None
+        if url is None:
+            return
         try:
-            self.pool.disconnect()
+            _release_pool(url)
         except Exception:
             pass
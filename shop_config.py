@@ -32,6 +32,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
+from aria_geom_nb import nfz_table as _pack_nfz
+
 logger = logging.getLogger("aria.shop_config")
 
 CONFIG_PATH = Path(__file__).parent / "machine_config.json"
@@ -139,6 +143,12 @@ class ShopConfig:
         self.library: dict[str, FixtureDef] = {}
         self.active:  list[ActiveFixture]   = []
         self._mtime: float                  = 0.0
+        # (zones, SoA table) rebuilt on every reload — see no_fly_table()
+        self._nfz: tuple[list[dict], np.ndarray] = ([], _pack_nfz([]))
+        # Normalised name → placed fixture, rebuilt on every reload
+        self._id_index:   dict[str, ActiveFixture] = {}
+        self._name_index: dict[str, ActiveFixture] = {}
+        self._layout_text: Optional[str]            = None   # describe_active_layout() memo
         self.reload()
 
     # ── Load / reload ─────────────────────────────────────────────────────────
@@ -214,6 +224,40 @@ class ShopConfig:
                 definition   = defn,
             ))
 
+        # Pack the active no-fly zones once per reload so safety checks can
+        # test every fixture with one vectorised compare.
+        zones     = self.get_active_no_fly_zones()
+        self._nfz = (zones, _pack_nfz(zones))
+
+        self._build_name_index()
+        self._layout_text = None
+
+    def _build_name_index(self) -> None:
+        """
+        Map every way Chris might name a placed fixture — its id, its library
+        key, and each alias of that key — to the ActiveFixture, so tool calls
+        resolve with one dict lookup. The first placed instance of a type wins.
+        """
+        id_index: dict[str, ActiveFixture] = {}
+        by_type:  dict[str, ActiveFixture] = {}
+        for f in self.active:
+            id_index.setdefault(f.id.lower(), f)
+            by_type.setdefault(f.fixture_type, f)
+
+        names: dict[str, ActiveFixture] = {}
+        for alias, lib_key in _NAME_ALIASES.items():
+            if lib_key in by_type:
+                names[alias] = by_type[lib_key]
+        for lib_key, f in by_type.items():
+            names[lib_key] = f
+            names[lib_key.replace("_", " ")] = f
+        for fid, f in id_index.items():
+            names[fid] = f
+            names[fid.replace("_", " ")] = f
+
+        self._id_index   = id_index
+        self._name_index = names
+
     # ── Fixture lookup ────────────────────────────────────────────────────────
 
     def resolve_fixture_type(self, name: str) -> Optional[str]:
@@ -246,10 +290,19 @@ class ShopConfig:
 
     def get_active_fixture_by_id(self, fixture_id: str) -> Optional[ActiveFixture]:
         """Look up a placed fixture by its id (e.g. 'vise_01')."""
-        for f in self.active:
-            if f.id.lower() == fixture_id.lower():
-                return f
-        return None
+        return self._id_index.get(fixture_id.lower())
+
+    def find_active_fixture(self, name: str) -> Optional[ActiveFixture]:
+        """
+        Resolve a spoken name to a placed fixture with one dict lookup.
+        Accepts ids, library keys and exact aliases, with an optional leading
+        "the" ("the vise", "vise 01", "toe clamp"). Returns None when nothing
+        placed matches — callers fall back to describe_fixture().
+        """
+        key = name.strip().lower()
+        if key.startswith("the "):
+            key = key[4:].lstrip()
+        return self._name_index.get(key)
 
     def get_active_no_fly_zones(self) -> list[dict]:
         """
@@ -262,6 +315,19 @@ class ShopConfig:
             if f.status == "active" and f.definition
         ]
 
+    def no_fly_table(self) -> tuple[list[dict], np.ndarray]:
+        """
+        Active no-fly zones plus the same zones packed as a (5, n) SoA table
+        (rows x_min, x_max, z_min, z_max, height — see aria_geom_nb).
+        Both come from the same reload, so column j describes zones[j].
+        Cached until the next reload; treat both as read-only.
+        """
+        return self._nfz
+
+    def nfz_arrays(self) -> tuple[np.ndarray, ...]:
+        """(x_min, x_max, z_min, z_max, height) arrays over active fixtures."""
+        return tuple(self._nfz[1])
+
     # ── Natural-language summary helpers ─────────────────────────────────────
 
     def describe_fixture(self, name: str) -> str:
@@ -290,7 +356,15 @@ class ShopConfig:
         )
 
     def describe_active_layout(self) -> str:
-        """One-paragraph summary of all active fixtures for the system prompt."""
+        """
+        One-paragraph summary of all active fixtures for the system prompt.
+        Built once per reload — the voice worker calls this every turn.
+        """
+        if self._layout_text is None:
+            self._layout_text = self._format_active_layout()
+        return self._layout_text
+
+    def _format_active_layout(self) -> str:
         if not self.active:
             return "No fixtures are currently active on the table."
         lines = []
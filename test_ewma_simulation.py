@@ -14,23 +14,31 @@ Run:
 
 from __future__ import annotations
 
+import atexit
 import json
-import math
+import shutil
 import sys
 import tempfile
 import unittest.mock as mock
+from contextlib import ExitStack
 from pathlib import Path
 
+import numpy as np
+
 # ─── Isolate from real state files ────────────────────────────────────────────
 # Redirect EWMA_STATE_PATH to a temp file before importing biofeedback so the
 # simulation never touches ~/project_docs/biofeedback/ewma_state.json.
+# Prefer tmpfs (/dev/shm) on Linux so the per-event JSON writes stay in RAM.
 
-_tmp_dir  = Path(tempfile.mkdtemp(prefix="howell_ewma_sim_"))
+_SHM_DIR  = "/dev/shm" if Path("/dev/shm").is_dir() else None
+_tmp_dir  = Path(tempfile.mkdtemp(prefix="howell_ewma_sim_", dir=_SHM_DIR))
+atexit.register(shutil.rmtree, _tmp_dir, ignore_errors=True)   # tmpfs is RAM — always clean up
 _tmp_ewma = _tmp_dir / "ewma_state.json"
 _tmp_rwd  = _tmp_dir / "rewards.md"
 _tmp_con  = _tmp_dir / "constraints.md"
 
 import biofeedback  # noqa: E402 — must come after path setup
+import eliza_memory  # noqa: E402
 
 biofeedback.EWMA_STATE_PATH  = _tmp_ewma
 biofeedback.REWARDS_PATH     = _tmp_rwd
@@ -41,11 +49,16 @@ biofeedback.BIOFEEDBACK_DIR  = _tmp_dir
 
 PASS = "\033[32mPASS\033[0m"
 FAIL = "\033[31mFAIL\033[0m"
-_results: list[tuple[str, str]] = []
+_pass = 0
+_fail_labels: list[str] = []
 
 def _check(label: str, condition: bool, detail: str = "") -> None:
+    global _pass
     status = PASS if condition else FAIL
-    _results.append((label, "PASS" if condition else "FAIL"))
+    if condition:
+        _pass += 1
+    else:
+        _fail_labels.append(label)
     suffix = f"  ({detail})" if detail else ""
     print(f"  [{status}] {label}{suffix}")
 
@@ -55,9 +68,22 @@ def _days(n: float) -> float:
     return n * 86400.0
 
 
-def _expected_decay(score: float, elapsed_days: float) -> float:
-    """Analytical decay: score × exp(−λ × elapsed_seconds)."""
-    return score * math.exp(-biofeedback.DECAY_LAMBDA * elapsed_days * 86400)
+def _expected_trajectory(weights: np.ndarray, day_offsets: np.ndarray) -> np.ndarray:
+    """
+    Analytical EWMA trajectory for a whole schedule in one pass.
+
+    All decay factors exp(−λ × Δt) come from a single vectorised np.exp call;
+    only the O(N) recurrence x[i] = max(FLOOR, x[i-1] × β[i] + w[i]) stays
+    in Python.
+    """
+    deltas = np.diff(day_offsets, prepend=day_offsets[0])
+    decay_factors = np.exp(-biofeedback.DECAY_LAMBDA * deltas * 86400.0)
+    out = np.empty_like(weights)
+    score = 0.0
+    for i in range(len(weights)):
+        score = max(biofeedback.SCORE_FLOOR, score * decay_factors[i] + weights[i])
+        out[i] = score
+    return out
 
 
 # ─── Simulation ───────────────────────────────────────────────────────────────
@@ -76,44 +102,58 @@ EVENT_SCHEDULE = [
     (14.0,  "marketing_pass", "HERALD",      "Day 14 — marketing pass   (+1.0)  [2× half-life]"),
 ]
 
+# Column (SoA) view of the schedule — feeds NumPy and the bulk API directly
+_DAYS, _EVENT_TYPES, _AGENTS, _LABELS = map(list, zip(*EVENT_SCHEDULE))
 
-def simulate_ewma() -> None:
-    print("\n" + "=" * 65)
-    print("  EWMA Simulation — 10 events over 14 days")
-    print(f"  half_life={biofeedback.HALF_LIFE_DAYS}d  "
-          f"λ={biofeedback.DECAY_LAMBDA:.6e} s⁻¹  floor={biofeedback.SCORE_FLOOR}")
-    print("=" * 65)
-    print(f"  {'Day':>6}  {'Event':20}  {'Expected':>10}  {'Got':>10}  {'Δ':>8}  {'Mode'}")
-    print("  " + "-" * 63)
+_SCHEDULE_DAYS    = np.asarray(_DAYS, dtype=float)
+_SCHEDULE_TS      = _SCHEDULE_DAYS * 86400.0          # same as _days(), precomputed
+_SCHEDULE_WEIGHTS = np.fromiter((biofeedback.EVENT_WEIGHTS[e] for e in _EVENT_TYPES), float)
+# (event_type, agent, ts) rows ready for record_events_bulk()
+_SCHEDULE_EVENTS  = list(zip(_EVENT_TYPES, _AGENTS, _SCHEDULE_TS.tolist()))
 
-    prev_score  = 0.0
-    prev_ts     = None
-    scores: list[float] = []
 
-    for day, event_type, agent, label in EVENT_SCHEDULE:
-        now_ts  = _days(day)
-        weight  = biofeedback.EVENT_WEIGHTS[event_type]
-
-        # Compute expected analytically
-        if prev_ts is not None:
-            decayed = _expected_decay(prev_score, day - prev_ts / 86400)
-        else:
-            decayed = prev_score
-        expected = max(biofeedback.SCORE_FLOOR, decayed + weight)
+def simulate_ewma() -> None:
+    lines = [
+        "",
+        "=" * 65,
+        "  EWMA Simulation — 10 events over 14 days",
+        f"  half_life={biofeedback.HALF_LIFE_DAYS}d  "
+        f"λ={biofeedback.DECAY_LAMBDA:.6e} s⁻¹  floor={biofeedback.SCORE_FLOOR}",
+        "=" * 65,
+        f"  {'Day':>6}  {'Event':20}  {'Expected':>10}  {'Got':>10}  {'Δ':>8}  {'Mode'}",
+        "  " + "-" * 63,
+    ]
 
-        # Call the real function with injected timestamp (no DB audit in test)
-        with mock.patch("biofeedback._audit_remember"):
-            actual = biofeedback.record_event(event_type, agent, _now_ts=now_ts)
+    prev_score  = 0.0
 
+    # Expected trajectory (base weights, no adaptive boost) computed up front
+    expected_scores = _expected_trajectory(_SCHEDULE_WEIGHTS, _SCHEDULE_DAYS)
+
+    # The simulation asserts on scores, not on the JSON file, so keep the
+    # EWMA state in memory instead of round-tripping it through disk.
+    state = {
+        "score": 0.0,
+        "last_event_ts": None,
+        "event_count": 0,
+        "positive_count": 0,
+        "negative_count": 0,
+    }
+
+    # Record the whole schedule in one batch (no DB audit in test)
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("biofeedback._load_ewma", return_value=state))
+        stack.enter_context(mock.patch("biofeedback._save_ewma", side_effect=state.update))
+        stack.enter_context(mock.patch("biofeedback._audit_remember"))
+        scores = biofeedback.record_events_bulk(_SCHEDULE_EVENTS)
+
+    for day, event_type, expected, actual in zip(_DAYS, _EVENT_TYPES, expected_scores, scores):
         mode = "high" if actual >= 3.0 else ("throttle" if actual <= -2.0 else "normal")
         delta = actual - prev_score
-        print(f"  {day:>6.1f}  {event_type:20}  {expected:>10.4f}  {actual:>10.4f}  {delta:>+8.4f}  {mode}")
-
-        scores.append(actual)
+        lines.append(f"  {day:>6.1f}  {event_type:20}  {expected:>10.4f}  {actual:>10.4f}  {delta:>+8.4f}  {mode}")
         prev_score = actual
-        prev_ts    = now_ts
 
-    print()
+    # One write for the whole table instead of one print() per event
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
     # ── Assertions ────────────────────────────────────────────────────────────
 
@@ -146,8 +186,13 @@ def simulate_ewma() -> None:
 
     # 5. get_score() with no new event returns decayed value
     far_future_ts = _days(21)
-    with mock.patch("time.time", return_value=far_future_ts):
-        score_3w = biofeedback.get_score()
+    orig_time = biofeedback._time
+    biofeedback._time = lambda: far_future_ts
+    try:
+        with mock.patch("biofeedback._load_ewma", return_value=state):
+            score_3w = biofeedback.get_score()
+    finally:
+        biofeedback._time = orig_time
     _check("get_score() after 3 weeks without events decays toward 0",
            abs(score_3w) < abs(day14_score),
            f"3-week score={score_3w:.4f}  day14={day14_score:.4f}")
@@ -166,19 +211,17 @@ def simulate_legacy_fallback() -> None:
     with mock.patch("biofeedback._use_ewma", return_value=False), \
          mock.patch("biofeedback._audit_remember"):
 
-        # 3 rewards
-        for _ in range(3):
-            biofeedback.record_event("security_pass", "MONITOR")
-        # 1 constraint
-        biofeedback.record_event("circuit_open", "KAITO")
+        # 3 rewards, 1 constraint
+        biofeedback.record_events_bulk(
+            [("security_pass", "MONITOR", None)] * 3 + [("circuit_open", "KAITO", None)]
+        )
 
         score = biofeedback.get_score()
         print(f"  3 positives, 1 negative → legacy score = {score:.1f}")
         _check("Legacy: 3 pos − 1 neg = 2.0", score == 2.0, f"got {score}")
 
         # 12 more negatives: net = 3 pos − 13 neg = -10 → clamps at floor
-        for _ in range(12):
-            biofeedback.record_event("monitor_fail", "MONITOR")
+        biofeedback.record_events_bulk([("monitor_fail", "MONITOR", None)] * 12)
 
         floor_score = biofeedback.get_score()
         print(f"  After 12 more negatives → legacy score = {floor_score:.1f}")
@@ -192,6 +235,35 @@ def simulate_legacy_fallback() -> None:
            True)
 
 
+# ─── Bulk vs sequential equivalence ───────────────────────────────────────────
+
+def test_bulk_matches_sequential() -> None:
+    print("\n" + "=" * 65)
+    print("  record_events_bulk() matches per-event record_event()")
+    print("=" * 65)
+
+    events = _SCHEDULE_EVENTS
+
+    # No Redis: adaptive counts must not depend on stream state left by
+    # earlier runs, or the two paths could see different histories.
+    with mock.patch("biofeedback._audit_remember"), \
+         mock.patch("biofeedback._get_redis", return_value=None):
+        _tmp_ewma.unlink(missing_ok=True)
+        sequential = [biofeedback.record_event(e, a, _now_ts=ts) for e, a, ts in events]
+        seq_state  = json.loads(_tmp_ewma.read_text())
+
+        _tmp_ewma.unlink(missing_ok=True)
+        bulk       = biofeedback.record_events_bulk(list(reversed(events)))
+        bulk_state = json.loads(_tmp_ewma.read_text())
+
+    _check("Bulk scores equal sequential scores (input order irrelevant)",
+           len(bulk) == len(sequential)
+           and all(abs(b - s) < 1e-9 for b, s in zip(bulk, sequential)),
+           f"bulk[-1]={bulk[-1]:.4f}  seq[-1]={sequential[-1]:.4f}")
+    _check("Bulk persists the same EWMA state",
+           bulk_state == seq_state)
+
+
 # ─── Audit remember smoke test ────────────────────────────────────────────────
 
 def test_audit_remember() -> None:
@@ -205,7 +277,6 @@ def test_audit_remember() -> None:
     def _fake_remember(agent, type_, content, metadata=None):
         captured.append({"agent": agent, "type": type_, "content": content, "metadata": metadata})
 
-    import eliza_memory
     with mock.patch.object(eliza_memory, "remember", side_effect=_fake_remember), \
          mock.patch("biofeedback._use_ewma", return_value=True):
         biofeedback.record_event("security_pass", "MONITOR", _now_ts=_days(0))
@@ -227,20 +298,23 @@ def test_audit_remember() -> None:
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 def main() -> None:
-    # Reset state before each section
-    _tmp_ewma.unlink(missing_ok=True)
+    # simulate_ewma() keeps its state in memory; the on-disk sections below
+    # reset the temp file first
     simulate_ewma()
 
     _tmp_ewma.unlink(missing_ok=True)
     simulate_legacy_fallback()
 
+    _tmp_ewma.unlink(missing_ok=True)
+    test_bulk_matches_sequential()
+
     _tmp_ewma.unlink(missing_ok=True)
     test_audit_remember()
 
     # Summary
-    passed  = sum(1 for _, s in _results if s == "PASS")
-    failed  = sum(1 for _, s in _results if s == "FAIL")
-    total   = len(_results)
+    passed  = _pass
+    failed  = len(_fail_labels)
+    total   = passed + failed
     print("\n" + "=" * 65)
     print(f"  Results: {passed} passed, {failed} failed / {total} total")
     print("=" * 65)
@@ -11,21 +11,33 @@ Covers:
 
 Run:
     cd ~/howell-forge-agent && python3 test_herald_biofeedback.py
+    cd ~/howell-forge-agent && python3 test_herald_biofeedback.py --serial
 """
 
+import io
 import json
 import math
+import os
 import sys
 import time
 import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager, redirect_stdout
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import numpy as np
+
 # ─── Isolate biofeedback state to a temp dir ──────────────────────────────────
+# Prefer tmpfs (/dev/shm) on Linux; falls back to the default temp dir elsewhere.
 
-_tmp = tempfile.mkdtemp(prefix="hf_bf_test_")
+_SHM_DIR = "/dev/shm" if Path("/dev/shm").is_dir() else None
+_tmp = tempfile.mkdtemp(prefix="hf_bf_test_", dir=_SHM_DIR)
 _TMP = Path(_tmp)
+# Under the spawn start method every pool worker re-imports this module and
+# makes its own _tmp; the owner pid lets _run_isolated remove only those.
+_TMP_OWNER_PID = os.getpid()
 
 import biofeedback as bf
 
@@ -36,17 +48,39 @@ _ORIG_SCALE     = bf.SCALE_STATE_PATH
 _ORIG_EWMA      = bf.EWMA_STATE_PATH
 _ORIG_STREAM    = bf._STREAM_KEY
 
-bf.BIOFEEDBACK_DIR  = _TMP
-bf.REWARDS_PATH     = _TMP / "rewards.md"
-bf.CONSTRAINTS_PATH = _TMP / "constraints.md"
-bf.SCALE_STATE_PATH = _TMP / "scale_state.json"
-bf.EWMA_STATE_PATH  = _TMP / "ewma_state.json"
-# Isolated stream key so the adaptive boost counts don't bleed between test runs
-bf._STREAM_KEY      = "howell:biofeedback_events:herald_test"
+# Keep real Redis out of the loop: in-process fakeredis when installed, else no
+# client at all (stream counts read 0 — the documented degraded path).
+_ORIG_GET_REDIS = bf._get_redis
+try:
+    import fakeredis
+    _FAKE_REDIS = fakeredis.FakeRedis(decode_responses=True)
+except ImportError:
+    _FAKE_REDIS = None
+bf._get_redis = lambda: _FAKE_REDIS
 
 import marketing as mkt
 _ORIG_BURST_LOG = mkt._BURST_LOG_PATH
-mkt._BURST_LOG_PATH = _TMP / "herald_post_times.json"
+
+# Isolated stream key so the adaptive boost counts don't bleed between test runs
+_TEST_STREAM = "howell:biofeedback_events:herald_test"
+
+
+def _isolate(tmp: Path, stream_key: str) -> None:
+    """Point every biofeedback/marketing state path at `tmp` and the stream at `stream_key`."""
+    bf.BIOFEEDBACK_DIR  = tmp
+    bf.REWARDS_PATH     = tmp / "rewards.md"
+    bf.CONSTRAINTS_PATH = tmp / "constraints.md"
+    bf.SCALE_STATE_PATH = tmp / "scale_state.json"
+    bf.EWMA_STATE_PATH  = tmp / "ewma_state.json"
+    bf._STREAM_KEY      = stream_key
+    mkt._BURST_LOG_PATH = tmp / "herald_post_times.json"
+
+
+_isolate(_TMP, _TEST_STREAM)
+
+# Adaptive config is static for the whole run — read it once
+_ADAPTIVE_CFG = bf._get_adaptive_config()
+_BOOST_FACTOR = _ADAPTIVE_CFG.get("reward_boost_factor", 1.2) if _ADAPTIVE_CFG else 1.0
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -76,6 +110,11 @@ def reset_ewma() -> None:
             pass
 
 
+def _decay_vec(initial: float, t0: float, ts: np.ndarray) -> np.ndarray:
+    """Vectorised bf._decay: initial × exp(−λ × (ts − t0)) over a time grid."""
+    return initial * np.exp(-bf.DECAY_LAMBDA * (ts - t0))
+
+
 def _mock_append_reward(agent, message, kpi=None, event_type="marketing_pass"):
     """Thin wrapper so we can call real record_event but skip markdown writes."""
     return bf.record_event(event_type, agent)
@@ -85,6 +124,19 @@ def _mock_append_constraint(agent, message, event_type="marketing_fail"):
     return bf.record_event(event_type, agent)
 
 
+_BUDGET_NORMAL = {"posts_allowed": None, "reason": "normal", "throttled": False, "healing_active": False}
+
+
+@contextmanager
+def mkt_patches(validation: dict, budget: dict = _BUDGET_NORMAL):
+    """Patch validate_post / append_log / check_herald_budget on mkt for one block."""
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(mkt, "validate_post", return_value=validation))
+        stack.enter_context(patch.object(mkt, "append_log", lambda *a, **kw: None))
+        stack.enter_context(patch.object(mkt, "check_herald_budget", return_value=budget))
+        yield
+
+
 # Patch out the markdown-log write to avoid hitting real paths during tests
 _PATCH_APPEND_LOG = patch.object(mkt, "append_log", lambda *a, **kw: None)
 # Patch biofeedback module methods on mkt's reference (it imported the module)
@@ -105,8 +157,7 @@ def test_seo_pass_reward() -> None:
     # With adaptive boost active on first event (count=0 ≤ rare_threshold),
     # effective weight = base × boost_factor; accept either base or boosted delta.
     base_w   = bf.EVENT_WEIGHTS["seo_pass"]
-    cfg      = bf._get_adaptive_config()
-    factor   = cfg.get("reward_boost_factor", 1.2) if cfg else 1.0
+    factor   = _BOOST_FACTOR
     delta    = score_after - score_before
     boosted_ok = abs(delta - base_w * factor) < 0.01
     base_ok    = abs(delta - base_w) < 0.01
@@ -139,13 +190,20 @@ def test_validation_fail() -> None:
     # Seed a positive score first
     bf.append_reward("HERALD", "Previous good post", event_type="seo_pass")
     score_before = bf.get_score()
-    bf.append_constraint("HERALD", "VALIDATE_FEATURE denied", event_type="marketing_validation_fail")
+    # Spy on append_constraint (still writes through) instead of re-reading
+    # constraints.md, which only ever grows over a session
+    with patch.object(bf, "append_constraint", wraps=bf.append_constraint) as spy:
+        bf.append_constraint("HERALD", "VALIDATE_FEATURE denied",
+                             event_type="marketing_validation_fail")
     score_after = bf.get_score()
     check("Score decreased after validation fail", score_after < score_before,
           f"{score_before:.4f} → {score_after:.4f}")
     check("constraints.md written", bf.CONSTRAINTS_PATH.exists())
-    content = bf.CONSTRAINTS_PATH.read_text()
-    check("Constraint entry present in constraints.md", "HERALD" in content)
+    logged = [c for c in spy.call_args_list
+              if c.args[0] == "HERALD"
+              and c.kwargs.get("event_type") == "marketing_validation_fail"]
+    check("Constraint entry logged to constraints.md", len(logged) == 1,
+          f"calls={len(spy.call_args_list)}")
 
 
 # ─── Test 4: x_bot_risk — burst detection ────────────────────────────────────
@@ -191,17 +249,17 @@ def test_ewma_decay() -> None:
     state = bf._load_ewma()
     score_t0 = state["score"]   # raw stored value right after the event (+1.0)
 
-    # Simulate 7 days later (one half-life) — score should halve
-    t7d = t0 + 7 * 24 * 3600
-    decayed_7d = bf._decay(state["score"], state["last_event_ts"], t7d)
+    # Daily grid over three weeks; one np.exp call covers every sample
+    ts    = t0 + np.arange(0, 21) * 86400.0
+    curve = _decay_vec(score_t0, state["last_event_ts"], ts)
+    check("bf._decay matches the analytical curve over 21 days",
+          np.allclose(curve, [bf._decay(score_t0, state["last_event_ts"], t) for t in ts]))
 
+    # 7 days later (one half-life) → half; 14 days → quarter
+    decayed_7d, decayed_14d = curve[[7, 14]]
     check("Score after 7 days ≈ half of original (half-life decay)",
           abs(decayed_7d - score_t0 / 2) < 0.01,
           f"original={score_t0:.4f} decayed@7d={decayed_7d:.4f} half={score_t0/2:.4f}")
-
-    # After 14 days → ~quarter
-    t14d = t0 + 14 * 24 * 3600
-    decayed_14d = bf._decay(state["score"], state["last_event_ts"], t14d)
     check("Score after 14 days ≈ quarter of original",
           abs(decayed_14d - score_t0 / 4) < 0.01,
           f"decayed@14d={decayed_14d:.4f} quarter={score_t0/4:.4f}")
@@ -223,11 +281,7 @@ def test_generate_post_success() -> None:
     mock_validation = {"approved": True, "reason": "OK", "data": {}}
     score_before = bf.get_score()
 
-    with (
-        patch.object(mkt, "validate_post", return_value=mock_validation),
-        patch.object(mkt, "append_log", lambda *a, **kw: None),
-        patch.object(mkt, "check_herald_budget", return_value={"posts_allowed": None, "reason": "normal", "throttled": False, "healing_active": False}),
-    ):
+    with mkt_patches(mock_validation):
         result = mkt.generate_post("Herald (Social Post)", "Handcrafted steel — made in USA.")
 
     check("Result approved=True", result["approved"] is True)
@@ -244,48 +298,33 @@ def test_generate_post_high_engagement() -> None:
     reset_ewma()
 
     mock_validation = {"approved": True, "reason": "OK", "data": {}}
-    _budget = {"posts_allowed": None, "reason": "normal", "throttled": False, "healing_active": False}
 
-    # likes > 50
-    with (
-        patch.object(mkt, "validate_post", return_value=mock_validation),
-        patch.object(mkt, "append_log", lambda *a, **kw: None),
-        patch.object(mkt, "check_herald_budget", return_value=_budget),
-    ):
+    # One patch stack for all three sub-cases; state is reset between them
+    with mkt_patches(mock_validation):
+        # likes > 50
         mkt.generate_post("Herald (Social Post)", "Steel post.", likes=75, replies=5)
 
-    state = bf.get_ewma_state()
-    check("Score reflects seo_pass + x_engagement_high (likes>50)",
-          state["current_score"] >= 2.9,
-          f"score={state['current_score']:.4f} expected≥2.9")
+        state = bf.get_ewma_state()
+        check("Score reflects seo_pass + x_engagement_high (likes>50)",
+              state["current_score"] >= 2.9,
+              f"score={state['current_score']:.4f} expected≥2.9")
 
-    # retweets > 5 (new threshold)
-    reset_ewma()
-    with (
-        patch.object(mkt, "validate_post", return_value=mock_validation),
-        patch.object(mkt, "append_log", lambda *a, **kw: None),
-        patch.object(mkt, "check_herald_budget", return_value=_budget),
-    ):
+        # retweets > 5 (new threshold)
+        reset_ewma()
         mkt.generate_post("Herald (Social Post)", "Steel post.", likes=0, replies=0, retweets=8)
 
-    state = bf.get_ewma_state()
-    check("Score reflects seo_pass + x_engagement_high (retweets>5)",
-          state["current_score"] >= 2.9,
-          f"score={state['current_score']:.4f} expected≥2.9")
+        state = bf.get_ewma_state()
+        check("Score reflects seo_pass + x_engagement_high (retweets>5)",
+              state["current_score"] >= 2.9,
+              f"score={state['current_score']:.4f} expected≥2.9")
 
-    # under all thresholds — no x_engagement_high
-    reset_ewma()
-    with (
-        patch.object(mkt, "validate_post", return_value=mock_validation),
-        patch.object(mkt, "append_log", lambda *a, **kw: None),
-        patch.object(mkt, "check_herald_budget", return_value=_budget),
-    ):
+        # under all thresholds — no x_engagement_high
+        reset_ewma()
         mkt.generate_post("Herald (Social Post)", "Steel post.", likes=5, replies=2, retweets=1)
 
     state    = bf.get_ewma_state()
     base_w   = bf.EVENT_WEIGHTS["seo_pass"]
-    cfg      = bf._get_adaptive_config()
-    factor   = cfg.get("reward_boost_factor", 1.2) if cfg else 1.0
+    factor   = _BOOST_FACTOR
     score    = state["current_score"]
     # With a clean stream the first seo_pass earns the rare-reward boost (×1.2).
     # No x_engagement_high emitted → score is seo_pass weight only (base or boosted).
@@ -304,10 +343,11 @@ def test_generate_post_fail() -> None:
     mock_validation = {"approved": False, "reason": "Feature not LIVE", "data": {}}
     score_before = bf.get_score()
 
+    # Spy on append_constraint (still writes through) instead of re-reading
+    # constraints.md, which only ever grows over a session
     with (
-        patch.object(mkt, "validate_post", return_value=mock_validation),
-        patch.object(mkt, "append_log", lambda *a, **kw: None),
-        patch.object(mkt, "check_herald_budget", return_value={"posts_allowed": None, "reason": "normal", "throttled": False, "healing_active": False}),
+        mkt_patches(mock_validation),
+        patch.object(bf, "append_constraint", wraps=bf.append_constraint) as spy,
     ):
         result = mkt.generate_post("Herald (Social Post)", "Bad post.")
 
@@ -315,25 +355,70 @@ def test_generate_post_fail() -> None:
     score_after = bf.get_score()
     check("Score dropped after validation fail", score_after < score_before,
           f"{score_before:.4f} → {score_after:.4f}")
-    content = bf.CONSTRAINTS_PATH.read_text() if bf.CONSTRAINTS_PATH.exists() else ""
-    check("marketing_validation_fail logged to constraints.md", "HERALD" in content)
+    logged = [c for c in spy.call_args_list
+              if c.args[0] == "HERALD"
+              and c.kwargs.get("event_type") == "marketing_validation_fail"]
+    check("marketing_validation_fail logged to constraints.md", len(logged) == 1,
+          f"calls={len(spy.call_args_list)}")
 
 
 # ─── Summary ──────────────────────────────────────────────────────────────────
 
+TESTS = [
+    test_seo_pass_reward,
+    test_x_engagement_high,
+    test_validation_fail,
+    test_burst_and_x_bot_risk,
+    test_ewma_decay,
+    test_generate_post_success,
+    test_generate_post_high_engagement,
+    test_generate_post_fail,
+]
+
+
+def _run_isolated(index: int) -> tuple[str, list[tuple[str, bool, str]]]:
+    """
+    Run TESTS[index] in its own temp dir + stream key (worker-process entry point).
+
+    Each test mutates bf/mkt module globals, so parallel runs need separate
+    processes, not threads.  Returns the captured output and check results.
+    """
+    if os.getpid() == _TMP_OWNER_PID:
+        # Spawned worker: the import-time dir is ours and never used here.
+        shutil.rmtree(_tmp, ignore_errors=True)
+    tmp = tempfile.mkdtemp(prefix=f"hf_bf_test_{index}_", dir=_SHM_DIR)
+    _isolate(Path(tmp), f"{_TEST_STREAM}:{index}")
+    _results.clear()
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            TESTS[index]()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        r = bf._get_redis()
+        if r:
+            try:
+                r.delete(bf._STREAM_KEY)
+            except Exception:
+                pass
+    return buf.getvalue(), list(_results)
+
+
 def main() -> int:
     print("=" * 60)
     print("Herald Biofeedback Integration Tests")
     print("=" * 60)
 
-    test_seo_pass_reward()
-    test_x_engagement_high()
-    test_validation_fail()
-    test_burst_and_x_bot_risk()
-    test_ewma_decay()
-    test_generate_post_success()
-    test_generate_post_high_engagement()
-    test_generate_post_fail()
+    if "--serial" in sys.argv[1:]:
+        for test in TESTS:
+            test()
+    else:
+        # Tests are independent once isolated — run them side by side and
+        # print each one's output in the original order.
+        with ProcessPoolExecutor() as pool:
+            for output, results in pool.map(_run_isolated, range(len(TESTS))):
+                sys.stdout.write(output)
+                _results.extend(results)
 
     passed = sum(1 for _, ok, _ in _results if ok)
     total  = len(_results)
@@ -356,6 +441,7 @@ def main() -> int:
     bf.SCALE_STATE_PATH = _ORIG_SCALE
     bf.EWMA_STATE_PATH  = _ORIG_EWMA
     bf._STREAM_KEY      = _ORIG_STREAM
+    bf._get_redis       = _ORIG_GET_REDIS
     mkt._BURST_LOG_PATH = _ORIG_BURST_LOG
 
     return 0 if passed == total else 1
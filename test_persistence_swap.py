@@ -10,6 +10,7 @@ Tests:
   4.  Redis write → read-back
   5.  Swap back to SQLite → Redis data absent (isolated namespaces)
   6.  set_backend() calls close() on the outgoing backend (no leaked connections)
+  9.  SQLite close() from another thread; exited threads' connections closed
 
 Redis tests are SKIPPED automatically when Redis is not reachable.
 Run with a live Redis:
@@ -17,27 +18,53 @@ Run with a live Redis:
     python3 test_persistence_swap.py
 """
 
+import io
 import json
+import sqlite3
 import sys
-import uuid
+import tempfile
+import threading
+from collections import Counter, deque
+from contextlib import redirect_stdout
 from datetime import datetime, timezone
+from pathlib import Path
+from secrets import token_hex
+from typing import TYPE_CHECKING
 
 # ─── Imports ──────────────────────────────────────────────────────────────────
 from eliza_db import get_db, set_backend, SQLiteBackend
 
-try:
+if TYPE_CHECKING:
     from redis_backend import RedisBackend
-    _HAS_REDIS_PKG = True
-except ImportError:
-    _HAS_REDIS_PKG = False
+
+# redis_backend (and the redis package behind it) is imported on first use
+# only, so a machine without Redis never pays for it.  Cached after the first
+# lookup; None when the redis package is missing.
+_REDIS_BACKEND_CLS: "type | None | bool" = False   # False = not looked up yet
+
+
+def _try_import_redis_backend() -> "type | None":
+    global _REDIS_BACKEND_CLS
+    if _REDIS_BACKEND_CLS is False:
+        try:
+            import redis_backend
+            _REDIS_BACKEND_CLS = (
+                redis_backend.RedisBackend if redis_backend._REDIS_AVAILABLE else None
+            )
+        except ImportError:
+            _REDIS_BACKEND_CLS = None
+    return _REDIS_BACKEND_CLS
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
+REDIS_URL = "redis://localhost:6379/0"
+
 PASS = "\033[32mPASS\033[0m"
 FAIL = "\033[31mFAIL\033[0m"
 SKIP = "\033[33mSKIP\033[0m"
 
-_results: list[tuple[str, str]] = []
+# deque: append never reallocates/copies as checks accumulate
+_results: deque[tuple[str, str]] = deque()
 
 
 def _check(label: str, condition: bool, detail: str = "") -> None:
@@ -49,18 +76,29 @@ def _check(label: str, condition: bool, detail: str = "") -> None:
         raise AssertionError(f"FAILED: {label}{suffix}")
 
 
+_REACHABLE_CACHE: dict[str, bool] = {}
+
+
 def _redis_reachable(url: str = "redis://localhost:6379/0") -> bool:
-    """Ping Redis — returns False instead of raising if unreachable."""
-    if not _HAS_REDIS_PKG:
-        return False
-    try:
-        import redis as _r
-        client = _r.from_url(url, socket_timeout=1.0, decode_responses=True)
-        client.ping()
-        client.close()
-        return True
-    except Exception:
-        return False
+    """
+    Ping Redis — returns False instead of raising if unreachable.
+    The result is cached per URL so tests 2, 7 and 8 probe only once.
+    """
+    if url in _REACHABLE_CACHE:
+        return _REACHABLE_CACHE[url]
+    ok = False
+    if _try_import_redis_backend() is not None:
+        try:
+            import redis as _r
+            from redis_backend import _shared_pool
+            # Same pool the RedisBackend will use — the probe's connection
+            # is handed straight back for reuse.
+            _r.Redis(connection_pool=_shared_pool(url)).ping()
+            ok = True
+        except Exception:
+            ok = False
+    _REACHABLE_CACHE[url] = ok
+    return ok
 
 
 # ─── Test 1: SQLite write → read-back ────────────────────────────────────────
@@ -72,21 +110,27 @@ def test_sqlite_write_read():
     set_backend(sqlite_db)
     db = get_db()
 
-    # remember / recall
     agent = "swap_test_agent"
-    db.remember(agent, "test", "Hello SQLite", {"backend": "sqlite"})
+    oid = f"ORDER-{token_hex(4).upper()}"
+
+    # All writes commit together — one fsync instead of one per call.
+    with db.transaction():
+        db.remember(agent, "test", "Hello SQLite", {"backend": "sqlite"})
+        db.upsert_order(
+            order_id=oid,
+            status="Pending",
+            customer_email="swap@test.com",
+            amount_usd=99.50,
+        )
+        db.log_security_event("swap_agent", "AUTH_FAILURE", "/api/test", 401, "swap test")
+        db.set_feature_status("SwapTestFeature", "BETA", "temporary test feature")
+
+    # remember / recall
     memories = db.recall(agent=agent, type_="test")
     _check("recall returns at least one memory", len(memories) >= 1)
     _check("memory content correct", memories[0]["content"] == "Hello SQLite")
 
     # upsert_order / get_order
-    oid = f"ORDER-{uuid.uuid4().hex[:8].upper()}"
-    db.upsert_order(
-        order_id=oid,
-        status="Pending",
-        customer_email="swap@test.com",
-        amount_usd=99.50,
-    )
     order = db.get_order(oid)
     _check("get_order returns record",          order is not None)
     _check("order status correct",              order["status"] == "Pending")
@@ -98,8 +142,15 @@ def test_sqlite_write_read():
     pending = db.get_pending_orders()
     _check("get_pending_orders includes it",    any(o["order_id"] == oid for o in pending))
 
+    # update_order_status only touches orders that exist
+    ghost = f"ORDER-MISSING-{token_hex(4).upper()}"
+    _check("update_order_status on existing order → True",
+           db.update_order_status(oid, "Pending") is True)
+    _check("update_order_status on missing order → False",
+           db.update_order_status(ghost, "Pending") is False)
+    _check("missing order not created",         db.get_order(ghost) is None)
+
     # log_security_event / count
-    db.log_security_event("swap_agent", "AUTH_FAILURE", "/api/test", 401, "swap test")
     count = db.count_security_events(event_type="AUTH_FAILURE", since_minutes=5)
     _check("count_security_events ≥ 1",         count >= 1)
 
@@ -107,7 +158,6 @@ def test_sqlite_write_read():
     _check("get_recent_security_events not empty", len(recent) >= 1)
 
     # feature states
-    db.set_feature_status("SwapTestFeature", "BETA", "temporary test feature")
     status = db.get_feature_status("SwapTestFeature")
     _check("get_feature_status returns BETA",   status == "BETA")
 
@@ -120,19 +170,16 @@ def test_sqlite_write_read():
 
 # ─── Test 2: Live swap to Redis ───────────────────────────────────────────────
 
-def test_redis_swap(sqlite_order_id: str):
-    REDIS_URL = "redis://localhost:6379/0"
-
-    if not _redis_reachable(REDIS_URL):
+def test_redis_swap(sqlite_order_id: str, redis_db: "RedisBackend | None"):
+    if redis_db is None:
         print(f"\n[2-5] Redis swap tests [{SKIP}] — Redis not reachable at {REDIS_URL}")
         _results.append(("Redis swap (all)", "SKIP"))
         return
 
     print("\n[2] Swap SQLite → Redis")
-    redis_db = RedisBackend(url=REDIS_URL)
     set_backend(redis_db)           # closes SQLite, installs Redis
     db = get_db()
-    _check("get_db() returns RedisBackend", type(db).__name__ == "RedisBackend")
+    _check("get_db() returns RedisBackend", isinstance(db, _try_import_redis_backend()))
 
     print("\n[3] Redis is empty after swap (data isolation — no migration)")
     order = db.get_order(sqlite_order_id)
@@ -144,21 +191,31 @@ def test_redis_swap(sqlite_order_id: str):
 
     print("\n[4] Redis write → read-back")
     agent = "redis_swap_agent"
+    oid_r = f"RORDER-{token_hex(4).upper()}"
+
+    # Queue the independent writes on one pipeline — one round-trip instead of
+    # one per call.  Reads below run after execute() so they see every write.
+    with redis_db.client.pipeline(transaction=False) as p:
+        db.remember(agent, "test_redis", "Hello Redis", {"migrated": False}, pipe=p)
+        db.upsert_order(
+            order_id=oid_r,
+            status="Pending",
+            customer_email="redis@test.com",
+            amount_usd=55.00,
+            pipe=p,
+        )
+        db.log_security_event("redis_agent", "RATE_LIMIT", "/payments/verify", 429,
+                              "swap test", pipe=p)
+        db.set_feature_status("RedisSwapFeature", "DEV", "temporary Redis test feature",
+                              pipe=p)
+        p.execute()
 
     # remember / recall
-    db.remember(agent, "test_redis", "Hello Redis", {"migrated": False})
     memories = db.recall(agent=agent, type_="test_redis")
     _check("Redis recall returns memory",       len(memories) >= 1)
     _check("Redis memory content correct",      memories[0]["content"] == "Hello Redis")
 
     # upsert_order / get_order (Redis)
-    oid_r = f"RORDER-{uuid.uuid4().hex[:8].upper()}"
-    db.upsert_order(
-        order_id=oid_r,
-        status="Pending",
-        customer_email="redis@test.com",
-        amount_usd=55.00,
-    )
     r_order = db.get_order(oid_r)
     _check("Redis get_order returns record",        r_order is not None)
     _check("Redis order status correct",            r_order["status"] == "Pending")
@@ -170,9 +227,10 @@ def test_redis_swap(sqlite_order_id: str):
     pending = db.get_pending_orders()
     _check("Redis get_pending_orders includes it",  any(o["order_id"] == oid_r for o in pending))
 
-    # COALESCE: update status only — email must be preserved
-    db.upsert_order(order_id=oid_r, status="Paid", customer_email=None)
-    updated = db.get_order(oid_r)
+    # COALESCE: update status only — email must be preserved.  Not part of the
+    # batch above (the upsert reads that record); write + read-back share one
+    # pipeline instead.
+    updated = db.upsert_and_get_order(oid_r, "Paid", customer_email=None)
     _check("Redis upsert COALESCE: status updated",   updated["status"] == "Paid")
     _check("Redis upsert COALESCE: email preserved",  updated["customer_email"] == "redis@test.com")
     _check("Redis upsert COALESCE: amount preserved", float(updated["amount_usd"]) == 55.00)
@@ -181,8 +239,17 @@ def test_redis_swap(sqlite_order_id: str):
     _check("Redis pending set updated after Paid",
            not any(o["order_id"] == oid_r for o in pending_after))
 
+    # update_order_status only touches orders that exist — no ghost hash
+    ghost = f"ORDER-MISSING-{token_hex(4).upper()}"
+    _check("Redis update_order_status on existing order → True",
+           db.update_order_status(oid_r, "Paid") is True)
+    _check("Redis update_order_status on missing order → False",
+           db.update_order_status(ghost, "Pending") is False)
+    _check("Redis missing order not created",       db.get_order(ghost) is None)
+    _check("Redis missing order not in pending set",
+           not any(o["order_id"] == ghost for o in db.get_pending_orders()))
+
     # security events
-    db.log_security_event("redis_agent", "RATE_LIMIT", "/payments/verify", 429, "swap test")
     count = db.count_security_events(event_type="RATE_LIMIT", since_minutes=5)
     _check("Redis count_security_events ≥ 1",       count >= 1)
 
@@ -190,7 +257,6 @@ def test_redis_swap(sqlite_order_id: str):
     _check("Redis get_recent_security_events not empty", len(recent) >= 1)
 
     # feature states
-    db.set_feature_status("RedisSwapFeature", "DEV", "temporary Redis test feature")
     fs = db.get_feature_status("RedisSwapFeature")
     _check("Redis get_feature_status returns DEV",  fs == "DEV")
 
@@ -203,7 +269,7 @@ def test_redis_swap(sqlite_order_id: str):
     set_backend(sqlite_db2)         # must call redis_db.close() internally
     db2 = get_db()
     _check("get_db() returns SQLiteBackend after swap back",
-           type(db2).__name__ == "SQLiteBackend")
+           isinstance(db2, SQLiteBackend))
 
     # Redis order must be absent in fresh SQLite
     absent = db2.get_order(oid_r)
@@ -219,7 +285,7 @@ def test_redis_swap(sqlite_order_id: str):
 
 # ─── Test 7: publish_order_paid facade ───────────────────────────────────────
 
-def test_publish_order_paid_facade():
+def test_publish_order_paid_facade(redis_db: "RedisBackend | None"):
     """
     publish_order_paid() must work on ANY backend without hasattr() checks.
 
@@ -240,13 +306,13 @@ def test_publish_order_paid_facade():
         _check("SQLite publish_order_paid is a no-op (no crash)", False, str(exc))
 
     # 7b: RedisBackend — verify publish() is called with correct channel/payload
-    if not _redis_reachable():
+    if redis_db is None:
         print(f"  [{SKIP}] Redis publish test — Redis not reachable")
         _results.append(("Redis publish_order_paid", "SKIP"))
         return
 
     import unittest.mock as mock
-    redis_db = RedisBackend(url="redis://localhost:6379/0")
+    from redis_backend import _jloads   # decode with the backend's own codec
     set_backend(redis_db)
 
     with mock.patch.object(redis_db.client, "publish") as mock_pub:
@@ -255,7 +321,7 @@ def test_publish_order_paid_facade():
 
         call_args = mock_pub.call_args
         channel, payload_str = call_args[0]
-        payload = json.loads(payload_str)
+        payload = _jloads(payload_str)
 
         _check("Publish channel is howell:order_events",   channel == "howell:order_events")
         _check("Publish event_type is 'paid'",             payload["type"] == "paid")
@@ -276,7 +342,7 @@ def test_publish_order_paid_facade():
 
 # ─── Test 8: end-to-end pub/sub roundtrip ────────────────────────────────────
 
-def test_pubsub_roundtrip():
+def test_pubsub_roundtrip(redis_db: "RedisBackend | None"):
     """
     Full roundtrip: eliza_memory.publish_order_paid() → subscriber receives
     and validates the envelope.
@@ -297,9 +363,7 @@ def test_pubsub_roundtrip():
     4. Wait up to 3 seconds for the message with asyncio.wait_for.
     5. Assert every field of the received envelope matches the spec.
     """
-    REDIS_URL = "redis://localhost:6379/0"
-
-    if not _redis_reachable(REDIS_URL):
+    if redis_db is None:
         print(f"\n[8] Pub/sub roundtrip [{SKIP}] — Redis not reachable")
         _results.append(("Pub/sub roundtrip", "SKIP"))
         return
@@ -309,11 +373,10 @@ def test_pubsub_roundtrip():
     import asyncio
     import eliza_memory as em
 
-    ORDER_ID = f"ROUNDTRIP-{uuid.uuid4().hex[:8].upper()}"
+    ORDER_ID = f"ROUNDTRIP-{token_hex(4).upper()}"
     AMOUNT   = 99.99
 
     # Seed a PAID order in Redis so the envelope's order_id is known
-    redis_db = RedisBackend(url=REDIS_URL)
     set_backend(redis_db)
     em.upsert_order(
         order_id      = ORDER_ID,
@@ -337,7 +400,7 @@ def test_pubsub_roundtrip():
 
         async with ARedis.from_url(REDIS_URL, decode_responses=True) as sub_client:
             async with sub_client.pubsub() as pubsub:
-                channel = f"{RedisBackend.NAMESPACE}order_events"
+                channel = f"{redis_db.NAMESPACE}order_events"
                 await pubsub.subscribe(channel)
 
                 # Drain the subscription-confirmation message first
@@ -379,6 +442,46 @@ def test_pubsub_roundtrip():
     set_backend(SQLiteBackend())   # restore default
 
 
+# ─── Test 9: SQLite connection lifecycle across threads ──────────────────────
+
+def _is_closed(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("SELECT 1")
+    except sqlite3.ProgrammingError as exc:
+        # Not the same-thread check error — only a genuinely closed handle.
+        return "closed" in str(exc)
+    return False
+
+
+def test_sqlite_close_cross_thread():
+    print("\n[9] SQLite close() from another thread")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLiteBackend(db_path=Path(tmp) / "lifecycle.db")
+        opened: list[sqlite3.Connection] = []
+
+        def _worker_conn():
+            db.get_feature_status("nope")
+            opened.append(db._thread_conn())
+
+        # A thread that has exited leaves its connection behind; the next
+        # thread to connect closes it instead of holding it forever.
+        for _ in range(2):
+            t = threading.Thread(target=_worker_conn)
+            t.start()
+            t.join()
+        _check("exited thread's connection closed on next connect", _is_closed(opened[0]))
+
+        # close() on a thread that did not open the connection must close it.
+        main_conn = db._thread_conn()
+        closer = threading.Thread(target=db.close)
+        closer.start()
+        closer.join()
+        _check("close() from another thread closes the connection", _is_closed(main_conn))
+        _check("backend usable after close()", db.get_feature_status("nope") is None)
+        db.close()
+
+
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 def main():
@@ -386,19 +489,33 @@ def main():
     print("  Howell Forge — Backend Swap Integration Test")
     print("=" * 60)
 
+    # One RedisBackend (and connection pool) shared by tests 2, 7 and 8.
+    # set_backend() closes it on each swap away; the pool reconnects lazily.
+    redis_db = (
+        _try_import_redis_backend()(url=REDIS_URL) if _redis_reachable(REDIS_URL) else None
+    )
+
+    # Per-check lines are buffered and written in one go — one write instead
+    # of one per assertion when stdout is a pipe or file.
+    buf = io.StringIO()
     try:
-        sqlite_oid = test_sqlite_write_read()
-        test_redis_swap(sqlite_oid)
-        test_publish_order_paid_facade()
-        test_pubsub_roundtrip()
+        with redirect_stdout(buf):
+            sqlite_oid = test_sqlite_write_read()
+            test_redis_swap(sqlite_oid, redis_db)
+            test_publish_order_paid_facade(redis_db)
+            test_pubsub_roundtrip(redis_db)
+            test_sqlite_close_cross_thread()
     except AssertionError:
         pass  # already printed, continue to summary
+    finally:
+        sys.stdout.write(buf.getvalue())
+        if redis_db is not None:
+            redis_db.close()
 
     # Summary
     print("\n" + "=" * 60)
-    passed = sum(1 for _, s in _results if s == "PASS")
-    skipped = sum(1 for _, s in _results if s == "SKIP")
-    failed  = sum(1 for _, s in _results if s == "FAIL")
+    counts  = Counter(s for _, s in _results)
+    passed, skipped, failed = counts["PASS"], counts["SKIP"], counts["FAIL"]
     total   = len(_results)
     print(f"  Results: {passed} passed, {skipped} skipped, {failed} failed / {total} total")
     print("=" * 60)
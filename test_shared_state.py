@@ -19,11 +19,44 @@ Exit code: 0 = all passed, 1 = failures detected
 """
 
 import asyncio
+import atexit
+import contextvars
+import functools
+import io
 import json
+import os
+import secrets
+import sqlite3
 import sys
-import uuid
+import threading
 from pathlib import Path
 
+# Agent modules are imported once here rather than inside each section.  If
+# one cannot be imported, only the config section (which needs none of them)
+# runs and the import failure is reported as a failed check.
+try:
+    import biofeedback as bf
+    import eliza_memory
+    import kaito_engine
+    from eliza_actions import (
+        FORTRESS_LOG_PATH, ValidateFeatureAction, ValidationError, VerifyPaymentAction,
+        count_fortress_errors, log_action_error, tail_fortress_log, validate_feature,
+        verify_payment,
+    )
+    from eliza_db import SQLiteBackend, get_db, set_backend
+    from eliza_providers import FeatureStatusProvider, OrderStateProvider, SecurityContextProvider
+    from marketing import check_herald_budget, generate_post
+    from order_queue import OrderItem, OrderPriority, OrderQueue
+    _IMPORT_ERROR = None
+except ImportError as _exc:
+    _IMPORT_ERROR = _exc
+
+try:
+    import orjson as _orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 AGENT_DIR = Path(__file__).parent.resolve()
 CONFIG_FILE = AGENT_DIR / "eliza-config.json"
@@ -31,6 +64,42 @@ KAITO_CONFIG = Path.home() / ".config" / "cursor-kaito-config"
 DB_PATH = Path.home() / ".config" / "howell-forge-eliza.db"
 FORTRESS_LOG = Path.home() / "project_docs" / "fortress_errors.log"
 
+# HOWELL_TEST_INMEMORY=1 runs the build check against a throwaway shared-cache
+# in-memory database instead of the real one: no fsyncs, and no build_test_* /
+# gate_test_* orders left behind.
+INMEMORY = os.environ.get("HOWELL_TEST_INMEMORY") == "1"
+INMEMORY_URI = "file:howell-test?mode=memory&cache=shared"
+
+
+def _load_json(path: Path):
+    """Parse a JSON file straight from bytes — orjson when installed."""
+    raw = path.read_bytes()
+    return _orjson.loads(raw) if _ORJSON_AVAILABLE else json.loads(raw)
+
+
+# ─── Shared DB handle ─────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=1)
+def _conn() -> sqlite3.Connection:
+    """
+    One read-only connection for every direct DB read in this run, opened on
+    first use so its page cache stays warm across sections.  Read-only so it
+    can run alongside the writers under WAL (the backend has already put the
+    file in WAL mode).  eliza_memory calls go through SQLiteBackend, which
+    keeps its own per-thread connection.  The statement cache is sized so
+    every direct query here stays prepared for the life of the run.
+    """
+    c = sqlite3.connect(
+        INMEMORY_URI if INMEMORY else f"file:{DB_PATH}?mode=ro", uri=True,
+        isolation_level=None, check_same_thread=False, cached_statements=256,
+    )
+    c.executescript(
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-64000;"
+    )
+    atexit.register(c.close)
+    return c
+
 
 # ─── Test runner ──────────────────────────────────────────────────────────────
 
@@ -38,21 +107,82 @@ PASS = "\033[92m  ✓ PASS\033[0m"
 FAIL = "\033[91m  ✗ FAIL\033[0m"
 INFO = "\033[96m  →\033[0m"
 
+_PASS_PFX = PASS + "  "
+_FAIL_PFX = FAIL + "  "
+
+# Tallied as checks run so the summary never re-scans _results (kept only
+# as a full record for debugging).  Read sections call check() from worker
+# threads, hence the lock.
 _results: list[tuple[str, bool, str]] = []
+_failures: list[tuple[str, str]] = []
+_passed = 0
+_failed = 0
+_tally_lock = threading.Lock()
 
 
 def check(label: str, condition: bool, detail: str = "") -> bool:
+    global _passed, _failed
     _results.append((label, condition, detail))
-    tag = PASS if condition else FAIL
-    suffix = f"  ({detail})" if detail else ""
-    print(f"{tag}  {label}{suffix}")
+    with _tally_lock:
+        if condition:
+            _passed += 1
+        else:
+            _failed += 1
+            _failures.append((label, detail))
+    pfx = _PASS_PFX if condition else _FAIL_PFX
+    print(pfx + label + (f"  ({detail})" if detail else ""))
     return condition
 
 
+_RULE = f"\033[1m{'─' * 60}\033[0m\n"
+
+
 def section(title: str) -> None:
-    print(f"\n\033[1m{'─' * 60}\033[0m")
-    print(f"\033[1m  {title}\033[0m")
-    print(f"\033[1m{'─' * 60}\033[0m")
+    # One write per banner rather than three print() calls
+    sys.stdout.write(f"\n{_RULE}\033[1m  {title}\033[0m\n{_RULE}")
+
+
+# ─── Concurrent read-only sections ────────────────────────────────────────────
+#
+# Sections that only read (configs, schema, dev-mode Kaito, security context)
+# run in worker threads at once.  Each captures its own output so the report
+# still reads section by section.
+
+_SINK: contextvars.ContextVar = contextvars.ContextVar("_SINK", default=None)
+
+
+class _RoutedStdout:
+    """sys.stdout stand-in: writes go to the current task's buffer, if any."""
+
+    def __init__(self, real):
+        self._real = real
+
+    def write(self, text: str) -> int:
+        return (_SINK.get() or self._real).write(text)
+
+    def flush(self) -> None:
+        (_SINK.get() or self._real).flush()
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+async def _buffered(fn, *args) -> str:
+    buf = io.StringIO()
+    _SINK.set(buf)                       # task-local; to_thread copies it
+    await asyncio.to_thread(fn, *args)
+    return buf.getvalue()
+
+
+async def run_read_sections(*sections) -> None:
+    """Run (fn, *args) read-only sections concurrently; print in given order."""
+    real = sys.stdout
+    sys.stdout = _RoutedStdout(real)
+    try:
+        outputs = await asyncio.gather(*(_buffered(*sec) for sec in sections))
+    finally:
+        sys.stdout = real
+    real.write("".join(outputs))
 
 
 # ─── Tests ────────────────────────────────────────────────────────────────────
@@ -64,7 +194,7 @@ def test_configs() -> None:
     ok = CONFIG_FILE.exists()
     check("eliza-config.json exists", ok, str(CONFIG_FILE))
     if ok:
-        cfg = json.loads(CONFIG_FILE.read_text())
+        cfg = _load_json(CONFIG_FILE)
         check("eliza-config.json: project field", cfg.get("project") == "howell-forge-order-loop")
         check("eliza-config.json: providers defined", len(cfg.get("providers", [])) >= 3)
         check("eliza-config.json: actions defined", len(cfg.get("actions", [])) >= 4)
@@ -75,7 +205,7 @@ def test_configs() -> None:
     ok = KAITO_CONFIG.exists()
     check("cursor-kaito-config exists", ok, str(KAITO_CONFIG))
     if ok:
-        kcfg = json.loads(KAITO_CONFIG.read_text())
+        kcfg = _load_json(KAITO_CONFIG)
         check("kaito config: dev_mode=true", kcfg.get("dev_mode") is True)
         check("kaito config: network set", bool(kcfg.get("network")))
 
@@ -83,15 +213,15 @@ def test_configs() -> None:
 def test_db() -> None:
     section("2. ElizaOS Database (howell-forge-eliza.db)")
 
-    check("DB file exists", DB_PATH.exists(), str(DB_PATH))
+    if INMEMORY:
+        check("DB in-memory (HOWELL_TEST_INMEMORY=1)", True, INMEMORY_URI)
+    else:
+        check("DB file exists", DB_PATH.exists(), str(DB_PATH))
 
-    import sqlite3
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        tables = {r[0] for r in conn.execute(
+        tables = {r[0] for r in _conn().execute(
             "SELECT name FROM sqlite_master WHERE type='table'"
         ).fetchall()}
-        conn.close()
         check("Table: memories",        "memories"        in tables)
         check("Table: orders",          "orders"          in tables)
         check("Table: security_events", "security_events" in tables)
@@ -102,8 +232,6 @@ def test_db() -> None:
 def test_kaito_engine() -> None:
     section("3. Kaito Engine (dev mode)")
 
-    import kaito_engine
-
     uri = kaito_engine.generate_payment_uri("build_test_01", 150.00, "build@howell-forge.com")
     check("generate_payment_uri(): returns URI",   "kaito://" in uri.get("payment_uri", ""))
     check("generate_payment_uri(): has tx_id",     uri.get("kaito_tx_id", "").startswith("ktx_dev_"))
@@ -117,50 +245,55 @@ def test_kaito_engine() -> None:
     print(f"  {INFO} blockchain status = {status['status']} (confirmations={status.get('confirmations', 0)})")
 
 
-async def test_shop_agent_writes_state() -> tuple[str, str]:
+async def test_shop_agent_writes_state(state) -> tuple[str, str]:
     """
     Simulate Shop Agent processing one order through VerifyPaymentAction.
     Returns (order_id, final_status).
     """
     section("4. Shop Agent → Eliza Memory write")
 
-    import eliza_memory
-    import kaito_engine
-    from eliza_actions import VerifyPaymentAction, verify_payment
-    from order_queue import OrderItem, OrderQueue, OrderPriority
-
-    order_id = f"build_test_{uuid.uuid4().hex[:8]}"
+    order_id = f"build_test_{secrets.token_hex(4)}"
     print(f"  {INFO} Test order_id = {order_id}")
 
-    # Step A: generate URI
-    payment_info = kaito_engine.generate_payment_uri(order_id, 499.00, "shared@howell-forge.com")
-    kaito_tx_id = payment_info["kaito_tx_id"]
+    # Sync DB / engine calls run on the default thread pool so the event loop
+    # stays free for the async handlers.
 
-    # Step B: write Pending to Eliza memory
-    eliza_memory.upsert_order(
-        order_id=order_id,
-        status="Pending",
-        customer_email="shared@howell-forge.com",
-        amount_usd=499.00,
-        payment_uri=payment_info["payment_uri"],
-        kaito_tx_id=kaito_tx_id,
-        raw_data={"kaito": payment_info},
-    )
-    eliza_memory.remember(
-        "SHOP_AGENT", "PAYMENT_EVENT",
-        f"Build-test order {order_id} Pending",
-        {"order_id": order_id, "status": "Pending"},
+    # Step A: generate URI
+    payment_info = await asyncio.to_thread(
+        kaito_engine.generate_payment_uri, order_id, 499.00, "shared@howell-forge.com",
     )
+    kaito_tx_id = payment_info["kaito_tx_id"]
 
-    pending = eliza_memory.get_order(order_id)
+    # Step B: write Pending to Eliza memory (one commit for both writes).  The
+    # transaction is bound to the calling thread's connection, so both writes
+    # run together in one worker call.
+    def _write_pending() -> None:
+        with eliza_memory.transaction():
+            eliza_memory.upsert_order(
+                order_id=order_id,
+                status="Pending",
+                customer_email="shared@howell-forge.com",
+                amount_usd=499.00,
+                payment_uri=payment_info["payment_uri"],
+                kaito_tx_id=kaito_tx_id,
+                raw_data={"kaito": payment_info},
+            )
+            eliza_memory.remember(
+                "SHOP_AGENT", "PAYMENT_EVENT",
+                f"Build-test order {order_id} Pending",
+                {"order_id": order_id, "status": "Pending"},
+            )
+
+    await asyncio.to_thread(_write_pending)
+
+    pending = await asyncio.to_thread(eliza_memory.get_order, order_id)
     check("Shop Agent: order written as Pending", pending is not None and pending["status"] == "Pending")
     print(f"  {INFO} Eliza memory status = {pending['status']}")
 
     # Step C: invoke VerifyPaymentAction
-    state = eliza_memory.get_agent_state()
     action_ctx = {"order_id": order_id, "agent": "SHOP_AGENT"}
 
-    can_run = verify_payment.validate(state, action_ctx)
+    can_run = await asyncio.to_thread(verify_payment.validate, state, action_ctx)
     check("VerifyPaymentAction.validate() = True for Pending order", can_run)
 
     result = await verify_payment.handler(state, action_ctx)
@@ -181,14 +314,10 @@ async def test_shop_agent_writes_state() -> tuple[str, str]:
     return order_id, final_status
 
 
-def test_provider_bridge(order_id: str, expected_paid: bool) -> None:
+def test_provider_bridge(state, order_id: str, expected_paid: bool) -> None:
     section("5. Provider Bridge — shared state between agents")
 
-    import eliza_memory
-    from eliza_providers import OrderStateProvider
-
     provider = OrderStateProvider()
-    state = eliza_memory.get_agent_state()
 
     # Both agents call the same provider with the same order_id
     shop_ctx   = provider.get(state, {"order_id": order_id})  # Shop Agent view
@@ -222,14 +351,11 @@ def test_provider_bridge(order_id: str, expected_paid: bool) -> None:
           f"delivery_unlocked={shop_ctx['delivery_unlocked']}")
 
 
-def test_paid_gate() -> None:
+def test_paid_gate(state) -> None:
     section("6. PAID Gate — delivery info withheld until PAID")
 
-    import eliza_memory
-    from eliza_providers import OrderStateProvider
-
     # Create a deliberately Pending order
-    pending_id = f"gate_test_{uuid.uuid4().hex[:8]}"
+    pending_id = f"gate_test_{secrets.token_hex(4)}"
     eliza_memory.upsert_order(
         pending_id, "Pending",
         customer_email="gate@howell-forge.com",
@@ -238,7 +364,6 @@ def test_paid_gate() -> None:
     )
 
     provider = OrderStateProvider()
-    state = eliza_memory.get_agent_state()
     ctx = provider.get(state, {"order_id": pending_id})
 
     check("PAID gate: Pending order — delivery_unlocked=False",
@@ -246,8 +371,8 @@ def test_paid_gate() -> None:
     check("PAID gate: Pending order — delivery_info=None",
           ctx["delivery_info"] is None)
 
-    # Now force to PAID and re-read
-    eliza_memory.upsert_order(
+    # Now flip to PAID in place and re-read
+    eliza_memory.update_order_status(
         pending_id, "PAID",
         raw_data={"tx_hash": "0xgate_test_hash", "block_hash": "0xgate_test_hash"},
     )
@@ -263,8 +388,6 @@ def test_paid_gate() -> None:
 def test_fortress_log() -> None:
     section("7. fortress_errors.log — Monitor Agent breadcrumbs")
 
-    from eliza_actions import log_action_error, count_fortress_errors, tail_fortress_log, FORTRESS_LOG_PATH
-
     # Write a test entry
     log_action_error(
         "VERIFY_PAYMENT", "SHOP_AGENT", "build_err_001",
@@ -295,14 +418,10 @@ def test_fortress_log() -> None:
     print(f"  {INFO} Monitor Agent sees {n} fortress error(s) in last 5 min")
 
 
-def test_security_context() -> None:
+def test_security_context(state) -> None:
     section("8. SecurityContextProvider — Monitor Agent awareness")
 
-    import eliza_memory
-    from eliza_providers import SecurityContextProvider
-
     sc = SecurityContextProvider()
-    state = eliza_memory.get_agent_state()
     ctx = sc.get(state, {"since_minutes": 120})
 
     check("SecurityContext: auth_error_count is int",  isinstance(ctx["auth_error_count"], int))
@@ -315,18 +434,12 @@ def test_security_context() -> None:
           f"self_healing={'YES ⚠️' if ctx['self_healing_triggered'] else 'No'}")
 
 
-async def test_feature_gate() -> None:
+async def test_feature_gate(state) -> None:
     section("9. VALIDATE_FEATURE — DEV status blocks Herald post")
 
-    from eliza_db import get_db
-    from eliza_actions import validate_feature, ValidateFeatureAction, ValidationError
-    from eliza_memory import get_agent_state
-
     db = get_db()
-    state = get_agent_state()
 
     # ── 9a: FeatureStatusProvider seed check ──────────────────────────────
-    from eliza_providers import FeatureStatusProvider
     fp = FeatureStatusProvider()
     all_ctx = fp.get(state, {})
     check("FeatureStatusProvider: returns features dict",
@@ -365,11 +478,9 @@ async def test_feature_gate() -> None:
           denial_reason == "feature_not_live")
 
     # ── 9d: Constraint logged to biofeedback ──────────────────────────────
-    import biofeedback as bf
     score_before = bf.get_score()
     # The action already called append_constraint internally;
     # just verify the constraint file exists and score reflects it.
-    from pathlib import Path
     constraints_path = Path.home() / "project_docs" / "biofeedback" / "constraints.md"
     check("Biofeedback: constraints.md created after denial",
           constraints_path.exists())
@@ -417,18 +528,10 @@ async def test_feature_gate() -> None:
 def test_herald_budget() -> None:
     section("10. Herald Budget — throttle/healing limits post count")
 
-    import json
-    from pathlib import Path
-    from marketing import check_herald_budget, generate_post
-
-    scale_path = Path.home() / "project_docs" / "biofeedback" / "scale_state.json"
-    scale_path.parent.mkdir(parents=True, exist_ok=True)
+    # Scale state is injected directly, so scale_state.json is never rewritten.
 
     # ── 10a: Normal mode → unlimited ──────────────────────────────────────
-    original_state = scale_path.read_text() if scale_path.exists() else None
-    scale_path.write_text(json.dumps({"mode": "normal", "score": 2.0, "engine": "ewma"}))
-
-    budget_normal = check_herald_budget()
+    budget_normal = check_herald_budget({"mode": "normal", "score": 2.0, "engine": "ewma"})
     check("Budget: normal mode → posts_allowed=None (unlimited)",
           budget_normal["posts_allowed"] is None)
     check("Budget: normal mode → throttled=False",
@@ -436,16 +539,14 @@ def test_herald_budget() -> None:
     print(f"  {INFO} Normal budget: {budget_normal}")
 
     # ── 10b: Throttle mode → max 1/day ────────────────────────────────────
-    scale_path.write_text(json.dumps({"mode": "throttle", "score": -5.0, "engine": "ewma"}))
-
-    budget_throttle = check_herald_budget()
+    budget_throttle = check_herald_budget({"mode": "throttle", "score": -5.0, "engine": "ewma"})
     check("Budget: throttle mode → posts_allowed=1",
           budget_throttle["posts_allowed"] == 1)
     check("Budget: throttle mode → throttled=True",
           budget_throttle["throttled"] is True)
     print(f"  {INFO} Throttle budget: {budget_throttle}")
 
-    # ── 10c: generate_post in throttle reflects budget ─────────────────────
+    # ── 10c: generate_post carries the (on-disk) budget ───────────────────
     result = generate_post(
         feature_name="Herald (Social Post)",   # DEV → will be blocked at validation
         draft_text="Custom Howell Forge handcrafted steel — made in USA fabrication",
@@ -460,60 +561,82 @@ def test_herald_budget() -> None:
     print(f"  {INFO} generate_post result: approved={result['approved']}, "
           f"published={result['published']}, reason={result['reason'][:80]}")
 
-    # ── Restore original scale state ──────────────────────────────────────
-    if original_state:
-        scale_path.write_text(original_state)
-    else:
-        scale_path.write_text(json.dumps({"mode": "normal", "score": 0.0, "engine": "ewma"}))
-
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-async def main() -> int:
-    print("\n\033[1m" + "═" * 62 + "\033[0m")
-    print("\033[1m  ElizaOS Order Loop — Shared State Build Check\033[0m")
-    print("\033[1m" + "═" * 62 + "\033[0m")
+async def run_all_sections() -> None:
+    """Sections 1–10; main() only calls this once the agent modules imported."""
+    if INMEMORY:
+        # A shared-cache in-memory DB is dropped as soon as its last
+        # connection closes.  The backend's per-thread connections are not
+        # enough: an exited worker thread's one is closed on the next connect,
+        # and close()/set_backend() closes them all.  The sentinel stays open
+        # until interpreter exit (the atexit registration holds it) so the
+        # schema and rows survive all of that.
+        sentinel = sqlite3.connect(INMEMORY_URI, uri=True)
+        atexit.register(sentinel.close)
+        set_backend(SQLiteBackend(db_path=Path(INMEMORY_URI)))
+
+    # One AgentState handle for every section.  It is the process singleton
+    # and upsert_order() mirrors into it, so it never needs re-fetching.
+    state = eliza_memory.get_agent_state()
 
-    # Run synchronous tests
-    test_configs()
-    test_db()
-    test_kaito_engine()
+    # Read-only sections run concurrently (WAL: readers never block)
+    await run_read_sections(
+        (test_configs,),
+        (test_db,),
+        (test_kaito_engine,),
+        (test_security_context, state),
+    )
 
     # Run async shop-agent write (must come before provider bridge test)
-    order_id, final_status = await test_shop_agent_writes_state()
+    order_id, final_status = await test_shop_agent_writes_state(state)
     paid = (final_status == "PAID")
 
     # Provider bridge — uses order written above
-    test_provider_bridge(order_id, expected_paid=paid)
-    test_paid_gate()
+    test_provider_bridge(state, order_id, expected_paid=paid)
+    test_paid_gate(state)
     test_fortress_log()
-    test_security_context()
-    await test_feature_gate()
+    await test_feature_gate(state)
     test_herald_budget()
 
+
+async def main() -> int:
+    print("\n\033[1m" + "═" * 62 + "\033[0m")
+    print("\033[1m  ElizaOS Order Loop — Shared State Build Check\033[0m")
+    print("\033[1m" + "═" * 62 + "\033[0m")
+
+    if _IMPORT_ERROR is not None:
+        test_configs()
+        check("Agent modules importable", False, str(_IMPORT_ERROR))
+    else:
+        await run_all_sections()
+
     # ── Summary ───────────────────────────────────────────────────────────────
-    total   = len(_results)
-    passed  = sum(1 for _, ok, _ in _results if ok)
-    failed  = total - passed
-
-    print("\n" + "═" * 62)
-    print(f"\033[1m  BUILD CHECK RESULTS\033[0m")
-    print("═" * 62)
-    print(f"  Total  : {total}")
-    print(f"  \033[92mPassed : {passed}\033[0m")
+    passed  = _passed
+    failed  = _failed
+    total   = passed + failed
+
+    # Built up and emitted with a single write
+    lines = [
+        "\n" + "═" * 62,
+        "\033[1m  BUILD CHECK RESULTS\033[0m",
+        "═" * 62,
+        f"  Total  : {total}",
+        f"  \033[92mPassed : {passed}\033[0m",
+    ]
     if failed:
-        print(f"  \033[91mFailed : {failed}\033[0m")
-        print("\n  Failed checks:")
-        for label, ok, detail in _results:
-            if not ok:
-                print(f"    ✗ {label}  ({detail})")
-    print("═" * 62)
+        lines.append(f"  \033[91mFailed : {failed}\033[0m")
+        lines.append("\n  Failed checks:")
+        lines.extend(f"    ✗ {label}  ({detail})" for label, detail in _failures)
+    lines.append("═" * 62)
 
     if failed == 0:
-        print("\n\033[92m  ✓ BUILD PASSED — Shared state verified between Shop Agent\033[0m")
-        print("\033[92m    and Customer Service Agent via ElizaOS Provider layer.\033[0m\n")
+        lines.append("\n\033[92m  ✓ BUILD PASSED — Shared state verified between Shop Agent\033[0m")
+        lines.append("\033[92m    and Customer Service Agent via ElizaOS Provider layer.\033[0m\n")
     else:
-        print(f"\n\033[91m  ✗ BUILD FAILED — {failed} check(s) did not pass.\033[0m\n")
+        lines.append(f"\n\033[91m  ✗ BUILD FAILED — {failed} check(s) did not pass.\033[0m\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0 if failed == 0 else 1
 
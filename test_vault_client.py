@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+test_vault_client.py — Local-tier lookup and negative-cache tests.
+
+Covers:
+  1.  A missing secret is remembered: a plain re-read skips the open
+  2.  A cursor-* file restored after a miss is seen by diagnose_environment()
+      (its directory snapshot lists the file, overriding the negative cache)
+  3.  The same for a file restored in the local vault directory
+
+Run:
+    cd ~/howell-forge-agent && python3 test_vault_client.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# ─── Isolate $HOME so no real secrets are read or written ────────────────────
+
+_tmp = tempfile.mkdtemp(prefix="hf_vault_test_")
+_TMP = Path(_tmp)
+os.environ["HOME"] = _tmp
+(_TMP / ".config").mkdir()
+
+import vault_client as vc
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+PASS = "\033[92mPASS\033[0m"
+FAIL = "\033[91mFAIL\033[0m"
+_results: list[tuple[str, bool, str]] = []
+
+
+def check(name: str, cond: bool, detail: str = "") -> None:
+    tag = PASS if cond else FAIL
+    print(f"  [{tag}] {name}" + (f" — {detail}" if detail else ""))
+    _results.append((name, cond, detail))
+
+
+def reset() -> None:
+    """Forget every cached lookup and negative entry between test cases."""
+    vc._invalidate_fetch_cache()
+    vc._negative_cache.clear()
+
+
+def _expire_fetch_cache() -> None:
+    """Let the short-lived fetch cache lapse so only the negative cache is left."""
+    time.sleep(vc._FETCH_CACHE_TTL + 0.05)
+
+
+# ─── T1: negative cache still applies without a snapshot ─────────────────────
+
+def test_negative_cache_without_snapshot() -> None:
+    print("\n[Test 1] Missing file is remembered for a plain re-read")
+    reset()
+
+    path = vc._LOCAL_CONFIG_MAP["stripe_secret_key"][0]
+    check("stripe_secret_key not found while absent",
+          not vc.fetch_secret("stripe_secret_key").found)
+
+    path.write_text("sk_test_restored\n")
+    try:
+        check("plain read honours the negative cache",
+              vc._read_small_text(path) is None)
+        check("listed read sees the file",
+              vc._read_small_text(path, listed=True) == "sk_test_restored")
+    finally:
+        path.unlink()
+
+
+# ─── T2: restored cursor-* file is seen by diagnose_environment() ────────────
+
+def test_restored_cursor_file_seen_by_diagnose() -> None:
+    print("\n[Test 2] diagnose_environment() sees a restored cursor-* file")
+    reset()
+
+    result = vc.fetch_secret("github_token")
+    check("github_token not found while absent", not result.found, result.source)
+
+    path = vc._LOCAL_CONFIG_MAP["github_token"][0]
+    path.write_text("ghp_restored\n")
+    try:
+        _expire_fetch_cache()
+        report = vc.diagnose_environment()["secrets"]["github_token"]
+        check("diagnose reports github_token found", report["found"], str(report))
+        check("source is cursor_config",
+              report["source"] == "cursor_config", report["source"])
+    finally:
+        path.unlink()
+
+
+# ─── T3: restored local-vault file is seen by diagnose_environment() ─────────
+
+def test_restored_vault_file_seen_by_diagnose() -> None:
+    print("\n[Test 3] diagnose_environment() sees a restored local-vault file")
+    reset()
+
+    result = vc.fetch_secret("telegram_webhook")
+    check("telegram_webhook not found while absent", not result.found, result.source)
+
+    vc.VAULT_DIR.mkdir(parents=True, exist_ok=True)
+    path = vc.VAULT_DIR / "telegram_webhook"
+    path.write_text("https://hooks.example/restored\n")
+    try:
+        _expire_fetch_cache()
+        report = vc.diagnose_environment()["secrets"]["telegram_webhook"]
+        check("diagnose reports telegram_webhook found", report["found"], str(report))
+        check("source is local_vault",
+              report["source"] == "local_vault", report["source"])
+    finally:
+        path.unlink()
+
+
+# ─── Summary ──────────────────────────────────────────────────────────────────
+
+def main() -> int:
+    print("=" * 60)
+    print("Vault Client Tests")
+    print("=" * 60)
+
+    try:
+        test_negative_cache_without_snapshot()
+        test_restored_cursor_file_seen_by_diagnose()
+        test_restored_vault_file_seen_by_diagnose()
+    finally:
+        shutil.rmtree(_tmp, ignore_errors=True)
+
+    passed = sum(1 for _, ok, _ in _results if ok)
+    total  = len(_results)
+    print(f"\n{'='*60}")
+    print(f"Results: {passed}/{total} passed")
+    print(f"{'='*60}")
+
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,107 +20,325 @@ WireGuard remote vault:
     { "endpoint": "http://10.0.0.1:8200/v1/secret/data/howell-forge", "token": "..." }
 """
 
+import asyncio
+import concurrent.futures
+import fcntl
+import http.client
 import json
 import os
-import shutil
-import subprocess
-import urllib.error
-import urllib.request
+import re
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
+# Optional: orjson for config / vault-response (de)serialisation; stdlib json otherwise
+try:
+    import orjson as _orjson
+    _jloads = _orjson.loads
+    def _jdumps(obj) -> bytes:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+except ImportError:
+    _jloads = json.loads
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Optional: aiohttp for batched remote-vault fetches; thread pool otherwise
+try:
+    import aiohttp
+    _AIOHTTP_AVAILABLE = True
+except ImportError:
+    _AIOHTTP_AVAILABLE = False
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 
-VAULT_DIR = Path.home() / ".config" / "howell-forge-vault"
+# Resolved once; every path below hangs off it.
+_HOME = Path.home()
+_CONFIG_DIR = _HOME / ".config"
+
+VAULT_DIR = _CONFIG_DIR / "howell-forge-vault"
 REMOTE_CONFIG = VAULT_DIR / "remote.json"
 
-# Mapping: logical secret name → local cursor config file/key
-_LOCAL_CONFIG_MAP: dict[str, tuple[Path, Optional[str]]] = {
+# Mapping: logical secret name → local cursor config file/key (read-only view)
+_LOCAL_CONFIG_MAP_RAW: dict[str, tuple[Path, Optional[str]]] = {
     "kaito_api_key": (
-        Path.home() / ".config" / "cursor-kaito-config",
+        _CONFIG_DIR / "cursor-kaito-config",
         "api_key",         # JSON key within the file
     ),
     "kaito_wallet_address": (
-        Path.home() / ".config" / "cursor-kaito-config",
+        _CONFIG_DIR / "cursor-kaito-config",
         "wallet_address",
     ),
     "stripe_secret_key": (
-        Path.home() / ".config" / "cursor-stripe-secret-key",
+        _CONFIG_DIR / "cursor-stripe-secret-key",
         None,              # None = read file as plain text
     ),
     "telegram_webhook": (
-        Path.home() / ".config" / "cursor-zapier-telegram-webhook",
+        _CONFIG_DIR / "cursor-zapier-telegram-webhook",
         None,
     ),
     "github_token": (
-        Path.home() / ".config" / "cursor-github-mcp-token",
+        _CONFIG_DIR / "cursor-github-mcp-token",
         None,
     ),
     "stripe_webhook_secret": (
-        Path.home() / ".config" / "cursor-stripe-webhook-secret",
+        _CONFIG_DIR / "cursor-stripe-webhook-secret",
         None,
     ),
 }
+_LOCAL_CONFIG_MAP: Mapping[str, tuple[Path, Optional[str]]] = MappingProxyType(_LOCAL_CONFIG_MAP_RAW)
+
+# The same entries flattened once at import, in map order, for code that
+# walks every known secret: (name, config path, json key or None).
+_SECRETS_SOA: tuple[tuple[str, Path, Optional[str]], ...] = tuple(
+    (name, path, key) for name, (path, key) in _LOCAL_CONFIG_MAP_RAW.items()
+)
+_SECRET_NAMES: tuple[str, ...] = tuple(name for name, _, _ in _SECRETS_SOA)
 
 
 # ─── WireGuard detection ──────────────────────────────────────────────────────
 
+# (monotonic timestamp, result) of the last interface probe.  A diagnose pass
+# asks once per secret; the TTL makes that one probe instead of six.
+_WG_CACHE_TTL = 2.0
+_wg_cache: Optional[tuple[float, bool]] = None
+
+
 def is_wireguard_active() -> bool:
     """
     Return True if any WireGuard interface is active.
-    Checks via `ip link show type wireguard` (no root needed on Linux).
+    The answer is cached for _WG_CACHE_TTL seconds.
+    """
+    global _wg_cache
+    now = time.monotonic()
+    if _wg_cache is not None and now - _wg_cache[0] < _WG_CACHE_TTL:
+        return _wg_cache[1]
+    active = _probe_wireguard()
+    _wg_cache = (now, active)
+    return active
+
+
+_SYS_NET = Path("/sys/class/net")
+# A /proc/net/dev row whose (space-padded) interface name starts with "wg"
+_PROC_WG_RE = re.compile(rb"^[ \t]*wg", re.MULTILINE)
+
+
+def _probe_wireguard() -> bool:
+    """
+    Scan /sys/class/net for an interface whose uevent reports
+    DEVTYPE=wireguard — the same answer `ip link show type wireguard` gives,
+    without forking.  Falls back to wg* names in /proc/net/dev.
     """
     try:
-        result = subprocess.run(
-            ["ip", "link", "show", "type", "wireguard"],
-            capture_output=True, text=True, timeout=5,
-        )
-        return bool(result.stdout.strip())
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+        for name in os.listdir(_SYS_NET):
+            try:
+                if b"DEVTYPE=wireguard" in (_SYS_NET / name / "uevent").read_bytes():
+                    return True
+            except OSError:
+                continue
+        return False
+    except OSError:
         pass
     # Fallback: check /proc/net/dev for wg* interfaces
     try:
-        proc = Path("/proc/net/dev").read_text()
-        return any(line.strip().startswith("wg") for line in proc.splitlines())
+        return _PROC_WG_RE.search(Path("/proc/net/dev").read_bytes()) is not None
     except OSError:
         return False
 
 
 # ─── Local vault ──────────────────────────────────────────────────────────────
 
-def _read_local_vault_file(secret_name: str) -> Optional[str]:
-    """Read a secret from ~/.config/howell-forge-vault/{secret_name}."""
-    vault_file = VAULT_DIR / secret_name
-    if vault_file.exists():
-        value = vault_file.read_text().strip()
-        return value or None
-    return None
+# (basenames in VAULT_DIR, basenames in ~/.config) — one directory read each,
+# so a multi-secret pass can skip absent files without a stat per secret.
+_Snapshot = tuple[frozenset[str], frozenset[str]]
 
 
-def _read_cursor_config(secret_name: str) -> Optional[str]:
-    """Read from the ~/.config/cursor-* mapping for this secret."""
-    mapping = _LOCAL_CONFIG_MAP.get(secret_name)
-    if not mapping:
-        return None
-    config_path, json_key = mapping
-    if not config_path.exists():
+def _scan_dir(path: Path) -> tuple[bool, frozenset[str]]:
+    """(directory exists, its entry names) from a single os.scandir."""
+    try:
+        with os.scandir(path) as it:
+            return True, frozenset(entry.name for entry in it)
+    except OSError:
+        return False, frozenset()
+
+
+def _snapshot_config_dir() -> _Snapshot:
+    """Return (vault_names, cursor_names) for the vault dir and ~/.config."""
+    return _scan_dir(VAULT_DIR)[1], _scan_dir(_CONFIG_DIR)[1]
+
+
+# Negative cache: path → monotonic expiry for files found missing.  Several
+# cursor-* files are usually absent; this stops every lookup re-trying the
+# open.  Writes through _atomic_write() drop their path's entry.
+_NEGATIVE_TTL = 30.0
+_negative_cache: dict[str, float] = {}
+
+
+def _read_small_text(path, listed: bool = False) -> Optional[str]:
+    """
+    Stripped contents of a small secret/config file, or None if it is missing
+    or blank.  Raw os.open/os.read: no Path, FileIO or TextIOWrapper layers.
+    Missing paths are remembered for _NEGATIVE_TTL seconds.
+
+    listed=True means the caller's directory snapshot just showed the file,
+    which overrides any remembered miss (e.g. a secret restored by hand).
+    """
+    key = os.fspath(path)
+    if listed:
+        _negative_cache.pop(key, None)
+    else:
+        expiry = _negative_cache.get(key)
+        if expiry is not None:
+            if expiry > time.monotonic():
+                return None
+            _negative_cache.pop(key, None)
+    try:
+        fd = os.open(key, os.O_RDONLY)
+    except FileNotFoundError:
+        _negative_cache[key] = time.monotonic() + _NEGATIVE_TTL
         return None
-    raw = config_path.read_text().strip()
-    if not raw:
+    try:
+        chunks = []
+        while chunk := os.read(fd, 4096):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    # Strip the bytes, then decode once: no intermediate unstripped str
+    return b"".join(chunks).strip().decode("utf-8") or None
+
+
+def _read_local_vault_file(
+    secret_name: str,
+    vault_names: Optional[frozenset[str]] = None,
+) -> Optional[str]:
+    """Read a secret from ~/.config/howell-forge-vault/{secret_name}."""
+    if vault_names is not None and secret_name not in vault_names:
         return None
-    if json_key is not None:
+    return _read_small_text(
+        os.path.join(VAULT_DIR, secret_name), listed=vault_names is not None,
+    )
+
+
+def _make_cursor_reader(config_path: Path, json_key: Optional[str]):
+    """
+    Build the tier-2 reader for one secret, specialised at import for its
+    file (path pre-converted to str) and plain-vs-JSON format.  The reader
+    takes the optional ~/.config name snapshot.
+    """
+    path = os.fspath(config_path)
+    filename = config_path.name
+
+    if json_key is None:
+        def read_plain(cursor_names: Optional[frozenset[str]] = None) -> Optional[str]:
+            if cursor_names is not None and filename not in cursor_names:
+                return None
+            return _read_small_text(path, listed=cursor_names is not None)
+        return read_plain
+
+    def read_json(cursor_names: Optional[frozenset[str]] = None) -> Optional[str]:
+        if cursor_names is not None and filename not in cursor_names:
+            return None
+        raw = _read_small_text(path, listed=cursor_names is not None)
+        if raw is None:
+            return None
         try:
-            data = json.loads(raw)
-            value = data.get(json_key, "")
-            return value if value else None
+            value = _jloads(raw).get(json_key, "")
         except json.JSONDecodeError:
             return None
-    return raw
+        return value if value else None
+    return read_json
+
+
+# secret name → its specialised tier-2 reader
+_READERS: Mapping[str, Callable[..., Optional[str]]] = MappingProxyType({
+    name: _make_cursor_reader(path, key) for name, path, key in _SECRETS_SOA
+})
+
+
+def _read_cursor_config(
+    secret_name: str,
+    cursor_names: Optional[frozenset[str]] = None,
+) -> Optional[str]:
+    """Read from the ~/.config/cursor-* mapping for this secret."""
+    reader = _READERS.get(secret_name)
+    return reader(cursor_names) if reader is not None else None
 
 
 # ─── Remote vault (WireGuard VPN internal) ───────────────────────────────────
 
+# (remote.json st_mtime_ns, parsed result) — remote.json is re-read and the
+# URL prefix / header dict rebuilt only when the file changes.
+_remote_cfg_cache: Optional[tuple[int, Optional[tuple[str, dict]]]] = None
+
+# (monotonic timestamp, _remote_ready() answer).  Held for the WireGuard TTL
+# so a batch of lookups pays one WG check + remote.json stat between them.
+_remote_ready_cache: Optional[tuple[float, Optional[tuple[str, dict]]]] = None
+
+
+def _remote_ready() -> Optional[tuple[str, dict]]:
+    """
+    (endpoint prefix ending in "/", request headers) when the remote vault
+    is usable, or None when WireGuard is down or remote.json is absent /
+    incomplete.  The single gate for every remote lookup.
+    """
+    global _remote_ready_cache
+    now = time.monotonic()
+    cached = _remote_ready_cache
+    if cached is not None and now - cached[0] < _WG_CACHE_TTL:
+        return cached[1]
+    cfg = _load_remote_cfg() if is_wireguard_active() else None
+    _remote_ready_cache = (now, cfg)
+    return cfg
+
+
+def _load_remote_cfg() -> Optional[tuple[str, dict]]:
+    """Parsed remote.json, re-read only when its mtime changes."""
+    global _remote_cfg_cache
+    try:
+        mtime_ns = os.stat(REMOTE_CONFIG).st_mtime_ns
+    except OSError:
+        return None
+    cached = _remote_cfg_cache
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    cfg = _parse_remote_cfg()
+    _remote_cfg_cache = (mtime_ns, cfg)
+    return cfg
+
+
+def _parse_remote_cfg() -> Optional[tuple[str, dict]]:
+    try:
+        remote_cfg = _jloads(REMOTE_CONFIG.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return None
+    endpoint: str = remote_cfg.get("endpoint", "").rstrip("/")
+    token: str = remote_cfg.get("token", "")
+    if not endpoint or not token:
+        return None
+    return endpoint + "/", {
+        "X-Vault-Token": token,
+        "User-Agent": "Howell-Forge-VaultClient/1.0",
+    }
+
+
+def _vault_value(data: dict, secret_name: str) -> Optional[str]:
+    """Pull the secret out of a remote vault response body."""
+    # HashiCorp Vault KV v2 response shape
+    value = (
+        data.get("data", {}).get("data", {}).get("value")
+        or data.get("data", {}).get(secret_name)
+        or data.get(secret_name)
+    )
+    return str(value).strip() if value else None
+
+
 def _read_remote_vault(secret_name: str) -> Optional[str]:
     """
     Attempt to read a secret from the WireGuard-protected remote vault.
@@ -131,59 +349,155 @@ def _read_remote_vault(secret_name: str) -> Optional[str]:
 
     Returns None on any failure (network, auth, config absent).
     """
-    if not is_wireguard_active():
-        return None
-    if not REMOTE_CONFIG.exists():
+    cfg = _remote_ready()
+    if cfg is None:
         return None
+    prefix, headers = cfg
     try:
-        remote_cfg = json.loads(REMOTE_CONFIG.read_text())
-        endpoint: str = remote_cfg.get("endpoint", "").rstrip("/")
-        token: str = remote_cfg.get("token", "")
-        if not endpoint or not token:
+        status, body = _remote_get(urllib.parse.urlsplit(prefix + secret_name), headers)
+        if not 200 <= status < 300:
             return None
-        url = f"{endpoint}/{secret_name}"
-        req = urllib.request.Request(
-            url,
-            headers={
-                "X-Vault-Token": token,
-                "User-Agent": "Howell-Forge-VaultClient/1.0",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read().decode())
-            # HashiCorp Vault KV v2 response shape
-            value = (
-                data.get("data", {}).get("data", {}).get("value")
-                or data.get("data", {}).get(secret_name)
-                or data.get(secret_name)
-            )
-            return str(value).strip() if value else None
-    except (urllib.error.URLError, json.JSONDecodeError, OSError):
+        return _vault_value(_jloads(body), secret_name)
+    except (http.client.HTTPException, json.JSONDecodeError, OSError):
         return None
 
 
+async def _read_remote_vault_many(names: list[str]) -> dict[str, Optional[str]]:
+    """
+    Fetch several secrets from the remote vault concurrently over one
+    aiohttp session (keep-alive connections, at most 8 in flight).
+    Same None-on-failure contract as _read_remote_vault, per secret.
+    """
+    cfg = _remote_ready()
+    if cfg is None:
+        return dict.fromkeys(names)
+    prefix, headers = cfg
+
+    async def _one(session: "aiohttp.ClientSession", name: str) -> Optional[str]:
+        try:
+            async with session.get(prefix + name) as resp:
+                if not 200 <= resp.status < 300:
+                    return None
+                body = await resp.read()
+            return _vault_value(_jloads(body), name)
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError, OSError):
+            return None
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=8, force_close=False),
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=5),
+    ) as session:
+        values = await asyncio.gather(*(_one(session, name) for name in names))
+    return dict(zip(names, values))
+
+
+def _read_remote_vault_bulk(names: list[str]) -> dict[str, Optional[str]]:
+    """
+    Sync entry point for a batch of remote lookups: the aiohttp path when it
+    is installed and no event loop is running in this thread, otherwise
+    _read_remote_vault on a thread pool (still over reused connections).
+    """
+    if not names:
+        return {}
+    if _AIOHTTP_AVAILABLE:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_read_remote_vault_many(names))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(names), 8)) as pool:
+        return dict(zip(names, pool.map(_read_remote_vault, names)))
+
+
+# Idle keep-alive connections per (scheme, host, port).  Checked out for the
+# duration of one request, so concurrent lookups never share a socket.
+_http_idle: dict[tuple[str, str, Optional[int]], list[http.client.HTTPConnection]] = {}
+_http_lock = threading.Lock()
+
+
+def _remote_get(parts: urllib.parse.SplitResult, headers: dict) -> tuple[int, bytes]:
+    """
+    GET over a reused connection to the remote vault; returns (status, body).
+    A connection that fails (or that the server will close) is discarded; a
+    failed idle connection gets one retry on a fresh one.  Errors propagate
+    and the caller treats them like any other network failure.
+    """
+    key = (parts.scheme, parts.hostname or "", parts.port)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    with _http_lock:
+        idle = _http_idle.get(key)
+        conn = idle.pop() if idle else None
+
+    while True:
+        reused = conn is not None
+        if conn is None:
+            cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            # http.client already sets TCP_NODELAY on connect
+            conn = cls(key[1], key[2], timeout=5)
+        try:
+            conn.request("GET", path or "/", headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            conn = None    # idle socket went stale server-side: one fresh retry
+
+    if resp.will_close:
+        conn.close()
+    else:
+        with _http_lock:
+            _http_idle.setdefault(key, []).append(conn)
+    return resp.status, body
+
+
 # ─── Public API ───────────────────────────────────────────────────────────────
 
+@dataclass(slots=True, frozen=True)
 class VaultResult:
     """Result of a vault lookup with provenance information."""
 
-    def __init__(
-        self,
-        secret_name: str,
-        value: Optional[str],
-        source: str,          # "local_vault" | "cursor_config" | "remote_vault" | "not_found"
-    ):
-        self.secret_name = secret_name
-        self.value = value
-        self.source = source
-        self.found = value is not None
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+    secret_name: str
+    value: Optional[str]
+    source: str          # "local_vault" | "cursor_config" | "remote_vault" | "not_found"
+    # Creation time as a bare float; formatted only if .timestamp is read
+    _created: float = field(default_factory=time.time, repr=False, compare=False)
+
+    @property
+    def found(self) -> bool:
+        return self.value is not None
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 UTC time the lookup completed."""
+        return datetime.fromtimestamp(self._created, timezone.utc).isoformat()
 
     def __repr__(self) -> str:
         preview = f"{self.value[:4]}…" if self.value else "None"
         return f"VaultResult(secret={self.secret_name!r}, source={self.source!r}, value={preview})"
 
 
+# secret_name → (monotonic expiry, value, source).  Lets a diagnose pass and
+# the self-heal that follows it share one three-tier lookup per secret.
+_FETCH_CACHE_TTL = 1.0
+_fetch_cache: dict[str, tuple[float, Optional[str], str]] = {}
+
+
+# secret_name → Future of the lookup currently running for it
+_inflight: dict[str, concurrent.futures.Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _invalidate_fetch_cache(secret_name: Optional[str] = None) -> None:
+    """Forget one cached lookup, or all of them when secret_name is None."""
+    if secret_name is None:
+        _fetch_cache.clear()
+    else:
+        _fetch_cache.pop(secret_name, None)
+
+
 def fetch_secret(secret_name: str) -> VaultResult:
     """
     Attempt to retrieve a secret using the three-tier lookup:
@@ -191,74 +505,223 @@ def fetch_secret(secret_name: str) -> VaultResult:
       2. Cursor config files
       3. Remote WireGuard vault (if VPN is active)
 
+    Lookups are cached for _FETCH_CACHE_TTL seconds; every call still gets
+    its own VaultResult with a fresh timestamp.
+
     Returns a VaultResult — caller decides whether to escalate if not found.
     """
+    return fetch_secret_with_snapshot(secret_name, None)
+
+
+def fetch_secret_with_snapshot(
+    secret_name: str,
+    snapshot: Optional[_Snapshot],
+) -> VaultResult:
+    """
+    fetch_secret() using a _snapshot_config_dir() listing for the tier-1/2
+    existence checks.  For callers looking up several secrets in one pass.
+    """
+    now = time.monotonic()
+    cached = _fetch_cache.get(secret_name)
+    if cached is not None and cached[0] > now:
+        return VaultResult(secret_name, cached[1], cached[2])
+
+    # Single-flight: concurrent callers for the same secret wait on the one
+    # lookup already running instead of each repeating all three tiers
+    # (and the remote vault's timeout).
+    with _inflight_lock:
+        flight = _inflight.get(secret_name)
+        leader = flight is None
+        if leader:
+            flight = _inflight[secret_name] = concurrent.futures.Future()
+    if not leader:
+        return VaultResult(secret_name, *flight.result())
+
+    try:
+        value, source = _lookup_secret(secret_name, snapshot)
+        _fetch_cache[secret_name] = (now + _FETCH_CACHE_TTL, value, source)
+        flight.set_result((value, source))
+    except BaseException as exc:
+        flight.set_exception(exc)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[secret_name]
+    return VaultResult(secret_name, value, source)
+
+
+def fetch_secrets_bulk(
+    names,
+    _created: Optional[float] = None,
+    snapshot: Optional[_Snapshot] = None,
+) -> dict[str, VaultResult]:
+    """
+    fetch_secret() for several secrets at once.  Tiers 1–2 run per secret
+    against one directory snapshot; every secret they miss goes to the
+    remote vault in a single batch rather than one round-trip each.
+    Shares fetch_secret()'s cache.
+
+    _created stamps every result with one shared creation time (Unix
+    seconds) instead of a clock read per secret; snapshot reuses a caller's
+    _snapshot_config_dir()-style listing.
+    """
+    names = list(names)
+    now = time.monotonic()
+    found: dict[str, tuple[Optional[str], str]] = {}
+    misses: list[str] = []
+    if snapshot is None:
+        snapshot = _snapshot_config_dir()
+
+    for name in names:
+        cached = _fetch_cache.get(name)
+        if cached is not None and cached[0] > now:
+            found[name] = (cached[1], cached[2])
+            continue
+        value, source = _lookup_local(name, snapshot)
+        if value is None:
+            misses.append(name)
+        else:
+            found[name] = (value, source)
+            _fetch_cache[name] = (now + _FETCH_CACHE_TTL, value, source)
+
+    for name, value in _read_remote_vault_bulk(misses).items():
+        found[name] = (value, "remote_vault") if value else (None, "not_found")
+        _fetch_cache[name] = (now + _FETCH_CACHE_TTL, *found[name])
+
+    created = _created if _created is not None else time.time()
+    return {name: VaultResult(name, *found[name], created) for name in names}
+
+
+def _lookup_local(
+    secret_name: str,
+    snapshot: Optional[_Snapshot] = None,
+) -> tuple[Optional[str], str]:
+    """Tiers 1–2 only; returns (value, source), or (None, "not_found")."""
+    vault_names, cursor_names = snapshot if snapshot is not None else (None, None)
+
     # Tier 1: local vault directory
-    value = _read_local_vault_file(secret_name)
+    value = _read_local_vault_file(secret_name, vault_names)
     if value:
-        return VaultResult(secret_name, value, "local_vault")
+        return value, "local_vault"
 
     # Tier 2: cursor config files
-    value = _read_cursor_config(secret_name)
+    value = _read_cursor_config(secret_name, cursor_names)
+    if value:
+        return value, "cursor_config"
+
+    return None, "not_found"
+
+
+def _lookup_secret(
+    secret_name: str,
+    snapshot: Optional[_Snapshot] = None,
+) -> tuple[Optional[str], str]:
+    """Uncached three-tier lookup; returns (value, source)."""
+    value, source = _lookup_local(secret_name, snapshot)
     if value:
-        return VaultResult(secret_name, value, "cursor_config")
+        return value, source
 
     # Tier 3: WireGuard remote vault
     value = _read_remote_vault(secret_name)
     if value:
-        return VaultResult(secret_name, value, "remote_vault")
+        return value, "remote_vault"
 
-    return VaultResult(secret_name, None, "not_found")
+    return None, "not_found"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Replace `path` with `data` atomically: write a private (0600) temp file
+    in the same directory, fsync it, then os.replace() it over the target.
+    Readers see the old contents or the new, never a torn write.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+        _negative_cache.pop(os.fspath(path), None)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def write_secret_to_cursor_config(secret_name: str, value: str) -> bool:
     """
     Write a recovered secret back to the appropriate cursor config file.
     Used by the self-healing logic after a successful vault lookup.
+    Writes are atomic; JSON read-modify-writes hold an flock on a sidecar
+    .lock file so concurrent self-heals cannot drop each other's keys.
     Returns True if write succeeded.
     """
+    try:
+        _write_secret(secret_name, value)
+    finally:
+        # Whole cache: several secrets can share one config file (kaito-config)
+        _invalidate_fetch_cache()
+    return True
+
+
+def _write_secret(secret_name: str, value: str) -> None:
     mapping = _LOCAL_CONFIG_MAP.get(secret_name)
     if not mapping:
         # Write to generic local vault file
         VAULT_DIR.mkdir(parents=True, exist_ok=True)
-        (VAULT_DIR / secret_name).write_text(value)
-        return True
+        _atomic_write(VAULT_DIR / secret_name, value.encode())
+        return
 
     config_path, json_key = mapping
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     if json_key is None:
         # Plain text file
-        config_path.write_text(value)
-        return True
+        _atomic_write(config_path, value.encode())
+        return
 
-    # JSON file — update just the target key
-    try:
-        existing = json.loads(config_path.read_text()) if config_path.exists() else {}
-    except json.JSONDecodeError:
-        existing = {}
-    existing[json_key] = value
-    config_path.write_text(json.dumps(existing, indent=2))
-    return True
+    # JSON file — update just the target key.  The lock lives on a sidecar
+    # file because os.replace() swaps the target's inode on every write.
+    with open(f"{config_path}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            existing = _jloads(config_path.read_bytes())
+        except (FileNotFoundError, json.JSONDecodeError):
+            existing = {}
+        existing[json_key] = value
+        _atomic_write(config_path, _jdumps(existing))
 
 
 def diagnose_environment() -> dict:
     """
     Check all known secrets and return a health report.
     Used by the Security Agent to build the Fix Proposal context.
+
+    Secrets are fetched through fetch_secrets_bulk(), so every secret missing
+    locally costs one batched remote round rather than its own timeout.
     """
-    report: dict = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+    # One scandir of the vault dir answers "exists?", "remote.json present?"
+    # and every tier-1 lookup.
+    vault_exists, vault_names = _scan_dir(VAULT_DIR)
+    snapshot = (vault_names, _scan_dir(_CONFIG_DIR)[1])
+
+    now = time.time()
+    results = fetch_secrets_bulk(_SECRET_NAMES, _created=now, snapshot=snapshot)
+    return {
+        "timestamp": datetime.fromtimestamp(now, timezone.utc).isoformat(),
         "wireguard_active": is_wireguard_active(),
-        "vault_dir_exists": VAULT_DIR.exists(),
-        "remote_vault_configured": REMOTE_CONFIG.exists(),
-        "secrets": {},
+        "vault_dir_exists": vault_exists,
+        "remote_vault_configured": REMOTE_CONFIG.name in vault_names,
+        "secrets": {
+            name: {
+                "found": result.found,
+                "source": result.source,
+                "preview": f"{result.value[:4]}…" if result.value else None,
+            }
+            for name, result in results.items()
+        },
     }
-    for name in _LOCAL_CONFIG_MAP:
-        result = fetch_secret(name)
-        report["secrets"][name] = {
-            "found": result.found,
-            "source": result.source,
-            "preview": f"{result.value[:4]}…" if result.value else None,
-        }
-    return report
@@ -32,17 +32,26 @@ Environment variables (.env):
   LIVEKIT_API_SECRET  your_livekit_api_secret
   OPENAI_API_KEY      sk-...
   FORGE_API_URL       http://localhost:8765   (for live context snapshots)
+  DASHBOARD_UDP_PORT  optional — UDP fast path for camera/toggle events
+  DASHBOARD_UDP_HOST  127.0.0.1 (host running forge_api's UDP listener)
+  DASHBOARD_DATA_CHANNEL  1 = send camera/toggle events on the LiveKit data channel
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
 import json
 import logging
 import os
+import re
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
 
 import aiohttp
-import redis
+from redis import asyncio as aioredis
 from dotenv import load_dotenv
 from openai.types import realtime as rt
 
@@ -57,10 +66,28 @@ from livekit.agents import (
 )
 from livekit.plugins.openai import realtime as lk_realtime
 
+import aria_geom_nb
 from aria_voice_agent import ARIA_SYSTEM_PROMPT, check_safety, build_aria_prompt
 from shop_config import ShopConfig, shop_cfg as _default_shop_cfg
 from aria_graph import run_aria_graph
 
+# Optional: orjson for event payloads (several times faster than stdlib json);
+# redis-py accepts the bytes it returns directly.
+try:
+    import orjson as _orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+if _ORJSON_AVAILABLE:
+    _jloads = _orjson.loads
+    _jdumps = _orjson.dumps
+else:
+    _jloads = json.loads
+
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [ARIA] %(message)s")
@@ -81,6 +108,25 @@ MAX_ENDPOINTING_DELAY = 2.5   # maximum wait even if Chris keeps talking quietly
 # Redis channel — all mission control events flow through here
 REDIS_CHANNEL = "mission_control_events"
 
+# Optional UDP fast path for loss-tolerant viewport events. When set, forge_api
+# listens on this port and forwards datagrams straight to /ws/events, and the
+# Redis copy of those events moves to the audit channel so the dashboard
+# doesn't see them twice. 0 = disabled (everything goes through Redis).
+DASHBOARD_UDP_HOST  = os.getenv("DASHBOARD_UDP_HOST", "127.0.0.1")
+DASHBOARD_UDP_PORT  = int(os.getenv("DASHBOARD_UDP_PORT", "0"))
+REDIS_AUDIT_CHANNEL = "mission_control_audit"
+
+# Optional WebRTC path: viewport events are published on the LiveKit room's
+# data channel (lossy, topic "dashboard") for any participant listening via
+# room.on('dataReceived'). Takes precedence over UDP; Redis keeps the audit
+# copy. Off by default — the React dashboard currently has no LiveKit client
+# and still reads /ws/events.
+DASHBOARD_DATA_CHANNEL = os.getenv("DASHBOARD_DATA_CHANNEL", "") == "1"
+DASHBOARD_DATA_TOPIC   = "dashboard"
+
+# Loss-tolerant events eligible for the UDP / data-channel fast paths
+_VIEWPORT_EVENT_TYPES = frozenset({"CAMERA_MOVE", "TOGGLE_GROUP"})
+
 # ── Camera view presets (mm, in ForgeViewer coordinate space) ─────────────────
 #
 # Machine: Howell_Forge_Main_CNC — 500×400×400mm
@@ -120,54 +166,363 @@ CAMERA_VIEWS: dict[str, dict] = {
     },
 }
 
+# CAMERA_VIEWS is fixed, so each preset's wire message and spoken confirmation
+# are built once here rather than on every set_dashboard_view call.
+_CAMERA_PAYLOADS: Mapping[str, bytes] = MappingProxyType({
+    key: _jdumps({"type": "CAMERA_MOVE", "payload": view})
+    for key, view in CAMERA_VIEWS.items()
+})
+
+_CAMERA_PHRASES: Mapping[str, str] = MappingProxyType({
+    "top":            "Switching to top-down — you can see the full table layout.",
+    "side":           "Side view — good for checking Z-height and stock thickness.",
+    "front":          "Front view — straight-on look at the Y-axis face.",
+    "perspective":    "Back to isometric perspective.",
+    "collision_zoom": "Zooming in on the work zone — watch the clamp clearance.",
+})
+
+_VIEW_LIST_STR = ", ".join(CAMERA_VIEWS)
+
+# Viewport groups toggle_fixture_visibility accepts, with their spoken labels.
+_GROUP_LABELS: Mapping[str, str] = MappingProxyType({
+    "workholding": "clamps and vises",
+    "safezones":   "collision boundary zones",
+    "environment": "the machine table",
+    "part":        "the part model",
+})
+_VALID_GROUPS   = frozenset(_GROUP_LABELS)
+_GROUP_LIST_STR = ", ".join(sorted(_VALID_GROUPS))
+
+
+# ── Redis publisher (async, batched — runs on the event loop) ────────────────
+#
+# One redis.asyncio client for the whole worker, created in entrypoint (or on
+# first publish). redis-py connects lazily, so the worker still starts when
+# Redis is down; a dead server only costs the failed publish.
 
-# ── Redis publisher (sync — runs in a thread from async context) ──────────────
+_AIOREDIS: aioredis.Redis | None = None
 
-def _redis_publish(event_type: str, payload: dict) -> None:
-    """Fire-and-forget Redis publish. Fails gracefully if Redis is down."""
-    try:
-        r = redis.Redis(host="localhost", port=6379, db=0, socket_timeout=1)
-        r.publish(REDIS_CHANNEL, json.dumps({"type": event_type, "payload": payload}))
-        logger.debug("Published %s → %s", event_type, payload)
-    except Exception as exc:
-        logger.warning("Redis publish failed (%s): %s", event_type, exc)
+
+def _get_aioredis() -> aioredis.Redis:
+    """Return the shared async Redis client, creating it on first use."""
+    global _AIOREDIS
+    if _AIOREDIS is None:
+        _AIOREDIS = aioredis.Redis(
+            host="localhost", port=6379, db=0,
+            socket_timeout=1, max_connections=4,
+        )
+    return _AIOREDIS
+
+
+# Strong references to fire-and-forget tasks. The event loop only keeps weak
+# references, so an unreferenced task can be garbage-collected mid-flight.
+_BG_TASKS: set[asyncio.Task] = set()
+
+
+def _log_task_exception(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background task %s failed: %s", task.get_name(), task.exception())
+
+
+def _spawn(coro, name: str) -> asyncio.Task:
+    """Schedule a side-effect coroutine without awaiting it."""
+    task = asyncio.create_task(coro, name=name)
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+    task.add_done_callback(_log_task_exception)
+    return task
+
+
+class _PublishBatcher:
+    """
+    Coalesces dashboard events into pipelined PUBLISH bursts.
+
+    Tools queue events via _send_dashboard() and return immediately. A
+    background task wakes on the first event, yields one loop tick so every
+    coroutine ready in that tick can enqueue too, then sends up to MAX_BATCH
+    events in one non-transactional pipeline. Events that arrive while a flush
+    is on the wire ride the next one, so bursts coalesce automatically with no
+    timer and no added latency for a lone event.
+    """
+
+    MAX_BATCH = 32
+
+    _STOP = object()
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue | None = None
+        self._task:  asyncio.Task  | None = None
+
+    def start(self) -> None:
+        """Start the drain task on the running loop (no-op if already running)."""
+        if self._task is None or self._task.done():
+            if self._queue is None:
+                self._queue = asyncio.Queue()
+            self._task = _spawn(self._run(), "aria-publish-batcher")
+
+    def submit_raw(self, message: bytes, channel: str = REDIS_CHANNEL) -> None:
+        """Queue an already-serialised {"type", "payload"} message. Never blocks."""
+        self.start()
+        self._queue.put_nowait((channel, message))
+        logger.debug("Queued %s → %s", message, channel)
+
+    async def stop(self) -> None:
+        """Flush whatever is still queued, then end the drain task."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(self._STOP)
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            first = await self._queue.get()
+            if first is self._STOP:
+                return
+            await asyncio.sleep(0)
+            batch    = [first]
+            stopping = False
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    msg = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if msg is self._STOP:
+                    stopping = True
+                    break
+                batch.append(msg)
+            await self._flush(batch)
+            if stopping:
+                return
+
+    @staticmethod
+    async def _flush(batch: list[tuple[str, bytes]]) -> None:
+        try:
+            async with _get_aioredis().pipeline(transaction=False) as pipe:
+                for channel, msg in batch:
+                    pipe.publish(channel, msg)
+                await pipe.execute()
+        except Exception as exc:
+            logger.warning("Redis publish failed (%d event(s)): %s", len(batch), exc)
+
+
+_batcher = _PublishBatcher()
+
+
+class _DashboardUDP:
+    """Connected UDP socket to forge_api's viewport-event listener."""
+
+    def __init__(self) -> None:
+        self._transport: asyncio.DatagramTransport | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._transport is not None and not self._transport.is_closing()
+
+    async def start(self, host: str, port: int) -> None:
+        """
+        Open the socket. Never raises: the fast path is optional, so a host
+        that does not resolve or a refused connect logs and leaves it off,
+        and viewport events go out on Redis instead.
+        """
+        if port and not self.active:
+            loop = asyncio.get_running_loop()
+            try:
+                self._transport, _ = await loop.create_datagram_endpoint(
+                    asyncio.DatagramProtocol, remote_addr=(host, port),
+                )
+            except OSError as exc:   # includes socket.gaierror
+                logger.warning(
+                    "Dashboard UDP %s:%d unavailable, using Redis: %s", host, port, exc,
+                )
+
+    def send(self, message: bytes) -> None:
+        self._transport.sendto(message)
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+_udp = _DashboardUDP()
+
+
+class _DashboardDataChannel:
+    """Publishes viewport events on the job's LiveKit room data channel."""
+
+    def __init__(self) -> None:
+        self._participant = None
+
+    @property
+    def active(self) -> bool:
+        return self._participant is not None
+
+    def attach(self, room) -> None:
+        self._participant = room.local_participant
+
+    def send(self, message: bytes) -> None:
+        _spawn(
+            self._participant.publish_data(
+                message, reliable=False, topic=DASHBOARD_DATA_TOPIC,
+            ),
+            "aria-datachannel-publish",
+        )
+
+    def close(self) -> None:
+        self._participant = None
+
+
+_datachannel = _DashboardDataChannel()
+
+
+def _send_dashboard_raw(event_type: str, message: bytes) -> None:
+    """
+    Route a serialised dashboard event. Viewport events take the WebRTC data
+    channel or the UDP fast path when one is up (Redis keeps an audit copy);
+    everything else, and everything when both are off, goes out on the Redis
+    event channel.
+    """
+    if event_type in _VIEWPORT_EVENT_TYPES:
+        if _datachannel.active:
+            _datachannel.send(message)
+            _batcher.submit_raw(message, REDIS_AUDIT_CHANNEL)
+            return
+        if _udp.active:
+            try:
+                _udp.send(message)
+            except OSError as exc:
+                logger.debug("UDP send failed (%s), using Redis: %s", event_type, exc)
+            else:
+                _batcher.submit_raw(message, REDIS_AUDIT_CHANNEL)
+                return
+    _batcher.submit_raw(message)
+
+
+def _send_dashboard(event_type: str, payload: dict) -> None:
+    """Serialise and route one dashboard event. Never blocks."""
+    _send_dashboard_raw(event_type, _jdumps({"type": event_type, "payload": payload}))
 
 
 # ── Live Forge Context ────────────────────────────────────────────────────────
 
+# The job's long-lived HTTP session, set in entrypoint so module-level tools
+# (which LiveKit calls without an agent handle) reuse its keep-alive pool.
+_HTTP_SESSION: contextvars.ContextVar[aiohttp.ClientSession | None] = (
+    contextvars.ContextVar("aria_http_session", default=None)
+)
+
+
+def _new_http_session() -> aiohttp.ClientSession:
+    """Build the per-job ClientSession with connection reuse enabled."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=30),
+    )
+
+
 async def _fetch_forge_context(session: aiohttp.ClientSession) -> dict:
     """Pull a live snapshot from the Forge Context Provider API."""
     try:
         async with session.get(f"{FORGE_API_URL}/context", timeout=aiohttp.ClientTimeout(total=3)) as r:
             if r.status == 200:
-                return await r.json()
+                return await r.json(loads=_jloads)
     except Exception as exc:
         logger.warning("Context fetch failed: %s", exc)
     return {}
 
 
-def _build_system_prompt(ctx: dict, shop: ShopConfig) -> str:
+# ShopConfig.reload() stats machine_config.json on every call, and a single
+# turn reaches it from the prompt builder, the turn hook and any fixture tools.
+# One check per window is plenty for a file edited by hand.
+_RELOAD_DEBOUNCE   = 0.5   # seconds
+_last_reload_check = 0.0
+
+
+def _maybe_reload(shop: ShopConfig) -> None:
+    """shop.reload(), at most once per _RELOAD_DEBOUNCE seconds."""
+    global _last_reload_check
+    now = time.monotonic()
+    if now - _last_reload_check < _RELOAD_DEBOUNCE:
+        return
+    _last_reload_check = now
+    shop.reload()
+
+
+# ARIA_SYSTEM_PROMPT never changes at runtime; only the context block is rebuilt.
+_PROMPT_PREFIX = ARIA_SYSTEM_PROMPT + "\n"
+
+
+def _prompt_fields(ctx: dict) -> tuple:
     """
-    Inject the live Forge Context + live machine_config fixture layout
-    into ARIA's system prompt. Called at session start and refreshed each turn.
+    The Forge Context values the prompt actually renders, in a fixed order.
+    Doubles as the cache key for skipping unchanged prompt refreshes.
     """
-    shop.reload()   # hot-reload if machine_config.json changed on disk
-
     bf      = ctx.get("biofeedback",  {})
     fin     = ctx.get("finances",     {})
     ords    = ctx.get("orders",       {})
     ts      = ctx.get("timestamp",    "")
 
-    score   = bf.get("score",  "?")
-    health  = bf.get("health", "?")
-    total   = ords.get("total", 0)
-    paid    = ords.get("paid_count", 0)
-    prod    = ords.get("in_production_count", 0)
-    usdc    = fin.get("usdc")
-    matic   = fin.get("matic")
+    return (
+        ts[11:19] if len(ts) > 19 else "--:--:--",
+        bf.get("score",  "?"),
+        bf.get("health", "?"),
+        ords.get("total", 0),
+        ords.get("paid_count", 0),
+        ords.get("in_production_count", 0),
+        fin.get("usdc"),
+        fin.get("matic"),
+    )
+
+
+def _prompt_key(ctx: dict, shop: ShopConfig) -> tuple:
+    """Cache key for _build_system_prompt: rendered context + config mtime."""
+    return (*_prompt_fields(ctx), shop._mtime)
+
+
+# ── Context push cache ────────────────────────────────────────────────────────
+#
+# forge_api publishes a fresh snapshot on forge_context_updates whenever the
+# context changes (and at least every 10s). The subscriber keeps the agent's
+# _forge_ctx hot so a turn never waits on an HTTP round-trip; the /context GET
+# is only used at cold start or when pushes have gone quiet.
+
+CONTEXT_CHANNEL     = "forge_context_updates"
+_CONTEXT_PUSH_STALE = 30.0   # seconds without a push before falling back to HTTP
+
+
+async def _context_subscriber(agent: "_SafetyInterruptAgent") -> None:
+    """Mirror forge_context_updates into agent._forge_ctx until cancelled."""
+    while True:
+        pubsub = _get_aioredis().pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(CONTEXT_CHANNEL)
+            async for msg in pubsub.listen():
+                try:
+                    agent._forge_ctx = _jloads(msg["data"])
+                except (TypeError, ValueError):
+                    continue
+                agent._ctx_pushed_at = time.monotonic()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Context subscriber dropped, retrying: %s", exc)
+        finally:
+            await pubsub.reset()
+        await asyncio.sleep(2)
+
+
+def _build_system_prompt(ctx: dict, shop: ShopConfig) -> str:
+    """
+    Inject the live Forge Context + live machine_config fixture layout
+    into ARIA's system prompt. Called at session start and refreshed each turn.
+    """
+    _maybe_reload(shop)   # hot-reload if machine_config.json changed on disk
+
+    ts_str, score, health, total, paid, prod, usdc, matic = _prompt_fields(ctx)
 
     fin_str = f"USDC ${usdc:.2f} | MATIC {matic}" if usdc is not None else "wallet not configured"
-    ts_str  = ts[11:19] if len(ts) > 19 else "--:--:--"
 
     context_block = f"""\
 ━━━ LIVE FORGE CONTEXT [{ts_str} UTC] ━━━
@@ -179,7 +534,7 @@ Orders:       {total} total | {paid} PAID | {prod} in production
 Finances:     {fin_str}
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-    return f"{ARIA_SYSTEM_PROMPT}\n{context_block}"
+    return _PROMPT_PREFIX + context_block
 
 
 # ── ARIA Tool Definitions ─────────────────────────────────────────────────────
@@ -201,10 +556,10 @@ async def lookup_fixture(name: str) -> str:
     Args:
         name: Natural-language fixture name (e.g. 'the vise', 'toe clamp', 'vise_01').
     """
-    _default_shop_cfg.reload()
+    _maybe_reload(_default_shop_cfg)
 
-    # Try active fixture ID first (e.g. "vise_01")
-    by_id = _default_shop_cfg.get_active_fixture_by_id(name)
+    # Placed fixture by id, library key or alias (e.g. "vise_01", "the vise")
+    by_id = _default_shop_cfg.find_active_fixture(name)
     if by_id and by_id.definition:
         d   = by_id.definition
         nfz = by_id.no_fly_zone
@@ -233,7 +588,7 @@ async def lookup_fixture(name: str) -> str:
 )
 async def list_active_fixtures() -> str:
     """Return all active fixtures from the current machine_config.json layout."""
-    _default_shop_cfg.reload()
+    _maybe_reload(_default_shop_cfg)
     layout = _default_shop_cfg.describe_active_layout()
     envelope = _default_shop_cfg.envelope_summary()
     count = len([f for f in _default_shop_cfg.active if f.status == "active"])
@@ -261,23 +616,14 @@ async def set_dashboard_view(view_name: str) -> str:
         view_name: One of 'top', 'side', 'front', 'perspective', 'collision_zoom'.
     """
     key = view_name.strip().lower()
-    view = CAMERA_VIEWS.get(key)
-    if not view:
-        available = ", ".join(CAMERA_VIEWS.keys())
+    if key not in CAMERA_VIEWS:
         return (
             f"I don't have a preset for '{view_name}'. "
-            f"Available views: {available}. Which one do you want?"
+            f"Available views: {_VIEW_LIST_STR}. Which one do you want?"
         )
 
-    await asyncio.to_thread(_redis_publish, "CAMERA_MOVE", view)
-    phrases = {
-        "top":            "Switching to top-down — you can see the full table layout.",
-        "side":           "Side view — good for checking Z-height and stock thickness.",
-        "front":          "Front view — straight-on look at the Y-axis face.",
-        "perspective":    "Back to isometric perspective.",
-        "collision_zoom": "Zooming in on the work zone — watch the clamp clearance.",
-    }
-    return phrases.get(key, f"Switching to {view_name} view.")
+    _send_dashboard_raw("CAMERA_MOVE", _CAMERA_PAYLOADS[key])
+    return _CAMERA_PHRASES[key]
 
 
 @llm.function_tool(
@@ -297,24 +643,13 @@ async def toggle_fixture_visibility(group: str, visible: bool) -> str:
         group:   One of 'workholding', 'safezones', 'environment', 'part'.
         visible: True to show, False to hide.
     """
-    valid = {"workholding", "safezones", "environment", "part"}
-    key   = group.strip().lower()
-    if key not in valid:
-        return f"'{group}' isn't a valid group. Try: {', '.join(sorted(valid))}."
-
-    await asyncio.to_thread(
-        _redis_publish,
-        "TOGGLE_GROUP",
-        {"group": key, "visible": visible},
-    )
-    action = "showing" if visible else "hiding"
-    labels = {
-        "workholding": "clamps and vises",
-        "safezones":   "collision boundary zones",
-        "environment": "the machine table",
-        "part":        "the part model",
-    }
-    return f"{action.capitalize()} {labels.get(key, key)} on the dashboard."
+    key = group.strip().lower()
+    if key not in _VALID_GROUPS:
+        return f"'{group}' isn't a valid group. Try: {_GROUP_LIST_STR}."
+
+    _send_dashboard("TOGGLE_GROUP", {"group": key, "visible": visible})
+    action = "Showing" if visible else "Hiding"
+    return f"{action} {_GROUP_LABELS[key]} on the dashboard."
 
 
 @llm.function_tool(
@@ -324,10 +659,12 @@ async def toggle_fixture_visibility(group: str, visible: bool) -> str:
 async def get_forge_status_tool() -> str:
     """Returns a human-readable forge status summary for ARIA to speak aloud."""
     try:
-        async with aiohttp.ClientSession() as s:
+        shared = _HTTP_SESSION.get()
+        async with contextlib.AsyncExitStack() as stack:
+            s = shared or await stack.enter_async_context(aiohttp.ClientSession())
             async with s.get(f"{FORGE_API_URL}/context", timeout=aiohttp.ClientTimeout(total=3)) as r:
                 if r.status == 200:
-                    ctx     = await r.json()
+                    ctx     = await r.json(loads=_jloads)
                     machine = ctx.get("forge_status", {}).get("status", "IDLE")
                     score   = ctx.get("biofeedback",  {}).get("score",  "?")
                     health  = ctx.get("biofeedback",  {}).get("health", "?")
@@ -348,6 +685,26 @@ async def get_forge_status_tool() -> str:
 
 # ── Safety Interrupt Handler ──────────────────────────────────────────────────
 
+# Back-channel replies that never carry a design change. Anything this matches
+# (or any digit-free utterance under three words) skips the LangGraph chain and
+# only gets the single-shot SafetyAgent pass.
+_TRIVIAL_RX = re.compile(
+    r"^\s*(yes|yeah|yep|no|nope|ok|okay|hm+|mm+|right|sure|got it|thanks|thank you|cool)"
+    r"\s*[.!?]?\s*$",
+    re.I,
+)
+
+
+# How long a turn waits for the SafetyAgent to pre-empt the LangGraph run.
+_HEDGE_WINDOW = 0.4   # seconds
+
+
+def _is_trivial_transcript(transcript: str) -> bool:
+    if _TRIVIAL_RX.match(transcript):
+        return True
+    return len(transcript.split()) < 3 and not any(c.isdigit() for c in transcript)
+
+
 class _SafetyInterruptAgent(Agent):
     """
     ARIA agent with a built-in safety interrupt loop.
@@ -385,9 +742,137 @@ class _SafetyInterruptAgent(Agent):
                 get_forge_status_tool,
             ],
         )
-        self._forge_ctx    = forge_ctx
-        self._http_session = http_session
-        self._shop         = shop
+        self._forge_ctx       = forge_ctx
+        self._http_session    = http_session
+        self._shop            = shop
+        self._last_prompt_key = _prompt_key(forge_ctx, shop)
+        self._ctx_pushed_at   = float("-inf")   # set by _context_subscriber
+
+    def _inject_safety_override(self, turn_ctx, transcript: str) -> None:
+        """Run the single-shot SafetyAgent and inject its override, if any."""
+        result = check_safety(transcript, self._forge_ctx, shop_config=self._shop)
+        self._inject_safety_result(turn_ctx, result)
+
+    @staticmethod
+    def _inject_safety_result(turn_ctx, result: dict) -> bool:
+        """Inject a SafetyAgent override message. Returns True if it interrupted."""
+        if not result.get("interrupt"):
+            return False
+        message = result.get("message", "Interrupting, Chris.")
+        turn_ctx.add_item(role="assistant", content=message)
+        return True
+
+    async def _hedged_reasoning(self, turn_ctx, transcript: str) -> None:
+        """
+        Race the LangGraph loop against the single-shot SafetyAgent.
+
+        The SafetyAgent usually answers in milliseconds. If it calls for an
+        interrupt within _HEDGE_WINDOW, ARIA speaks that override at once and
+        the graph is cancelled. Otherwise the graph result is used as before,
+        and the already-computed safety verdict is the fallback if it fails.
+        """
+        # session_id = room name → per-room checkpoint memory.
+        graph_fut = asyncio.create_task(run_aria_graph(
+            user_message = transcript,
+            forge_ctx    = self._forge_ctx,
+            shop         = self._shop,
+            session_id   = getattr(self, "_room_name", "default"),
+        ))
+        safety_fut = asyncio.create_task(asyncio.to_thread(
+            check_safety, transcript, self._forge_ctx, shop_config=self._shop,
+        ))
+        await asyncio.wait(
+            {graph_fut, safety_fut},
+            timeout=_HEDGE_WINDOW,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+        if (safety_fut.done() and safety_fut.exception() is None
+                and safety_fut.result().get("interrupt")):
+            graph_fut.cancel()
+            logger.info("[SAFETY] Interrupt beat the graph — cancelling LangGraph run")
+            self._inject_safety_result(turn_ctx, safety_fut.result())
+            return
+
+        try:
+            graph_result = await graph_fut
+        except Exception as exc:
+            logger.warning("LangGraph run failed, falling back to direct safety check: %s", exc)
+            # Fallback to single-shot safety check if graph errors
+            try:
+                self._inject_safety_result(turn_ctx, await safety_fut)
+            except Exception as safety_exc:
+                logger.warning("Safety check failed: %s", safety_exc)
+            return
+        finally:
+            if not safety_fut.done():
+                safety_fut.cancel()
+
+        self._apply_graph_result(turn_ctx, graph_result)
+
+    def _apply_graph_result(self, turn_ctx, graph_result: dict) -> None:
+        """Log the graph outcome, inject its response and fire side-effects."""
+        # ForgeState field names (5 sections)
+        iters     = graph_result.get("iteration",          0)
+        action    = graph_result.get("action_type",        "none")
+        response  = graph_result.get("response",           "")
+        is_valid  = graph_result.get("is_geometry_valid",  True)
+        notes     = graph_result.get("revision_notes",     [])
+        dims      = graph_result.get("current_dimensions", {})
+        fixtures  = graph_result.get("active_fixtures",    [])
+        kaito     = graph_result.get("kaito_status",       "UNKNOWN")
+        cost      = graph_result.get("estimated_cost",     0.0)
+        cad       = graph_result.get("active_cad_path",    "")
+        category  = graph_result.get("safety_category",    "SAFE")
+
+        logger.info(
+            "[GRAPH] valid=%s iters=%d action=%s kaito=%s cost=$%.2f fixtures=%s",
+            is_valid, iters, action, kaito, cost, fixtures,
+        )
+        if cad:
+            logger.info("[GRAPH] CAD: %s", cad)
+
+        # ── Revised or aborted → inject ARIA's graph response ─────────────────────
+        # On a safe first pass (iters=0), let the Realtime model respond
+        # naturally — the graph was just a safety check, no injection needed.
+        if iters > 0 or action == "abort":
+            if response:
+                logger.info("[GRAPH] Injecting: %s", response[:80])
+                turn_ctx.add_item(role="assistant", content=response)
+
+        # ── Camera move side-effect ───────────────────────────────────────────────
+        if action == "camera_move":
+            move_x = dims.get("move_x")
+            move_y = dims.get("move_y")
+            move_z = dims.get("move_z")
+            if move_x is not None:
+                target = {
+                    "position": [move_x, 80.0, move_z or 200.0],
+                    "target":   [move_x, 0.0,  move_z or 200.0],
+                }
+                _send_dashboard("CAMERA_MOVE", target)
+            elif move_y is not None:
+                target = {
+                    "position": [250.0,  80.0, move_y],
+                    "target":   [250.0,   0.0, move_y],
+                }
+                _send_dashboard("CAMERA_MOVE", target)
+
+    async def _refresh_prompt(self) -> None:
+        """
+        Refresh system prompt with latest context + fixture layout —
+        skipped when nothing the prompt renders has changed since last turn.
+        """
+        try:
+            _maybe_reload(self._shop)
+            key = _prompt_key(self._forge_ctx, self._shop)
+            if key != self._last_prompt_key:
+                await self.update_instructions(
+                    _build_system_prompt(self._forge_ctx, self._shop)
+                )
+                self._last_prompt_key = key
+        except Exception as exc:
+            logger.debug("Prompt refresh skipped: %s", exc)
 
     async def on_user_turn_completed(
         self,
@@ -405,94 +890,31 @@ class _SafetyInterruptAgent(Agent):
         If the path was safe on the first pass, the graph is a no-op and
         ARIA responds naturally via the Realtime model.
         """
-        transcript = ""
-        for item in new_message.items:
-            if hasattr(item, "text"):
-                transcript += item.text or ""
+        transcript = "".join(getattr(item, "text", None) or "" for item in new_message.items)
 
         if transcript:
-            # Refresh forge context and hot-reload shop config
-            try:
-                self._forge_ctx = await _fetch_forge_context(self._http_session)
-            except Exception:
-                pass
-            self._shop.reload()
-
-            try:
-                # Run the stateful LangGraph reasoning loop.
-                # session_id = room name → per-room checkpoint memory.
-                graph_result = await run_aria_graph(
-                    user_message = transcript,
-                    forge_ctx    = self._forge_ctx,
-                    shop         = self._shop,
-                    session_id   = getattr(self, "_room_name", "default"),
-                )
+            # Refresh forge context (only if the push cache has gone stale)
+            # and hot-reload shop config
+            if time.monotonic() - self._ctx_pushed_at > _CONTEXT_PUSH_STALE:
+                try:
+                    self._forge_ctx = await _fetch_forge_context(self._http_session)
+                except Exception:
+                    pass
+            _maybe_reload(self._shop)
+
+        # The prompt refresh depends only on the context and shop config, not
+        # on the graph's output, so it runs alongside the reasoning below.
+        prompt_task = asyncio.create_task(self._refresh_prompt())
 
-                # ForgeState field names (5 sections)
-                iters     = graph_result.get("iteration",          0)
-                action    = graph_result.get("action_type",        "none")
-                response  = graph_result.get("response",           "")
-                is_valid  = graph_result.get("is_geometry_valid",  True)
-                notes     = graph_result.get("revision_notes",     [])
-                dims      = graph_result.get("current_dimensions", {})
-                fixtures  = graph_result.get("active_fixtures",    [])
-                kaito     = graph_result.get("kaito_status",       "UNKNOWN")
-                cost      = graph_result.get("estimated_cost",     0.0)
-                cad       = graph_result.get("active_cad_path",    "")
-                category  = graph_result.get("safety_category",    "SAFE")
+        if transcript:
+            if _is_trivial_transcript(transcript):
+                # Acknowledgements can't describe a move — the single-shot
+                # SafetyAgent is enough, so skip the LangGraph chain.
+                self._inject_safety_override(turn_ctx, transcript)
+            else:
+                await self._hedged_reasoning(turn_ctx, transcript)
 
-                logger.info(
-                    "[GRAPH] valid=%s iters=%d action=%s kaito=%s cost=$%.2f fixtures=%s",
-                    is_valid, iters, action, kaito, cost, fixtures,
-                )
-                if cad:
-                    logger.info("[GRAPH] CAD: %s", cad)
-
-                # ── Revised or aborted → inject ARIA's graph response ─────────
-                # On a safe first pass (iters=0), let the Realtime model respond
-                # naturally — the graph was just a safety check, no injection needed.
-                if iters > 0 or action == "abort":
-                    if response:
-                        logger.info("[GRAPH] Injecting: %s", response[:80])
-                        turn_ctx.add_item(role="assistant", content=response)
-
-                # ── Camera move side-effect ───────────────────────────────────
-                if action == "camera_move":
-                    move_x = dims.get("move_x")
-                    move_y = dims.get("move_y")
-                    move_z = dims.get("move_z")
-                    if move_x is not None:
-                        target = {
-                            "position": [move_x, 80.0, move_z or 200.0],
-                            "target":   [move_x, 0.0,  move_z or 200.0],
-                        }
-                        await asyncio.to_thread(
-                            _redis_publish, "CAMERA_MOVE", target
-                        )
-                    elif move_y is not None:
-                        target = {
-                            "position": [250.0,  80.0, move_y],
-                            "target":   [250.0,   0.0, move_y],
-                        }
-                        await asyncio.to_thread(
-                            _redis_publish, "CAMERA_MOVE", target
-                        )
-
-            except Exception as exc:
-                logger.warning("LangGraph run failed, falling back to direct safety check: %s", exc)
-                # Fallback to single-shot safety check if graph errors
-                result = check_safety(transcript, self._forge_ctx, shop_config=self._shop)
-                if result.get("interrupt"):
-                    message = result.get("message", "Interrupting, Chris.")
-                    turn_ctx.add_item(role="assistant", content=message)
-
-        # Refresh system prompt with latest context + fixture layout
-        try:
-            await self.update_instructions(
-                _build_system_prompt(self._forge_ctx, self._shop)
-            )
-        except Exception as exc:
-            logger.debug("Prompt refresh skipped: %s", exc)
+        await prompt_task
 
 
 # ── Job Entry Point ───────────────────────────────────────────────────────────
@@ -504,9 +926,11 @@ async def entrypoint(ctx: JobContext):
     """
     logger.info("ARIA voice agent starting for room: %s", ctx.room.name)
 
-    await ctx.connect()
+    _get_aioredis()   # build the shared publisher on this job's event loop
+    _batcher.start()
 
-    async with aiohttp.ClientSession() as http_session:
+    async with _new_http_session() as http_session:
+        _HTTP_SESSION.set(http_session)
         # ── Load shop config (read-only from machine_config.json) ────────────
         shop = _default_shop_cfg
         shop.reload()
@@ -524,8 +948,20 @@ async def entrypoint(ctx: JobContext):
                     f.id, nfz["x_min"], nfz["x_max"], nfz["z_min"], nfz["z_max"],
                 )
 
-        # ── Pull initial forge context ────────────────────────────────────────
-        forge_ctx = await _fetch_forge_context(http_session)
+        # ── Join room + warm up, concurrently ─────────────────────────────────
+        # The Realtime plugin dials OpenAI inside session.start(), so the way
+        # to have that socket up before Chris speaks is to reach session.start()
+        # sooner. Room join, kernel compile / cache-load, the initial forge
+        # context pull and the UDP socket don't depend on each other. The UDP
+        # leg cannot fail the gather — _udp.start() falls back to Redis itself.
+        _, _, forge_ctx, _ = await asyncio.gather(
+            ctx.connect(),
+            asyncio.to_thread(aria_geom_nb.warmup),
+            _fetch_forge_context(http_session),
+            _udp.start(DASHBOARD_UDP_HOST, DASHBOARD_UDP_PORT),
+        )
+        if DASHBOARD_DATA_CHANNEL:
+            _datachannel.attach(ctx.room)   # room is joined — data channel is up
         logger.info(
             "Forge context: machine=%s | biofeedback=%s | orders=%s",
             forge_ctx.get("forge_status", {}).get("status", "?"),
@@ -535,6 +971,7 @@ async def entrypoint(ctx: JobContext):
 
         agent = _SafetyInterruptAgent(forge_ctx, http_session, shop)
         agent._room_name = ctx.room.name   # used as LangGraph session_id
+        subscriber = _spawn(_context_subscriber(agent), "aria-context-subscriber")
         session = AgentSession(
             # Let ARIA interrupt if someone speaks over her
             allow_interruptions=True,
@@ -559,7 +996,13 @@ async def entrypoint(ctx: JobContext):
         logger.info("ARIA is live in room '%s'. Listening.", ctx.room.name)
 
         # Keep running until the room empties or process is killed
-        await session.wait()
+        try:
+            await session.wait()
+        finally:
+            subscriber.cancel()
+            _datachannel.close()
+            _udp.close()
+            await _batcher.stop()
 
     logger.info("ARIA session ended for room: %s", ctx.room.name)
 